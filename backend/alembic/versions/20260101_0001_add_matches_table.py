@@ -0,0 +1,75 @@
+"""Add pre-calculated matches table
+
+Revision ID: 3f9c2a7d1b4e
+Revises:
+Create Date: 2026-01-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2a7d1b4e'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCORE_COLUMNS = [
+    'cert_score',
+    'experience_score',
+    'availability_score',
+    'location_score',
+    'culture_score',
+    'engagement_score',
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'matches',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('coach_id', sa.Integer(), nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('brand_id', sa.Integer(), nullable=False),
+        sa.Column('role_match', sa.Boolean(), nullable=False),
+        sa.Column('preset', sa.String(length=50), nullable=False),
+        sa.Column('fitscore', sa.Numeric(precision=5, scale=3), nullable=False),
+        *[
+            sa.Column(name, sa.Numeric(precision=5, scale=3), nullable=False)
+            for name in SCORE_COLUMNS
+        ],
+        sa.Column('computed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['coach_id'], ['coaches.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['brand_id'], ['brands.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('coach_id', 'job_id', name='uq_matches_coach_job'),
+    )
+    op.create_index(op.f('ix_matches_id'), 'matches', ['id'], unique=False)
+    op.create_index(op.f('ix_matches_brand_id'), 'matches', ['brand_id'], unique=False)
+    op.create_index(
+        'ix_matches_job_rank',
+        'matches',
+        ['job_id', sa.text('fitscore DESC'), 'coach_id'],
+        unique=False,
+        postgresql_include=SCORE_COLUMNS,
+        postgresql_where=sa.text('role_match'),
+    )
+    op.create_index(
+        'ix_matches_coach_rank',
+        'matches',
+        ['coach_id', sa.text('fitscore DESC'), 'job_id'],
+        unique=False,
+        postgresql_include=SCORE_COLUMNS,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_matches_coach_rank', table_name='matches')
+    op.drop_index('ix_matches_job_rank', table_name='matches')
+    op.drop_index(op.f('ix_matches_brand_id'), table_name='matches')
+    op.drop_index(op.f('ix_matches_id'), table_name='matches')
+    op.drop_table('matches')
@@ -0,0 +1,51 @@
+"""Store unrounded match sub-scores
+
+Revision ID: 8b1e4d6c2a90
+Revises: 3f9c2a7d1b4e
+Create Date: 2026-01-02 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8b1e4d6c2a90'
+down_revision: Union[str, None] = '3f9c2a7d1b4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCORE_COLUMNS = [
+    'cert_score',
+    'experience_score',
+    'availability_score',
+    'location_score',
+    'culture_score',
+    'engagement_score',
+]
+
+
+def upgrade() -> None:
+    # Existing rows keep their rounded values until next re-scored
+    for name in SCORE_COLUMNS:
+        op.alter_column(
+            'matches',
+            name,
+            type_=sa.Float(),
+            existing_type=sa.Numeric(precision=5, scale=3),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    for name in SCORE_COLUMNS:
+        op.alter_column(
+            'matches',
+            name,
+            type_=sa.Numeric(precision=5, scale=3),
+            existing_type=sa.Float(),
+            existing_nullable=False,
+            postgresql_using=f'round({name}::numeric, 3)',
+        )
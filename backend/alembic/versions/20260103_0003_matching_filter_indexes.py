@@ -0,0 +1,114 @@
+"""Add composite, partial and GIN indexes for matching filters
+
+Also adds the status/role_type columns the matching filters read, on
+databases created before they were modelled.
+
+Revision ID: c5d8e2a7f143
+Revises: 8b1e4d6c2a90
+Create Date: 2026-01-03 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d8e2a7f143'
+down_revision: Union[str, None] = '8b1e4d6c2a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+GIN_COLUMNS = [
+    'certifications',
+    'available_times',
+    'lifestyle_tags',
+    'movement_tags',
+    'instruction_tags',
+]
+
+
+def _add_missing_columns() -> None:
+    inspector = sa.inspect(op.get_bind())
+    coach_columns = {column['name'] for column in inspector.get_columns('coaches')}
+    job_columns = {column['name'] for column in inspector.get_columns('jobs')}
+
+    if 'role_type' not in coach_columns:
+        op.add_column('coaches', sa.Column('role_type', sa.String(length=100), nullable=True))
+    if 'status' not in coach_columns:
+        op.add_column(
+            'coaches',
+            sa.Column('status', sa.String(length=20), nullable=False, server_default='pending'),
+        )
+    if 'status' not in job_columns:
+        op.add_column(
+            'jobs',
+            sa.Column('status', sa.String(length=20), nullable=False, server_default='draft'),
+        )
+
+
+def upgrade() -> None:
+    _add_missing_columns()
+
+    # Build without locking writes on the coaches/jobs tables
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_coaches_status_city_state_role',
+            'coaches',
+            ['status', 'city', 'state', 'role_type'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_coaches_verified_pool',
+            'coaches',
+            ['city', 'state', 'role_type'],
+            unique=False,
+            postgresql_where=sa.text("status = 'verified'"),
+            postgresql_concurrently=True,
+        )
+        for name in GIN_COLUMNS:
+            op.create_index(
+                f'ix_coaches_{name}_gin',
+                'coaches',
+                [name],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={name: 'jsonb_path_ops'},
+                postgresql_concurrently=True,
+            )
+        op.create_index(
+            'ix_jobs_status_city_state',
+            'jobs',
+            ['status', 'city', 'state'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_jobs_open_pool',
+            'jobs',
+            ['city', 'state'],
+            unique=False,
+            postgresql_where=sa.text("status = 'open'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    # Columns added by upgrade() are kept: the application reads them
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_jobs_open_pool', table_name='jobs', postgresql_concurrently=True)
+        op.drop_index('ix_jobs_status_city_state', table_name='jobs', postgresql_concurrently=True)
+        for name in reversed(GIN_COLUMNS):
+            op.drop_index(
+                f'ix_coaches_{name}_gin', table_name='coaches', postgresql_concurrently=True
+            )
+        op.drop_index(
+            'ix_coaches_verified_pool', table_name='coaches', postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_coaches_status_city_state_role',
+            table_name='coaches',
+            postgresql_concurrently=True,
+        )
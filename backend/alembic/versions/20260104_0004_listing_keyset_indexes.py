@@ -0,0 +1,43 @@
+"""Add (created_at, id) indexes for keyset-paginated listings
+
+Revision ID: 4e1b7c9a0d36
+Revises: c5d8e2a7f143
+Create Date: 2026-01-04 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '4e1b7c9a0d36'
+down_revision: Union[str, None] = 'c5d8e2a7f143'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Scanned backwards for newest-first pages
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_coaches_created_at_id',
+            'coaches',
+            ['created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_jobs_created_at_id',
+            'jobs',
+            ['created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_jobs_created_at_id', table_name='jobs', postgresql_concurrently=True)
+        op.drop_index(
+            'ix_coaches_created_at_id', table_name='coaches', postgresql_concurrently=True
+        )
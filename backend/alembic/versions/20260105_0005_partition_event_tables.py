@@ -0,0 +1,146 @@
+"""Partition audit_logs and match_events by month
+
+Revision ID: 9f2c6a41d8e7
+Revises: 4e1b7c9a0d36
+Create Date: 2026-01-05 00:00:00.000000
+
+Both tables are recreated as RANGE ("timestamp") partitioned tables with
+(id, timestamp) primary keys. Existing rows are copied into monthly
+partitions covering their time span, plus the next PARTITION_MONTHS_AHEAD
+months; later months are created by app.db.partitions.maintain_partitions.
+The copy runs in the migration's transaction and blocks writes to both
+tables while it runs.
+"""
+from datetime import date, datetime
+from typing import List, Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9f2c6a41d8e7'
+down_revision: Union[str, None] = '4e1b7c9a0d36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITION_MONTHS_AHEAD = 3
+
+INDEXED_COLUMNS = {
+    'audit_logs': ['id', 'brand_id', 'event_type', 'timestamp'],
+    'match_events': ['id', 'coach_id', 'job_id', 'brand_id', 'event', 'timestamp'],
+}
+
+
+def _columns(partitioned: bool, table: str) -> List[sa.Column]:
+    """Column definitions of an event table, keyed on (id, timestamp) when partitioned"""
+    key = {'primary_key': True} if partitioned else {'nullable': False}
+    if table == 'audit_logs':
+        return [
+            sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column('brand_id', sa.Integer(), sa.ForeignKey('brands.id'), nullable=False),
+            sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=True),
+            sa.Column('event_type', sa.String(length=100), nullable=False),
+            sa.Column('entity_type', sa.String(length=50), nullable=True),
+            sa.Column('entity_id', sa.Integer(), nullable=True),
+            sa.Column('changes', postgresql.JSONB(), nullable=True),
+            sa.Column('timestamp', sa.DateTime(), **key),
+            sa.Column('ip_address', sa.String(length=50), nullable=True),
+        ]
+    return [
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('coach_id', sa.Integer(), sa.ForeignKey('coaches.id'), nullable=False),
+        sa.Column('job_id', sa.Integer(), sa.ForeignKey('jobs.id'), nullable=False),
+        sa.Column('brand_id', sa.Integer(), sa.ForeignKey('brands.id'), nullable=False),
+        sa.Column('event', sa.String(length=50), nullable=False),
+        sa.Column('fitscore_at_event', sa.Numeric(5, 3), nullable=True),
+        sa.Column('triggered_by', sa.Integer(), sa.ForeignKey('users.id'), nullable=True),
+        sa.Column('timestamp', sa.DateTime(), **key),
+    ]
+
+
+def _next_month(month: date) -> date:
+    """First day of the month after month"""
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _months(first: date, last: date) -> List[date]:
+    """First day of every month from first through last"""
+    months = []
+    month = date(first.year, first.month, 1)
+    while month <= last:
+        months.append(month)
+        month = _next_month(month)
+    return months
+
+
+def _set_aside(table: str, suffix: str) -> str:
+    """Rename a table, its primary key and sequence out of the way; drop its other indexes"""
+    inspector = sa.inspect(op.get_bind())
+    aside = f'{table}_{suffix}'
+    pk_name = inspector.get_pk_constraint(table)['name']
+    for index in inspector.get_indexes(table):
+        op.drop_index(index['name'], table_name=table)
+    op.rename_table(table, aside)
+    if pk_name:
+        op.execute(f'ALTER TABLE "{aside}" RENAME CONSTRAINT "{pk_name}" TO "{aside}_pkey"')
+    op.execute(f'ALTER SEQUENCE IF EXISTS "{table}_id_seq" RENAME TO "{aside}_id_seq"')
+    return aside
+
+
+def _create(table: str, partitioned: bool) -> None:
+    """Create an event table and its indexes"""
+    options = {'postgresql_partition_by': 'RANGE ("timestamp")'} if partitioned else {}
+    op.create_table(table, *_columns(partitioned, table), **options)
+    for column in INDEXED_COLUMNS[table]:
+        op.create_index(f'ix_{table}_{column}', table, [column], unique=False)
+
+
+def _copy(source: str, target: str) -> None:
+    """Copy all rows and move the id sequence past them"""
+    op.execute(f'INSERT INTO "{target}" SELECT * FROM "{source}"')
+    op.execute(
+        f"SELECT setval(pg_get_serial_sequence('{target}', 'id'), "
+        f'COALESCE((SELECT max(id) FROM "{target}"), 0) + 1, false)'
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    existing = set(sa.inspect(bind).get_table_names())
+    today = datetime.utcnow().date()
+
+    for table in INDEXED_COLUMNS:
+        legacy = _set_aside(table, 'unpartitioned') if table in existing else None
+        _create(table, partitioned=True)
+
+        first = last = today
+        if legacy:
+            oldest, newest = bind.execute(
+                sa.text(f'SELECT min("timestamp"), max("timestamp") FROM "{legacy}"')
+            ).one()
+            first = min(first, oldest.date()) if oldest else first
+            last = max(last, newest.date()) if newest else last
+        for _ in range(PARTITION_MONTHS_AHEAD):
+            last = _next_month(last)
+
+        for month in _months(first, last):
+            op.execute(
+                f'CREATE TABLE "{table}_y{month.year:04d}m{month.month:02d}" '
+                f'PARTITION OF "{table}" '
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+            )
+
+        if legacy:
+            _copy(legacy, table)
+            op.drop_table(legacy)
+
+
+def downgrade() -> None:
+    for table in INDEXED_COLUMNS:
+        partitioned = _set_aside(table, 'partitioned')
+        _create(table, partitioned=False)
+        _copy(partitioned, table)
+        # Drops the partitions with their parent
+        op.drop_table(partitioned)
@@ -0,0 +1,52 @@
+"""Add match funnel rollup and watermark tables
+
+Revision ID: 2b8e5f03c9a4
+Revises: 9f2c6a41d8e7
+Create Date: 2026-01-06 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '2b8e5f03c9a4'
+down_revision: Union[str, None] = '9f2c6a41d8e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'match_funnel_rollups',
+        sa.Column('brand_id', sa.Integer(), nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('score_band', sa.SmallInteger(), nullable=False),
+        sa.Column('viewed', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('applied', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('interviewed', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('hired', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('rejected', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['brand_id'], ['brands.id']),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('brand_id', 'job_id', 'score_band'),
+    )
+    op.create_index('ix_match_funnel_rollups_job_id', 'match_funnel_rollups', ['job_id'], unique=False)
+
+    op.create_table(
+        'rollup_watermarks',
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('last_event_id', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('seen_event_id', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('rollup_watermarks')
+    op.drop_index('ix_match_funnel_rollups_job_id', table_name='match_funnel_rollups')
+    op.drop_table('match_funnel_rollups')
@@ -0,0 +1,34 @@
+"""Add per-city pool version counters
+
+Revision ID: 6d1a9c3e7b25
+Revises: 2b8e5f03c9a4
+Create Date: 2026-01-07 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '6d1a9c3e7b25'
+down_revision: Union[str, None] = '2b8e5f03c9a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'pool_versions',
+        sa.Column('pool', sa.String(length=20), nullable=False),
+        sa.Column('city', sa.String(length=100), nullable=False),
+        sa.Column('state', sa.String(length=50), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False, server_default='1'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('pool', 'city', 'state'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('pool_versions')
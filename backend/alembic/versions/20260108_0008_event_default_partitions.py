@@ -0,0 +1,56 @@
+"""Add DEFAULT partitions to audit_logs and match_events
+
+Revision ID: 8c4f2e6b1a93
+Revises: 6d1a9c3e7b25
+Create Date: 2026-01-08 00:00:00.000000
+
+Events whose timestamp falls outside every monthly partition land in
+<table>_default instead of failing the insert (and with it the whole
+write-behind batch); app.db.partitions.maintain_partitions moves them into
+their months' partitions. Downgrade does the same move before dropping the
+DEFAULT partitions, so no rows are lost.
+"""
+from datetime import date
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4f2e6b1a93'
+down_revision: Union[str, None] = '6d1a9c3e7b25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('audit_logs', 'match_events')
+
+
+def _next_month(month: date) -> date:
+    """First day of the month after month"""
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(f'CREATE TABLE IF NOT EXISTS "{table}_default" PARTITION OF "{table}" DEFAULT')
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for table in TABLES:
+        op.execute(f'ALTER TABLE "{table}" DETACH PARTITION "{table}_default"')
+        months = bind.execute(
+            sa.text(
+                "SELECT DISTINCT date_trunc('month', \"timestamp\")::date "
+                f'FROM "{table}_default"'
+            )
+        ).scalars().all()
+        for month in months:
+            op.execute(
+                f'CREATE TABLE IF NOT EXISTS "{table}_y{month.year:04d}m{month.month:02d}" '
+                f'PARTITION OF "{table}" '
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+            )
+        op.execute(f'INSERT INTO "{table}" SELECT * FROM "{table}_default"')
+        op.drop_table(f'{table}_default')
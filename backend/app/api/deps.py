@@ -0,0 +1,31 @@
+"""Shared route dependencies"""
+
+from fastapi import Depends
+
+from app.db.session import primary_session, read_session
+from app.utils.auth import get_current_user
+
+
+async def get_async_db(current_user: dict = Depends(get_current_user)):
+    """
+    Dependency that provides an async session on the primary (writes).
+
+    Usage in FastAPI routes:
+        @app.get("/items")
+        async def get_items(db: AsyncSession = Depends(get_async_db)):
+            return (await db.scalars(select(Item))).all()
+
+    The JWT subject identifies the client for read-your-writes routing.
+    """
+    async with primary_session(current_user.get("sub")) as db:
+        yield db
+
+
+async def get_read_db(current_user: dict = Depends(get_current_user)):
+    """
+    Dependency that provides an async session for read-only routes.
+
+    Clients that wrote within the stickiness window read from the primary.
+    """
+    async with read_session(current_user.get("sub")) as db:
+        yield db
@@ -1,5 +1,5 @@
 """API v1 routes"""
 
-from app.api.v1.routes import coaches, jobs
+from app.api.v1.routes import admin, coaches, jobs
 
-__all__ = ["coaches", "jobs"]
+__all__ = ["admin", "coaches", "jobs"]
@@ -0,0 +1,75 @@
+"""Admin and reporting endpoints"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_read_db
+from app.models.brand import Brand
+from app.models.job import Job
+from app.schemas.coverage import CoverageResponse
+from app.schemas.funnel import FunnelResponse
+from app.services.coverage import compute_coverage
+from app.services.funnel import get_funnel
+from app.utils.auth import require_role
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/brands/{brand_id}/coverage", response_model=CoverageResponse)
+async def get_brand_coverage(
+    brand_id: int,
+    region_id: Optional[int] = Query(None, description="Restrict to jobs in this region"),
+    k: int = Query(5, ge=1, le=20, description="Length of each top-k list"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: dict = Depends(require_role("regional_director", "brand_admin")),
+):
+    """
+    Get the coach x job coverage matrix for a brand or region
+
+    Scores every verified coach against every open job, grouped by city,
+    and returns each job's top candidates and each coach's top jobs.
+    Requires the regional_director or brand_admin role.
+    """
+    brand = await db.get(Brand, brand_id)
+    if not brand:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Brand {brand_id} not found"
+        )
+
+    report = await compute_coverage(db, brand_id, region_id=region_id, k=k)
+
+    return CoverageResponse(brand_id=brand_id, region_id=region_id, k=k, **report)
+
+
+@router.get("/brands/{brand_id}/funnel", response_model=FunnelResponse)
+async def get_brand_funnel(
+    brand_id: int,
+    job_id: Optional[int] = Query(None, description="Restrict to one of the brand's jobs"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: dict = Depends(require_role("regional_director", "brand_admin")),
+):
+    """
+    Get match funnel counts and conversion rates by FitScore band
+
+    Reads the incrementally maintained rollups (see app.services.funnel),
+    so results trail live events by up to one refresh interval.
+    Requires the regional_director or brand_admin role.
+    """
+    brand = await db.get(Brand, brand_id)
+    if not brand:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Brand {brand_id} not found"
+        )
+    if job_id is not None:
+        job = await db.get(Job, job_id)
+        if not job or job.brand_id != brand_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Job {job_id} not found in brand {brand_id}",
+            )
+
+    report = await db.run_sync(get_funnel, brand_id, job_id=job_id)
+
+    return FunnelResponse(brand_id=brand_id, job_id=job_id, **report)
@@ -1,22 +1,43 @@
 """Coach CRUD and matching endpoints"""
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
 from datetime import datetime
+from typing import List, Optional
 
-from app.db.session import get_db
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db, get_read_db
+from app.config import settings
+from app.models.brand import Location
 from app.models.coach import Coach
 from app.models.job import Job
-from app.models.brand import Location
-from app.schemas.coach import CoachCreate, CoachUpdate, CoachResponse, CoachListResponse
+from app.models.user import User
+from app.schemas.bulk import BulkImportResponse
+from app.schemas.coach import CoachCreate, CoachListResponse, CoachResponse, CoachUpdate
+from app.schemas.job import JobResponse
 from app.schemas.match import CoachMatchesResponse, CoachMatchResult, FitScoreBreakdown
+from app.services.bulk_import import bulk_import
+from app.services.matching import get_ranked_matches, response_cache, update_coach_matches
+from app.services.pool_versions import JOB_POOL, MATCH_POOL, get_pool_versions
 from app.utils.auth import get_current_user
-from app.core.fitscore.engine import FitScoreEngine
+from app.utils.bulk_records import parse_records
+from app.utils.etag import etag_matches, make_etag, not_modified, set_etag
+from app.utils.fast_json import encode_json, ranked_payload
+from app.utils.pagination import count_rows, keyset_order, next_cursor, seek_after
+from app.utils.response_cache import CachedResponse
 
 router = APIRouter(prefix="/coaches", tags=["coaches"])
 
+# CoachCreate fields read as lists from CSV cells
+COACH_LIST_FIELDS = (
+    "certifications",
+    "available_times",
+    "lifestyle_tags",
+    "movement_tags",
+    "instruction_tags",
+)
+
 
 def calculate_profile_completeness(coach_data: dict) -> float:
     """Calculate profile completeness percentage"""
@@ -47,119 +68,218 @@ def calculate_profile_completeness(coach_data: dict) -> float:
     return round(completed / total_fields, 2)
 
 
+def coach_values(coach_data: CoachCreate, brand_id: int, user_id: int) -> dict:
+    """
+    Column values for a new coach (shared by single and bulk creation)
+
+    Name, email and phone live on the coach's user account, not the coach row.
+    """
+    return {
+        "user_id": user_id,
+        "brand_id": brand_id,
+        "city": coach_data.city,
+        "state": coach_data.state,
+        "role_type": coach_data.role_type,
+        "certifications": [cert.model_dump() for cert in coach_data.certifications],
+        "years_experience": coach_data.years_experience,
+        "available_times": coach_data.available_times,
+        "lifestyle_tags": coach_data.lifestyle_tags,
+        "movement_tags": coach_data.movement_tags,
+        "instruction_tags": coach_data.instruction_tags,
+        "profile_image_url": (
+            str(coach_data.profile_photo_url) if coach_data.profile_photo_url else None
+        ),
+        "verified_video_url": (
+            str(coach_data.verified_video_url) if coach_data.verified_video_url else None
+        ),
+        "bio": coach_data.bio,
+        "profile_completeness": calculate_profile_completeness(coach_data.model_dump()),
+        "status": "pending",  # Requires admin verification
+        "last_updated": datetime.now(),
+    }
+
+
+async def coach_account_id(db: AsyncSession, coach_data: CoachCreate, brand_id: int) -> int:
+    """
+    Find or create the user account a new coach belongs to
+
+    Accounts are matched by email. A coach created without one gets a new
+    coach-role account holding their name and email; its Clerk id is a
+    placeholder until the coach signs up. Bulk imports do not create
+    accounts (rows with an unknown email are reported instead).
+
+    Args:
+        db: Database session
+        coach_data: New coach profile
+        brand_id: Brand of the coach's location
+
+    Returns:
+        int: users.id of the coach's account
+    """
+    user_id = await db.scalar(select(User.id).where(User.email == coach_data.email))
+    if user_id is not None:
+        return user_id
+
+    user = User(
+        clerk_user_id=f"pending:{coach_data.email}",
+        brand_id=brand_id,
+        email=coach_data.email,
+        first_name=coach_data.first_name,
+        last_name=coach_data.last_name,
+        role="coach",
+    )
+    db.add(user)
+    await db.flush()
+    return user.id
+
+
 @router.post("/", response_model=CoachResponse, status_code=status.HTTP_201_CREATED)
 async def create_coach(
     coach_data: CoachCreate,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
 ):
     """
     Create a new coach profile
 
     Requires authentication. Users can only create coaches in their authorized locations.
+    The coach is attached to the user account with the given email, which
+    is created if it does not exist yet.
     """
     # Verify location exists and user has access
-    location = db.query(Location).filter(Location.id == coach_data.location_id).first()
+    location = await db.get(Location, coach_data.location_id)
     if not location:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Location {coach_data.location_id} not found"
+            detail=f"Location {coach_data.location_id} not found",
         )
 
-    # Calculate profile completeness
-    completeness = calculate_profile_completeness(coach_data.model_dump())
-
-    # Create coach
-    new_coach = Coach(
-        brand_id=location.brand_id,
-        location_id=coach_data.location_id,
-        first_name=coach_data.first_name,
-        last_name=coach_data.last_name,
-        email=coach_data.email,
-        phone=coach_data.phone,
-        city=coach_data.city,
-        state=coach_data.state,
-        role_type=coach_data.role_type,
-        certifications=[cert.model_dump() for cert in coach_data.certifications],
-        years_experience=coach_data.years_experience,
-        available_times=coach_data.available_times,
-        lifestyle_tags=coach_data.lifestyle_tags,
-        movement_tags=coach_data.movement_tags,
-        instruction_tags=coach_data.instruction_tags,
-        profile_photo_url=str(coach_data.profile_photo_url) if coach_data.profile_photo_url else None,
-        verified_video_url=str(coach_data.verified_video_url) if coach_data.verified_video_url else None,
-        bio=coach_data.bio,
-        profile_completeness=completeness,
-        status="pending",  # Requires admin verification
-        last_updated=datetime.now()
-    )
+    user_id = await coach_account_id(db, coach_data, location.brand_id)
+    new_coach = Coach(**coach_values(coach_data, location.brand_id, user_id))
 
     db.add(new_coach)
-    db.commit()
-    db.refresh(new_coach)
+    await db.commit()
+    await db.refresh(new_coach)
 
     return new_coach
 
 
+@router.post(":bulk", response_model=BulkImportResponse)
+async def bulk_create_coaches(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """
+    Create many coach profiles from JSON lines or CSV
+
+    Send one CoachCreate object per line (application/x-ndjson), or CSV
+    (text/csv) with a header row of CoachCreate fields; list cells hold a
+    JSON array or ";"-separated values. Rows are validated and inserted in
+    chunks, each in its own transaction. Invalid rows are reported by row
+    number and skipped, as are rows whose email has no user account; the
+    rest are created as pending.
+    """
+    try:
+        records, errors = parse_records(
+            await request.body(), request.headers.get("content-type"), COACH_LIST_FIELDS
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    result = await bulk_import(
+        db, Coach, CoachCreate, records, coach_values, errors, owner_email=lambda item: item.email
+    )
+    return BulkImportResponse(**result.to_dict())
+
+
 @router.get("/{coach_id}", response_model=CoachResponse)
 async def get_coach(
     coach_id: int,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: dict = Depends(get_current_user),
 ):
     """
     Get a single coach profile by ID
 
-    Requires authentication.
+    Requires authentication. Sends an ETag; a matching If-None-Match gets 304.
     """
-    coach = db.query(Coach).filter(Coach.id == coach_id).first()
+    coach = await db.get(Coach, coach_id)
     if not coach:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Coach {coach_id} not found"
         )
 
+    etag = make_etag("coach", coach.id, coach.last_updated)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+
     return coach
 
 
 @router.get("/", response_model=CoachListResponse)
 async def list_coaches(
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored when cursor is given)"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    count: Optional[str] = Query(
+        None,
+        pattern="^(exact|estimate|none)$",
+        description="Total: exact, estimate (planner statistics) or none. "
+        "Defaults to exact for page numbers and none for cursors",
+    ),
     location_id: Optional[int] = Query(None, description="Filter by location"),
     role_type: Optional[str] = Query(None, description="Filter by role type"),
     status: Optional[str] = Query(None, description="Filter by status"),
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_read_db),
+    current_user: dict = Depends(get_current_user),
 ):
     """
     List coaches with pagination and filtering
 
     Requires authentication. Users see coaches in their authorized locations.
+    Results are ordered newest first. Follow next_cursor for keyset
+    pagination (constant cost per page); page numbers still work.
     """
-    query = db.query(Coach)
+    query = select(Coach)
 
     # Apply filters
     if location_id:
-        query = query.filter(Coach.location_id == location_id)
+        query = query.where(Coach.location_id == location_id)
     if role_type:
-        query = query.filter(Coach.role_type == role_type)
+        query = query.where(Coach.role_type == role_type)
     if status:
-        query = query.filter(Coach.status == status)
-
-    # Get total count
-    total = query.count()
-
-    # Apply pagination
-    offset = (page - 1) * page_size
-    coaches = query.order_by(Coach.created_at.desc()).offset(offset).limit(page_size).all()
+        query = query.where(Coach.status == status)
+
+    if count is None:
+        count = "none" if cursor else "exact"
+    total = await count_rows(db, query, count)
+
+    # Apply pagination: seek past the cursor, or skip to the page number
+    if cursor:
+        try:
+            query = seek_after(query, Coach, cursor)
+        except ValueError as exc:
+            # (the status query parameter shadows fastapi.status here)
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+    else:
+        query = query.offset((page - 1) * page_size)
+    coaches = (
+        await db.scalars(query.order_by(*keyset_order(Coach)).limit(page_size + 1))
+    ).all()
 
     return CoachListResponse(
-        coaches=coaches,
+        coaches=coaches[:page_size],
         total=total,
-        page=page,
+        total_is_estimate=count == "estimate",
+        page=None if cursor else page,
         page_size=page_size,
-        total_pages=(total + page_size - 1) // page_size
+        total_pages=None if total is None else (total + page_size - 1) // page_size,
+        next_cursor=next_cursor(coaches, page_size),
     )
 
 
@@ -167,7 +287,7 @@ async def list_coaches(
 async def update_coach(
     coach_id: int,
     coach_update: CoachUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user)
 ):
     """
@@ -175,7 +295,7 @@ async def update_coach(
 
     Requires authentication. Only updates provided fields (partial update).
     """
-    coach = db.query(Coach).filter(Coach.id == coach_id).first()
+    coach = await db.get(Coach, coach_id)
     if not coach:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -216,8 +336,16 @@ async def update_coach(
     coach.last_updated = datetime.now()
     coach.updated_at = datetime.now()
 
-    db.commit()
-    db.refresh(coach)
+    # Re-score only the components this edit touched (same transaction);
+    # completeness and last_updated change on every edit
+    await db.run_sync(
+        update_coach_matches,
+        coach,
+        [*update_data.keys(), "profile_completeness", "last_updated"],
+    )
+
+    await db.commit()
+    await db.refresh(coach)
 
     return coach
 
@@ -226,104 +354,93 @@ async def update_coach(
 async def get_coach_matches(
     coach_id: int,
     limit: int = Query(20, ge=1, le=20, description="Maximum number of matches to return"),
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: dict = Depends(get_current_user),
 ):
     """
     Get top job matches for a coach
 
     Returns jobs ranked by FitScore, filtered by the job's threshold.
-    Only returns jobs with status='open'.
+    Only returns jobs with status='open'. Verified coaches are read from
+    the pre-calculated matches table; others are scored on demand. The
+    ETag changes with the coach, with any job in the coach's city and with
+    any refresh of the city's stored matches; a matching If-None-Match gets
+    304 without reading the ranking. Rendered lists are cached under their
+    ETag, so repeat requests skip the ranking read and serialization.
     """
     # Get coach
-    coach = db.query(Coach).filter(Coach.id == coach_id).first()
+    coach = await db.get(Coach, coach_id)
     if not coach:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Coach {coach_id} not found"
         )
 
-    # Get all open jobs in the same city (Phase 1: exact city match only)
-    jobs = db.query(Job).filter(
-        and_(
-            Job.status == "open",
-            Job.city == coach.city,
-            Job.state == coach.state
+    pools = await get_pool_versions(db, (JOB_POOL, MATCH_POOL), coach.city, coach.state)
+    etag = make_etag("matches", coach.id, coach.last_updated, *pools, limit)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    cached = await response_cache.aget(etag)
+    if cached is not None:
+        return cached.to_response(etag)
+
+    # Read ranked rows (open jobs only, each job's threshold applied), then
+    # load just those jobs
+    ranked = await db.run_sync(get_ranked_matches, coach, limit)
+    job_ids = [job_id for job_id, _ in ranked]
+    jobs_by_id = {
+        job.id: job for job in await db.scalars(select(Job).where(Job.id.in_(job_ids)))
+    } if job_ids else {}
+
+    matches = [
+        {"job": jobs_by_id[job_id], "score": score}
+        for job_id, score in ranked
+        if job_id in jobs_by_id
+    ]
+
+    if settings.fast_json_responses:
+        body = encode_json(
+            {
+                "coach_id": coach_id,
+                "matches": ranked_payload(matches, "job", JobResponse, FitScoreBreakdown),
+                "total_matches": len(matches),
+                "threshold": 0.60,
+            }
         )
-    ).all()
-
-    # Calculate FitScore for each job
-    engine = FitScoreEngine()
-    matches = []
-
-    # Prepare coach data for FitScore engine
-    coach_data = {
-        "certifications": coach.certifications,
-        "years_experience": coach.years_experience,
-        "available_times": coach.available_times,
-        "city": coach.city,
-        "state": coach.state,
-        "lifestyle_tags": coach.lifestyle_tags,
-        "movement_tags": coach.movement_tags,
-        "instruction_tags": coach.instruction_tags,
-        "profile_completeness": float(coach.profile_completeness) if coach.profile_completeness else 0.0,
-        "last_updated": coach.last_updated.isoformat() if coach.last_updated else None,
-        "verified_video_url": coach.verified_video_url,
-    }
-
-    for job in jobs:
-        job_data = {
-            "required_certifications": job.required_certifications,
-            "preferred_certifications": job.preferred_certifications,
-            "min_experience": job.min_experience,
-            "required_availability": job.required_availability,
-            "city": job.city,
-            "state": job.state,
-            "culture_tags": job.culture_tags,
-        }
-
-        score = engine.calculate_match(
-            coach_data,
-            job_data,
-            preset=job.weighting_preset
+    else:
+        # Format response
+        match_results = []
+        for rank, match in enumerate(matches, start=1):
+            match_results.append(
+                CoachMatchResult(
+                    job=match["job"],
+                    fitscore=match["score"].fitscore,
+                    score_breakdown=FitScoreBreakdown(
+                        fitscore=match["score"].fitscore,
+                        cert_score=match["score"].cert_score,
+                        experience_score=match["score"].experience_score,
+                        availability_score=match["score"].availability_score,
+                        location_score=match["score"].location_score,
+                        culture_score=match["score"].culture_score,
+                        engagement_score=match["score"].engagement_score,
+                    ),
+                    rank=rank,
+                )
+            )
+
+        body = (
+            CoachMatchesResponse(
+                coach_id=coach_id,
+                matches=match_results,
+                total_matches=len(matches),
+                threshold=0.60,  # Default threshold for display
+            )
+            .model_dump_json()
+            .encode()
         )
 
-        # Only include if above threshold
-        threshold = float(job.fitscore_threshold) if job.fitscore_threshold else 0.60
-        if score.fitscore >= threshold:
-            matches.append({
-                "job": job,
-                "score": score,
-                "threshold": threshold
-            })
-
-    # Sort by FitScore descending
-    matches.sort(key=lambda x: x["score"].fitscore, reverse=True)
-
-    # Limit to top N matches
-    matches = matches[:limit]
-
-    # Format response
-    match_results = []
-    for rank, match in enumerate(matches, start=1):
-        match_results.append(CoachMatchResult(
-            job=match["job"],
-            fitscore=match["score"].fitscore,
-            score_breakdown=FitScoreBreakdown(
-                fitscore=match["score"].fitscore,
-                cert_score=match["score"].cert_score,
-                experience_score=match["score"].experience_score,
-                availability_score=match["score"].availability_score,
-                location_score=match["score"].location_score,
-                culture_score=match["score"].culture_score,
-                engagement_score=match["score"].engagement_score,
-            ),
-            rank=rank
-        ))
-
-    return CoachMatchesResponse(
-        coach_id=coach_id,
-        matches=match_results,
-        total_matches=len(matches),
-        threshold=0.60  # Default threshold for display
-    )
+    cached = CachedResponse(body)
+    await response_cache.aset(etag, cached)
+    return cached.to_response(etag)
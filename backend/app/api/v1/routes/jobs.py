@@ -1,28 +1,122 @@
 """Job CRUD and candidate matching endpoints"""
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
 from datetime import datetime
+from decimal import Decimal
+from functools import partial
+from typing import List, Optional
 
-from app.db.session import get_db
-from app.models.job import Job
-from app.models.coach import Coach
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db, get_read_db
+from app.config import settings
+from app.core.fitscore.presets import COMPONENTS, get_preset_weights, parse_custom_weights
 from app.models.brand import Location
-from app.schemas.job import JobCreate, JobUpdate, JobResponse, JobListResponse
-from app.schemas.match import JobCandidatesResponse, JobCandidateResult, FitScoreBreakdown
+from app.models.coach import Coach
+from app.models.job import Job
+from app.models.user import User
+from app.schemas.bulk import BulkImportResponse
+from app.schemas.coach import CoachResponse
+from app.schemas.job import JobCreate, JobListResponse, JobResponse, JobUpdate
+from app.schemas.match import (
+    FitScoreBreakdown,
+    JobCandidateResult,
+    JobCandidatesBatchRequest,
+    JobCandidatesBatchResponse,
+    JobCandidatesResponse,
+    JobPresetRankingsResponse,
+    PresetRanking,
+)
+from app.services.bulk_import import bulk_import
+from app.services.events import record_match_events
+from app.services.matching import (
+    get_preset_rankings,
+    get_ranked_candidates,
+    get_ranked_candidates_batch,
+    response_cache,
+    update_job_matches,
+)
+from app.services.pool_versions import COACH_POOL, MATCH_POOL, get_pool_versions
 from app.utils.auth import get_current_user
-from app.core.fitscore.engine import FitScoreEngine
+from app.utils.bulk_records import parse_records
+from app.utils.etag import etag_matches, make_etag, not_modified, set_etag
+from app.utils.fast_json import FastJSONResponse, encode_json, ranked_payload
+from app.utils.pagination import count_rows, keyset_order, next_cursor, seek_after
+from app.utils.response_cache import CachedResponse
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
+# JobCreate fields read as lists from CSV cells
+JOB_LIST_FIELDS = (
+    "required_certifications",
+    "preferred_certifications",
+    "required_availability",
+    "culture_tags",
+)
+
+
+def _whole(amount: Optional[Decimal]) -> Optional[int]:
+    """Round a compensation amount to the integer the column stores"""
+    return None if amount is None else round(amount)
+
+
+async def acting_user_id(db: AsyncSession, current_user: dict) -> int:
+    """
+    Look up the user account of the authenticated caller
+
+    Args:
+        db: Database session
+        current_user: Token claims from get_current_user
+
+    Returns:
+        int: users.id of the caller
+
+    Raises:
+        HTTPException: 403 if the caller has no user account
+    """
+    user_id = await db.scalar(select(User.id).where(User.clerk_user_id == current_user["sub"]))
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="No user account for the current user"
+        )
+    return user_id
+
+
+def job_values(job_data: JobCreate, brand_id: int, created_by: int) -> dict:
+    """
+    Column values for a new job (shared by single and bulk creation)
+
+    compensation_type is accepted but not stored; compensation is stored in
+    whole units.
+    """
+    return {
+        "brand_id": brand_id,
+        "location_id": job_data.location_id,
+        "created_by": created_by,
+        "title": job_data.title,
+        "description": job_data.description,
+        "role_type": job_data.role_type,
+        "required_certifications": job_data.required_certifications,
+        "preferred_certifications": job_data.preferred_certifications,
+        "min_experience": job_data.min_experience,
+        "required_availability": job_data.required_availability,
+        "city": job_data.city,
+        "state": job_data.state,
+        "culture_tags": job_data.culture_tags,
+        "compensation_min": _whole(job_data.compensation_min),
+        "compensation_max": _whole(job_data.compensation_max),
+        "weighting_preset": job_data.weighting_preset,
+        "fitscore_threshold": job_data.fitscore_threshold,
+        "status": "draft",  # New jobs start as draft
+    }
+
 
 @router.post("/", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
 async def create_job(
     job_data: JobCreate,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
 ):
     """
     Create a new job listing
@@ -30,101 +124,226 @@ async def create_job(
     Requires authentication. Users can only create jobs in their authorized locations.
     """
     # Verify location exists and user has access
-    location = db.query(Location).filter(Location.id == job_data.location_id).first()
+    location = await db.get(Location, job_data.location_id)
     if not location:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Location {job_data.location_id} not found"
+            detail=f"Location {job_data.location_id} not found",
         )
 
-    # Create job
-    new_job = Job(
-        brand_id=location.brand_id,
-        location_id=job_data.location_id,
-        title=job_data.title,
-        description=job_data.description,
-        role_type=job_data.role_type,
-        required_certifications=job_data.required_certifications,
-        preferred_certifications=job_data.preferred_certifications,
-        min_experience=job_data.min_experience,
-        required_availability=job_data.required_availability,
-        city=job_data.city,
-        state=job_data.state,
-        culture_tags=job_data.culture_tags,
-        compensation_type=job_data.compensation_type,
-        compensation_min=job_data.compensation_min,
-        compensation_max=job_data.compensation_max,
-        weighting_preset=job_data.weighting_preset,
-        fitscore_threshold=job_data.fitscore_threshold,
-        status="draft"  # New jobs start as draft
-    )
+    created_by = await acting_user_id(db, current_user)
+    new_job = Job(**job_values(job_data, location.brand_id, created_by))
 
     db.add(new_job)
-    db.commit()
-    db.refresh(new_job)
+    await db.commit()
+    await db.refresh(new_job)
 
     return new_job
 
 
+@router.post(":bulk", response_model=BulkImportResponse)
+async def bulk_create_jobs(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """
+    Create many job listings from JSON lines or CSV
+
+    Send one JobCreate object per line (application/x-ndjson), or CSV
+    (text/csv) with a header row of JobCreate fields; list cells hold a
+    JSON array or ";"-separated values. Rows are validated and inserted in
+    chunks, each in its own transaction. Invalid rows are reported by row
+    number and skipped; the rest are created as drafts, owned by the caller.
+    """
+    try:
+        records, errors = parse_records(
+            await request.body(), request.headers.get("content-type"), JOB_LIST_FIELDS
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    created_by = await acting_user_id(db, current_user)
+    result = await bulk_import(
+        db, Job, JobCreate, records, partial(job_values, created_by=created_by), errors
+    )
+    return BulkImportResponse(**result.to_dict())
+
+
+@router.post("/candidates:batch", response_model=JobCandidatesBatchResponse)
+async def get_batch_candidates(
+    batch: JobCandidatesBatchRequest,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """
+    Get top coach candidates for several jobs in one request
+
+    Same ranking, thresholds and strict prefiltering as
+    GET /jobs/{job_id}/candidates. All jobs' candidate lists are read in
+    one query and their coaches loaded in one more, so jobs sharing a
+    city's coach pool load each coach once.
+    """
+    job_ids = list(dict.fromkeys(batch.job_ids))
+    jobs_by_id = {job.id: job for job in await db.scalars(select(Job).where(Job.id.in_(job_ids)))}
+    jobs = [jobs_by_id[job_id] for job_id in job_ids if job_id in jobs_by_id]
+
+    ranked = await db.run_sync(get_ranked_candidates_batch, jobs, batch.limit, batch.strict)
+    coach_ids = {coach_id for rows in ranked.values() for coach_id, _ in rows}
+    coaches_by_id = (
+        {
+            coach.id: coach
+            for coach in await db.scalars(select(Coach).where(Coach.id.in_(coach_ids)))
+        }
+        if coach_ids
+        else {}
+    )
+
+    results = []
+    for job in jobs:
+        candidates = [
+            {"coach": coaches_by_id[coach_id], "score": score}
+            for coach_id, score in ranked[job.id]
+            if coach_id in coaches_by_id
+        ]
+        record_match_events(
+            "viewed",
+            job,
+            [(candidate["coach"].id, candidate["score"].fitscore) for candidate in candidates],
+        )
+        results.append(
+            {
+                "job_id": job.id,
+                "candidates": candidates,
+                "total_candidates": len(candidates),
+                "threshold": float(job.fitscore_threshold) if job.fitscore_threshold else 0.60,
+            }
+        )
+    missing_job_ids = [job_id for job_id in job_ids if job_id not in jobs_by_id]
+
+    if settings.fast_json_responses:
+        return FastJSONResponse(
+            {
+                "results": [
+                    {
+                        **result,
+                        "candidates": ranked_payload(
+                            result["candidates"], "coach", CoachResponse, FitScoreBreakdown
+                        ),
+                    }
+                    for result in results
+                ],
+                "missing_job_ids": missing_job_ids,
+            }
+        )
+
+    return JobCandidatesBatchResponse(
+        results=[
+            JobCandidatesResponse(
+                job_id=result["job_id"],
+                candidates=[
+                    JobCandidateResult(
+                        coach=candidate["coach"],
+                        fitscore=candidate["score"].fitscore,
+                        score_breakdown=FitScoreBreakdown(**candidate["score"].to_dict()),
+                        rank=rank,
+                    )
+                    for rank, candidate in enumerate(result["candidates"], start=1)
+                ],
+                total_candidates=result["total_candidates"],
+                threshold=result["threshold"],
+            )
+            for result in results
+        ],
+        missing_job_ids=missing_job_ids,
+    )
+
+
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_job(
     job_id: int,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: dict = Depends(get_current_user),
 ):
     """
     Get a single job listing by ID
 
-    Requires authentication.
+    Requires authentication. Sends an ETag; a matching If-None-Match gets 304.
     """
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = await db.get(Job, job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job {job_id} not found"
         )
 
+    etag = make_etag("job", job.id, job.updated_at)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+
     return job
 
 
 @router.get("/", response_model=JobListResponse)
 async def list_jobs(
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored when cursor is given)"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    count: Optional[str] = Query(
+        None,
+        pattern="^(exact|estimate|none)$",
+        description="Total: exact, estimate (planner statistics) or none. "
+        "Defaults to exact for page numbers and none for cursors",
+    ),
     location_id: Optional[int] = Query(None, description="Filter by location"),
     role_type: Optional[str] = Query(None, description="Filter by role type"),
     status: Optional[str] = Query(None, description="Filter by status"),
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_read_db),
+    current_user: dict = Depends(get_current_user),
 ):
     """
     List jobs with pagination and filtering
 
     Requires authentication. Users see jobs in their authorized locations.
+    Results are ordered newest first. Follow next_cursor for keyset
+    pagination (constant cost per page); page numbers still work.
     """
-    query = db.query(Job)
+    query = select(Job)
 
     # Apply filters
     if location_id:
-        query = query.filter(Job.location_id == location_id)
+        query = query.where(Job.location_id == location_id)
     if role_type:
-        query = query.filter(Job.role_type == role_type)
+        query = query.where(Job.role_type == role_type)
     if status:
-        query = query.filter(Job.status == status)
-
-    # Get total count
-    total = query.count()
-
-    # Apply pagination
-    offset = (page - 1) * page_size
-    jobs = query.order_by(Job.created_at.desc()).offset(offset).limit(page_size).all()
+        query = query.where(Job.status == status)
+
+    if count is None:
+        count = "none" if cursor else "exact"
+    total = await count_rows(db, query, count)
+
+    # Apply pagination: seek past the cursor, or skip to the page number
+    if cursor:
+        try:
+            query = seek_after(query, Job, cursor)
+        except ValueError as exc:
+            # (the status query parameter shadows fastapi.status here)
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+    else:
+        query = query.offset((page - 1) * page_size)
+    jobs = (await db.scalars(query.order_by(*keyset_order(Job)).limit(page_size + 1))).all()
 
     return JobListResponse(
-        jobs=jobs,
+        jobs=jobs[:page_size],
         total=total,
-        page=page,
+        total_is_estimate=count == "estimate",
+        page=None if cursor else page,
         page_size=page_size,
-        total_pages=(total + page_size - 1) // page_size
+        total_pages=None if total is None else (total + page_size - 1) // page_size,
+        next_cursor=next_cursor(jobs, page_size),
     )
 
 
@@ -132,15 +351,15 @@ async def list_jobs(
 async def update_job(
     job_id: int,
     job_update: JobUpdate,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
 ):
     """
     Update a job listing
 
     Requires authentication. Only updates provided fields (partial update).
     """
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = await db.get(Job, job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -156,8 +375,11 @@ async def update_job(
     # Update timestamp
     job.updated_at = datetime.now()
 
-    db.commit()
-    db.refresh(job)
+    # Re-score only the components this edit touched (same transaction)
+    await db.run_sync(update_job_matches, job, update_data.keys())
+
+    await db.commit()
+    await db.refresh(job)
 
     return job
 
@@ -165,23 +387,23 @@ async def update_job(
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_job(
     job_id: int,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user),
 ):
     """
     Delete a job listing
 
     Requires authentication and appropriate permissions.
     """
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = await db.get(Job, job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job {job_id} not found"
         )
 
-    db.delete(job)
-    db.commit()
+    await db.delete(job)
+    await db.commit()
 
     return None
 
@@ -190,105 +412,184 @@ async def delete_job(
 async def get_job_candidates(
     job_id: int,
     limit: int = Query(20, ge=1, le=20, description="Maximum number of candidates to return"),
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    strict: Optional[bool] = Query(
+        None,
+        description="Exclude coaches missing a required certification or time slot, "
+        "even when they score above threshold",
+    ),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: dict = Depends(get_current_user),
 ):
     """
     Get top coach candidates for a job
 
     Returns coaches ranked by FitScore, filtered by the job's threshold.
-    Only returns coaches with status='verified'.
+    Only returns coaches with status='verified'. With strict=true, coaches
+    missing a required certification or time slot are excluded outright.
+    The ETag changes with the job, with any coach in the job's city and
+    with any refresh of the city's stored matches; a matching If-None-Match
+    gets 304 without reading the ranking (and without logging another
+    view). Rendered lists are cached under their ETag, so repeat requests
+    skip the ranking read and serialization.
     """
     # Get job
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = await db.get(Job, job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job {job_id} not found"
         )
 
-    # Get all verified coaches in the same city (Phase 1: exact city match only)
-    coaches = db.query(Coach).filter(
-        and_(
-            Coach.status == "verified",
-            Coach.city == job.city,
-            Coach.state == job.state,
-            Coach.role_type == job.role_type  # Must match role type
-        )
-    ).all()
-
-    # Calculate FitScore for each coach
-    engine = FitScoreEngine()
-    candidates = []
-
-    # Prepare job data for FitScore engine
-    job_data = {
-        "required_certifications": job.required_certifications,
-        "preferred_certifications": job.preferred_certifications,
-        "min_experience": job.min_experience,
-        "required_availability": job.required_availability,
-        "city": job.city,
-        "state": job.state,
-        "culture_tags": job.culture_tags,
-    }
+    pools = await get_pool_versions(db, (COACH_POOL, MATCH_POOL), job.city, job.state)
+    etag = make_etag("candidates", job.id, job.updated_at, *pools, limit, strict)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    cached = await response_cache.aget(etag)
+    if cached is not None:
+        record_match_events("viewed", job, cached.views)
+        return cached.to_response(etag)
 
     threshold = float(job.fitscore_threshold) if job.fitscore_threshold else 0.60
 
-    for coach in coaches:
-        coach_data = {
-            "certifications": coach.certifications,
-            "years_experience": coach.years_experience,
-            "available_times": coach.available_times,
-            "city": coach.city,
-            "state": coach.state,
-            "lifestyle_tags": coach.lifestyle_tags,
-            "movement_tags": coach.movement_tags,
-            "instruction_tags": coach.instruction_tags,
-            "profile_completeness": float(coach.profile_completeness) if coach.profile_completeness else 0.0,
-            "last_updated": coach.last_updated.isoformat() if coach.last_updated else None,
-            "verified_video_url": coach.verified_video_url,
+    # Read ranked rows from the pre-calculated matches table (verified coaches
+    # with a matching role, above threshold; jobs that are not open are scored
+    # live), then load just those coaches
+    ranked = await db.run_sync(get_ranked_candidates, job, limit, strict)
+    coach_ids = [coach_id for coach_id, _ in ranked]
+    coaches_by_id = (
+        {
+            coach.id: coach
+            for coach in await db.scalars(select(Coach).where(Coach.id.in_(coach_ids)))
         }
+        if coach_ids
+        else {}
+    )
 
-        score = engine.calculate_match(
-            coach_data,
-            job_data,
-            preset=job.weighting_preset
+    candidates = [
+        {"coach": coaches_by_id[coach_id], "score": score}
+        for coach_id, score in ranked
+        if coach_id in coaches_by_id
+    ]
+
+    # Log a 'viewed' event per candidate shown (buffered, written off the request path)
+    views = tuple((candidate["coach"].id, candidate["score"].fitscore) for candidate in candidates)
+    record_match_events("viewed", job, views)
+
+    if settings.fast_json_responses:
+        body = encode_json({
+            "job_id": job_id,
+            "candidates": ranked_payload(candidates, "coach", CoachResponse, FitScoreBreakdown),
+            "total_candidates": len(candidates),
+            "threshold": threshold,
+        })
+    else:
+        # Format response
+        candidate_results = []
+        for rank, candidate in enumerate(candidates, start=1):
+            candidate_results.append(JobCandidateResult(
+                coach=candidate["coach"],
+                fitscore=candidate["score"].fitscore,
+                score_breakdown=FitScoreBreakdown(
+                    fitscore=candidate["score"].fitscore,
+                    cert_score=candidate["score"].cert_score,
+                    experience_score=candidate["score"].experience_score,
+                    availability_score=candidate["score"].availability_score,
+                    location_score=candidate["score"].location_score,
+                    culture_score=candidate["score"].culture_score,
+                    engagement_score=candidate["score"].engagement_score,
+                ),
+                rank=rank
+            ))
+
+        body = JobCandidatesResponse(
+            job_id=job_id,
+            candidates=candidate_results,
+            total_candidates=len(candidates),
+            threshold=threshold
+        ).model_dump_json().encode()
+
+    cached = CachedResponse(body, views)
+    await response_cache.aset(etag, cached)
+    return cached.to_response(etag)
+
+
+@router.get("/{job_id}/candidates/presets", response_model=JobPresetRankingsResponse)
+async def get_job_candidates_by_preset(
+    job_id: int,
+    limit: int = Query(20, ge=1, le=20, description="Maximum number of candidates per preset"),
+    weights: Optional[str] = Query(
+        None,
+        description=(
+            "Custom weights to rank as well: comma-separated, in order " + ", ".join(COMPONENTS)
+        ),
+    ),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """
+    Compare a job's top candidates under every weighting preset
+
+    Lets hiring managers preview rankings before choosing weighting_preset.
+    All rankings come from one read of the stored sub-scores.
+    """
+    job = await db.get(Job, job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found"
         )
 
-        # Only include if above threshold
-        if score.fitscore >= threshold:
-            candidates.append({
-                "coach": coach,
-                "score": score
-            })
-
-    # Sort by FitScore descending
-    candidates.sort(key=lambda x: x["score"].fitscore, reverse=True)
-
-    # Limit to top N candidates
-    candidates = candidates[:limit]
-
-    # Format response
-    candidate_results = []
-    for rank, candidate in enumerate(candidates, start=1):
-        candidate_results.append(JobCandidateResult(
-            coach=candidate["coach"],
-            fitscore=candidate["score"].fitscore,
-            score_breakdown=FitScoreBreakdown(
-                fitscore=candidate["score"].fitscore,
-                cert_score=candidate["score"].cert_score,
-                experience_score=candidate["score"].experience_score,
-                availability_score=candidate["score"].availability_score,
-                location_score=candidate["score"].location_score,
-                culture_score=candidate["score"].culture_score,
-                engagement_score=candidate["score"].engagement_score,
-            ),
-            rank=rank
-        ))
-
-    return JobCandidatesResponse(
+    custom_weights = None
+    if weights is not None:
+        try:
+            custom_weights = parse_custom_weights(weights.split(","))
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            ) from e
+
+    threshold = float(job.fitscore_threshold) if job.fitscore_threshold else 0.60
+    rankings = await db.run_sync(get_preset_rankings, job, limit, custom_weights)
+
+    # Load every coach that appears in any ranking with one query
+    coach_ids = {coach_id for _, ranked in rankings.values() for coach_id, _ in ranked}
+    coaches_by_id = (
+        {
+            coach.id: coach
+            for coach in await db.scalars(select(Coach).where(Coach.id.in_(coach_ids)))
+        }
+        if coach_ids
+        else {}
+    )
+
+    preset_rankings = []
+    for preset, (total, ranked) in rankings.items():
+        vector = custom_weights if preset == "custom" else get_preset_weights(preset)
+        ranked = [(coach_id, score) for coach_id, score in ranked if coach_id in coaches_by_id]
+        candidates = [
+            JobCandidateResult(
+                coach=coaches_by_id[coach_id],
+                fitscore=score.fitscore,
+                score_breakdown=FitScoreBreakdown(**score.to_dict()),
+                rank=rank,
+            )
+            for rank, (coach_id, score) in enumerate(ranked, start=1)
+        ]
+        preset_rankings.append(
+            PresetRanking(
+                preset=preset,
+                weights=dict(zip(COMPONENTS, vector, strict=True)),
+                candidates=candidates,
+                total_candidates=total,
+            )
+        )
+
+    return JobPresetRankingsResponse(
         job_id=job_id,
-        candidates=candidate_results,
-        total_candidates=len(candidates),
-        threshold=threshold
+        current_preset=job.weighting_preset,
+        threshold=threshold,
+        rankings=preset_rankings
     )
@@ -35,6 +35,8 @@ class Settings(BaseSettings):
     db_pool_size: int = Field(default=10, description="Database connection pool size")
     db_max_overflow: int = Field(default=20, description="Max database connections overflow")
     db_pool_timeout: int = Field(default=30, description="Database pool timeout in seconds")
+    database_replica_url: str = Field(default="", description="Read replica connection string (empty = read from primary)")
+    replica_sticky_seconds: float = Field(default=5.0, description="Seconds a client reads from the primary after writing")
 
     # Clerk Authentication
     clerk_secret_key: str = Field(..., description="Clerk secret key")
@@ -52,6 +54,41 @@ class Settings(BaseSettings):
     # Redis (Phase 2)
     redis_url: str = Field(default="redis://localhost:6379/0", description="Redis connection string")
 
+    # FitScore result cache
+    score_cache_size: int = Field(default=100_000, description="Max cached scores per worker")
+    score_cache_ttl: int = Field(default=3600, description="Cached score lifetime in seconds")
+    score_cache_redis: bool = Field(
+        default=False, description="Share cached scores across workers via Redis"
+    )
+
+    # Rendered candidate/match list cache (keyed by ETag)
+    response_cache_size: int = Field(default=2_000, description="Max cached list responses per worker (0 = disabled)")
+    response_cache_ttl: int = Field(default=600, description="Cached list response lifetime in seconds")
+    response_cache_redis: bool = Field(default=False, description="Share cached list responses across workers via Redis")
+
+    # Parallel scoring (brand/region sweeps)
+    scoring_workers: int = Field(default=1, description="Scoring worker processes, started with the app (1 = serial, 0 = CPU count)")
+    parallel_min_pairs: int = Field(default=20_000, description="Smallest sweep (coach-job pairs) run in parallel")
+
+    # Ranked list responses (candidates, matches)
+    fast_json_responses: bool = Field(default=False, description="Build ranked responses from ORM rows and encode with orjson, skipping response_model validation")
+
+    # Stored match rows: engagement recency decays with time, not with edits
+    engagement_refresh_seconds: int = Field(
+        default=3_600,
+        description="Seconds between engagement re-aging passes per worker (0 = never)",
+    )
+
+    # Buffered event logging (AuditLog, MatchEvent)
+    event_flush_rows: int = Field(default=500, description="Pending events that trigger a flush")
+    event_flush_seconds: float = Field(default=1.0, description="Max seconds an event waits before being written")
+    event_buffer_max: int = Field(default=50_000, description="Max pending events per worker (extra events are dropped)")
+
+    # Event table partitions (audit_logs, match_events)
+    partition_months_ahead: int = Field(default=3, description="Monthly partitions created ahead of the current month")
+    event_retention_months: int = Field(default=24, description="Full months of events kept (0 = keep forever)")
+    event_retention_drop: bool = Field(default=True, description="Drop expired partitions (false = detach only)")
+
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
     log_format: str = Field(default="json", description="Log format: json or text")
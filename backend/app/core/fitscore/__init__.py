@@ -9,13 +9,49 @@ Deterministic algorithm for matching coaches with jobs based on:
 - Engagement signals
 """
 
+from app.core.fitscore.compiled import CompiledJob, compiled_job_cache, get_compiled_job
+from app.core.fitscore.encoding import (
+    EncodedCoach,
+    EncodedJob,
+    ProfileCache,
+    Vocabulary,
+    coach_profile_cache,
+)
 from app.core.fitscore.engine import FitScoreEngine, MatchScore
-from app.core.fitscore.presets import WEIGHTING_PRESETS, get_preset, validate_preset
+from app.core.fitscore.presets import (
+    COMPONENTS,
+    PRESET_NAMES,
+    PRESET_WEIGHT_MATRIX,
+    WEIGHTING_PRESETS,
+    build_weight_matrix,
+    get_preset,
+    get_preset_weights,
+    parse_custom_weights,
+    validate_preset,
+)
+from app.core.fitscore.ranking import PruningStats, TopKSelector, pruning_stats
 
 __all__ = [
     "FitScoreEngine",
     "MatchScore",
+    "EncodedCoach",
+    "EncodedJob",
+    "ProfileCache",
+    "Vocabulary",
+    "coach_profile_cache",
+    "CompiledJob",
+    "compiled_job_cache",
+    "get_compiled_job",
+    "PruningStats",
+    "TopKSelector",
+    "pruning_stats",
+    "COMPONENTS",
+    "PRESET_NAMES",
+    "PRESET_WEIGHT_MATRIX",
     "WEIGHTING_PRESETS",
+    "build_weight_matrix",
     "get_preset",
+    "get_preset_weights",
+    "parse_custom_weights",
     "validate_preset",
 ]
\ No newline at end of file
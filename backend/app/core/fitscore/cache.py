@@ -0,0 +1,439 @@
+"""Versioned FitScore result cache
+
+Entries are keyed by (coach id, coach last_updated, job id, job updated_at,
+preset). Editing either profile bumps its timestamp and therefore changes
+the key, so entries never need explicit invalidation; stale versions simply
+stop being requested and age out.
+
+Two tiers:
+- LocalScoreCache: per-process LRU with size and TTL eviction
+- RedisScoreCache: optional shared tier so workers reuse each other's results
+
+The engagement component depends on the clock (30-day recency bonus), so
+the TTL also bounds how long a cached score may lag behind it.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from app.core.fitscore.engine import MatchScore
+
+logger = logging.getLogger(__name__)
+
+ScoreKey = Tuple[Hashable, Hashable, Hashable, Hashable, str]
+
+
+def score_key(coach, job, preset: Optional[str] = None) -> ScoreKey:
+    """
+    Build the cache key for a Coach/Job row pair
+
+    Args:
+        coach: Coach model instance
+        job: Job model instance
+        preset: Weighting preset (defaults to the job's own)
+
+    Returns:
+        ScoreKey: (coach id, last_updated, job id, updated_at, preset)
+    """
+    return (
+        coach.id,
+        coach.last_updated,
+        job.id,
+        job.updated_at,
+        preset or job.weighting_preset,
+    )
+
+
+@dataclass(frozen=True)
+class CachedScore:
+    """
+    A cached result: the score plus the unrounded sub-scores behind it
+    """
+
+    score: MatchScore
+    components: Dict[str, float]
+
+    def to_json(self) -> str:
+        """Serialize for the Redis tier (floats round-trip exactly)"""
+        return json.dumps({"score": self.score.to_dict(), "components": self.components})
+
+    @classmethod
+    def from_json(cls, payload) -> "CachedScore":
+        """Deserialize a value written by to_json"""
+        data = json.loads(payload)
+        return cls(score=MatchScore(**data["score"]), components=data["components"])
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters for a score cache
+
+    hits: lookups served by either tier
+    misses: lookups that had to compute the score
+    evictions: local entries dropped to respect maxsize
+    expirations: local entries dropped because their TTL passed
+    remote_hits: hits served by the Redis tier (subset of hits)
+    remote_errors: Redis operations that failed (treated as misses)
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    remote_hits: int = 0
+    remote_errors: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, counter: str, amount: int = 1) -> None:
+        """Increment a counter by name"""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        """Convert to dictionary for logging/metrics"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "remote_hits": self.remote_hits,
+            "remote_errors": self.remote_errors,
+            "hit_rate": round(self.hit_rate, 3),
+        }
+
+
+class LocalScoreCache:
+    """
+    Thread-safe in-process LRU with size and TTL eviction
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 100_000,
+        ttl: float = 3600.0,
+        stats: Optional[CacheStats] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = stats if stats is not None else CacheStats()
+        self._clock = clock
+        self._entries: "OrderedDict[ScoreKey, Tuple[float, CachedScore]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: ScoreKey) -> Optional[CachedScore]:
+        """
+        Look up an entry, dropping it if expired
+
+        Args:
+            key: Score key
+
+        Returns:
+            Optional[CachedScore]: Cached value, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                self.stats.record("expirations")
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: ScoreKey, value: CachedScore) -> None:
+        """
+        Store an entry, evicting least recently used entries over maxsize
+
+        Args:
+            key: Score key
+            value: Value to cache
+        """
+        evicted = 0
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                evicted += 1
+        if evicted:
+            self.stats.record("evictions", evicted)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisScoreCache:
+    """
+    Shared tier backed by Redis (or any client with get/set(ex=), mget and pipeline)
+    """
+
+    def __init__(self, client, ttl: int = 3600, prefix: str = "fitscore:v1:"):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, ttl: int = 3600) -> "RedisScoreCache":
+        """
+        Connect to Redis (requires the optional redis package)
+
+        Args:
+            url: Redis connection string (settings.redis_url)
+            ttl: Entry lifetime in seconds
+
+        Returns:
+            RedisScoreCache: Shared cache tier
+        """
+        import redis
+
+        return cls(redis.Redis.from_url(url), ttl=ttl)
+
+    def _redis_key(self, key: ScoreKey) -> str:
+        """Render a score key as a Redis key"""
+        parts = [part.isoformat() if isinstance(part, datetime) else str(part) for part in key]
+        return self.prefix + "|".join(parts)
+
+    def get(self, key: ScoreKey) -> Optional[CachedScore]:
+        """Look up an entry"""
+        payload = self.client.get(self._redis_key(key))
+        if payload is None:
+            return None
+        return CachedScore.from_json(payload)
+
+    def set(self, key: ScoreKey, value: CachedScore) -> None:
+        """Store an entry with the tier's TTL"""
+        self.client.set(self._redis_key(key), value.to_json(), ex=self.ttl)
+
+    def get_many(self, keys: Sequence[ScoreKey]) -> List[Optional[CachedScore]]:
+        """Look up entries in one MGET round trip (None where missing)"""
+        if not keys:
+            return []
+        payloads = self.client.mget([self._redis_key(key) for key in keys])
+        return [None if payload is None else CachedScore.from_json(payload) for payload in payloads]
+
+    def set_many(self, items: Dict[ScoreKey, CachedScore]) -> None:
+        """Store entries with the tier's TTL in one pipelined round trip"""
+        if not items:
+            return
+        pipe = self.client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(self._redis_key(key), value.to_json(), ex=self.ttl)
+        pipe.execute()
+
+
+class ScoreCache:
+    """
+    Two-tier score cache: local LRU in front of an optional Redis tier
+
+    Redis failures are logged and counted, never raised: a cache outage
+    degrades to computing scores, not to failing requests.
+    """
+
+    def __init__(
+        self,
+        local: Optional[LocalScoreCache] = None,
+        remote: Optional[RedisScoreCache] = None,
+        stats: Optional[CacheStats] = None,
+    ):
+        self.stats = stats if stats is not None else CacheStats()
+        self.local = local if local is not None else LocalScoreCache(stats=self.stats)
+        self.local.stats = self.stats
+        self.remote = remote
+
+    @classmethod
+    def create(cls, maxsize: int, ttl: int, redis_url: Optional[str] = None) -> "ScoreCache":
+        """
+        Build a cache from configuration
+
+        Args:
+            maxsize: Local tier capacity
+            ttl: Entry lifetime in seconds (both tiers)
+            redis_url: Enables the Redis tier when set
+
+        Returns:
+            ScoreCache: Configured cache
+        """
+        stats = CacheStats()
+        remote = RedisScoreCache.from_url(redis_url, ttl=ttl) if redis_url else None
+        return cls(LocalScoreCache(maxsize=maxsize, ttl=ttl, stats=stats), remote, stats)
+
+    def get(self, key: ScoreKey) -> Optional[CachedScore]:
+        """
+        Look up an entry in the local tier, then the Redis tier
+
+        Remote hits are copied into the local tier.
+
+        Args:
+            key: Score key
+
+        Returns:
+            Optional[CachedScore]: Cached value, or None
+        """
+        value = self.local.get(key)
+        if value is not None:
+            self.stats.record("hits")
+            return value
+
+        if self.remote is not None:
+            try:
+                value = self.remote.get(key)
+            except Exception:
+                logger.warning("Score cache read failed", exc_info=True)
+                self.stats.record("remote_errors")
+                value = None
+            if value is not None:
+                self.local.set(key, value)
+                self.stats.record("hits")
+                self.stats.record("remote_hits")
+                return value
+
+        self.stats.record("misses")
+        return None
+
+    def set(self, key: ScoreKey, value: CachedScore) -> None:
+        """
+        Store an entry in both tiers
+
+        Args:
+            key: Score key
+            value: Value to cache
+        """
+        self.local.set(key, value)
+        if self.remote is not None:
+            try:
+                self.remote.set(key, value)
+            except Exception:
+                logger.warning("Score cache write failed", exc_info=True)
+                self.stats.record("remote_errors")
+
+    def get_many(self, keys: Sequence[ScoreKey]) -> Dict[ScoreKey, CachedScore]:
+        """
+        Look up many entries: local tier first, then one Redis round trip for the rest
+
+        Remote hits are copied into the local tier.
+
+        Args:
+            keys: Score keys
+
+        Returns:
+            Dict[ScoreKey, CachedScore]: Cached values; missing keys are absent
+        """
+        found = {}
+        missing = []
+        for key in keys:
+            value = self.local.get(key)
+            if value is None:
+                missing.append(key)
+            else:
+                found[key] = value
+
+        if missing and self.remote is not None:
+            try:
+                values = self.remote.get_many(missing)
+            except Exception:
+                logger.warning("Score cache read failed", exc_info=True)
+                self.stats.record("remote_errors")
+                values = [None] * len(missing)
+            remote_hits = 0
+            for key, value in zip(missing, values, strict=True):
+                if value is not None:
+                    self.local.set(key, value)
+                    found[key] = value
+                    remote_hits += 1
+            if remote_hits:
+                self.stats.record("remote_hits", remote_hits)
+
+        if found:
+            self.stats.record("hits", len(found))
+        if len(keys) > len(found):
+            self.stats.record("misses", len(keys) - len(found))
+        return found
+
+    def set_many(self, items: Dict[ScoreKey, CachedScore]) -> None:
+        """
+        Store many entries in both tiers (one Redis round trip)
+
+        Args:
+            items: Values by score key
+        """
+        for key, value in items.items():
+            self.local.set(key, value)
+        if items and self.remote is not None:
+            try:
+                self.remote.set_many(items)
+            except Exception:
+                logger.warning("Score cache write failed", exc_info=True)
+                self.stats.record("remote_errors")
+
+    def get_or_compute_many(
+        self, keys: Sequence[ScoreKey], compute: Callable[[int], CachedScore]
+    ) -> List[CachedScore]:
+        """
+        Return cached values for keys, computing and storing the misses
+
+        Reads and writes each tier at most once, so a whole refresh costs
+        two Redis round trips instead of two per pair.
+
+        Args:
+            keys: Score keys
+            compute: Callable producing the value for keys[index]
+
+        Returns:
+            List[CachedScore]: Values in key order
+        """
+        found = self.get_many(keys)
+        computed = {}
+        values = []
+        for index, key in enumerate(keys):
+            value = found.get(key)
+            if value is None:
+                value = computed.get(key)
+                if value is None:
+                    value = computed[key] = compute(index)
+            values.append(value)
+        self.set_many(computed)
+        return values
+
+    def get_or_compute(self, key: ScoreKey, compute: Callable[[], CachedScore]) -> CachedScore:
+        """
+        Return the cached value for key, computing and storing it on a miss
+
+        Args:
+            key: Score key
+            compute: Zero-argument callable producing the value
+
+        Returns:
+            CachedScore: Cached or newly computed value
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop all local entries (the Redis tier expires on its own)"""
+        self.local.clear()
@@ -0,0 +1,119 @@
+"""Compiled job queries for FitScore
+
+A CompiledJob is the job side of a match, resolved once: frozen requirement
+sets, normalized city/state, the preset weight vector and the bitset
+encoding used by the engine. Scoring a pool of coaches against one job then
+does no per-coach job parsing, normalization or preset lookup.
+
+Compiled jobs are immutable and hashable, and are cached by
+(job id, updated_at) so repeated candidate views skip the compile step.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Tuple
+
+from app.core.fitscore.encoding import EncodedJob, ProfileCache, normalize_location
+from app.core.fitscore.presets import get_preset_weights
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledJob:
+    """
+    Job requirements compiled for repeated scoring
+    """
+
+    required_certifications: FrozenSet[str]
+    preferred_certifications: FrozenSet[str]
+    min_experience: int
+    required_availability: FrozenSet[str]
+    city: str
+    state: str
+    culture_tags: FrozenSet[str]
+    preset: str
+    weights: Tuple[float, ...]
+    encoded: EncodedJob
+
+    @classmethod
+    def compile(cls, job_data: Dict, preset: str = "balanced") -> "CompiledJob":
+        """
+        Compile a job dict (same shape accepted by FitScoreEngine.calculate_match)
+
+        Args:
+            job_data: Job listing data
+            preset: Weighting preset name
+
+        Returns:
+            CompiledJob: Compiled job query
+
+        Raises:
+            ValueError: If preset name doesn't exist
+        """
+        city, state = normalize_location(job_data)
+
+        return cls(
+            required_certifications=frozenset(job_data.get("required_certifications", [])),
+            preferred_certifications=frozenset(job_data.get("preferred_certifications", [])),
+            min_experience=job_data.get("min_experience", 0),
+            required_availability=frozenset(job_data.get("required_availability", [])),
+            city=city,
+            state=state,
+            culture_tags=frozenset(job_data.get("culture_tags", [])),
+            preset=preset,
+            weights=get_preset_weights(preset),
+            encoded=EncodedJob.from_dict(job_data),
+        )
+
+
+def compile_job_row(job) -> CompiledJob:
+    """
+    Compile a Job ORM row using its own weighting preset
+
+    Args:
+        job: Job model instance
+
+    Returns:
+        CompiledJob: Compiled job query
+    """
+    return CompiledJob.compile(
+        {
+            "required_certifications": job.required_certifications,
+            "preferred_certifications": job.preferred_certifications,
+            "min_experience": job.min_experience,
+            "required_availability": job.required_availability,
+            "city": job.city,
+            "state": job.state,
+            "culture_tags": job.culture_tags,
+        },
+        preset=job.weighting_preset,
+    )
+
+
+def get_compiled_job(job) -> CompiledJob:
+    """
+    Get the compiled form of a Job ORM row, compiling only on a cache miss
+
+    Args:
+        job: Job model instance
+
+    Returns:
+        CompiledJob: Cached compiled job query
+    """
+    return compiled_job_cache.get_or_create(job.id, job.updated_at, lambda: compile_job_row(job))
+
+
+def as_compiled_job(job) -> CompiledJob:
+    """
+    Accept either a compiled job or a Job ORM row
+
+    Args:
+        job: CompiledJob or Job model instance
+
+    Returns:
+        CompiledJob: The job itself, or the row's cached compiled form
+    """
+    if isinstance(job, CompiledJob):
+        return job
+    return get_compiled_job(job)
+
+
+compiled_job_cache = ProfileCache(maxsize=10_000)
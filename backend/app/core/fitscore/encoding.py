@@ -0,0 +1,351 @@
+"""Bitset encoding of coach and job profiles for FitScore
+
+Certification names, availability slots ("Mon AM", ...) and culture tags are
+interned into per-kind vocabularies so that a profile's lists become plain
+integers. Set logic in the engine then reduces to integer operations:
+- subset check: required & ~have == 0
+- overlap size: (a & b).bit_count()
+
+Vocabularies grow at runtime when unseen tokens appear, so no fixed tag list
+has to be maintained. Encoded profiles are immutable, slotted structs and
+can be cached per coach/job keyed by their update timestamp. Coach rows are
+encoded straight from their attributes (no ISO string round-trip for
+last_updated).
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+
+class Vocabulary:
+    """
+    Thread-safe interning table mapping tokens to bit positions
+
+    Bit positions are assigned on first sight and never change for the life
+    of the process, so encoded masks stay comparable across requests.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._positions: Dict[Hashable, int] = {}
+        self._tokens: list = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __contains__(self, token: Hashable) -> bool:
+        return token in self._positions
+
+    def bit(self, token: Hashable) -> int:
+        """
+        Get the bit for a token, interning it if new
+
+        Args:
+            token: Token to look up (e.g. "NASM-CPT", "Mon AM")
+
+        Returns:
+            int: Single-bit mask for the token
+        """
+        position = self._positions.get(token)
+        if position is None:
+            with self._lock:
+                position = self._positions.get(token)
+                if position is None:
+                    position = len(self._tokens)
+                    self._tokens.append(token)
+                    self._positions[token] = position
+        return 1 << position
+
+    def encode(self, tokens: Iterable[Hashable]) -> int:
+        """
+        Encode a collection of tokens as a bitset
+
+        Args:
+            tokens: Tokens to encode (duplicates are ignored)
+
+        Returns:
+            int: Bitset with one bit per distinct token
+        """
+        mask = 0
+        for token in tokens:
+            mask |= self.bit(token)
+        return mask
+
+    def decode(self, mask: int) -> Set[Hashable]:
+        """
+        Decode a bitset back into its tokens
+
+        Args:
+            mask: Bitset produced by encode()
+
+        Returns:
+            Set: Tokens whose bits are set
+        """
+        tokens = set()
+        position = 0
+        while mask:
+            if mask & 1:
+                tokens.add(self._tokens[position])
+            mask >>= 1
+            position += 1
+        return tokens
+
+
+# Process-wide vocabularies (coach and job tokens must share a vocabulary)
+CERTIFICATIONS = Vocabulary("certifications")
+TIME_SLOTS = Vocabulary("time_slots")
+CULTURE_TAGS = Vocabulary("culture_tags")
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedCoach:
+    """
+    Coach-side scoring inputs with list fields encoded as bitsets
+    """
+
+    certs: int
+    years_experience: int
+    slots: int
+    city: str
+    state: str
+    tags: int
+    profile_completeness: float
+    last_updated: Optional[datetime]
+    has_verified_video: bool
+
+    @classmethod
+    def from_dict(cls, coach_data: Dict) -> "EncodedCoach":
+        """
+        Encode a coach dict (same shape accepted by FitScoreEngine.calculate_match)
+
+        Args:
+            coach_data: Coach profile data
+
+        Returns:
+            EncodedCoach: Encoded profile
+        """
+        city, state = normalize_location(coach_data)
+
+        return cls(
+            certs=encode_coach_certifications(coach_data),
+            years_experience=coach_data.get("years_experience", 0),
+            slots=TIME_SLOTS.encode(coach_data.get("available_times", [])),
+            city=city,
+            state=state,
+            tags=encode_coach_tags(coach_data),
+            profile_completeness=coach_data.get("profile_completeness", 0.0),
+            last_updated=parse_last_updated(coach_data.get("last_updated")),
+            has_verified_video=bool(coach_data.get("verified_video_url")),
+        )
+
+    @classmethod
+    def from_row(cls, coach) -> "EncodedCoach":
+        """
+        Encode a Coach ORM row (or any object with the same attributes)
+
+        Args:
+            coach: Coach model instance
+
+        Returns:
+            EncodedCoach: Encoded profile
+        """
+        city, state = normalize_location({"city": coach.city, "state": coach.state})
+        tags = CULTURE_TAGS.encode(coach.lifestyle_tags or [])
+        tags |= CULTURE_TAGS.encode(coach.movement_tags or [])
+        tags |= CULTURE_TAGS.encode(coach.instruction_tags or [])
+
+        return cls(
+            certs=encode_coach_certifications({"certifications": coach.certifications or []}),
+            years_experience=coach.years_experience or 0,
+            slots=TIME_SLOTS.encode(coach.available_times or []),
+            city=city,
+            state=state,
+            tags=tags,
+            profile_completeness=float(coach.profile_completeness) if coach.profile_completeness else 0.0,
+            last_updated=coach.last_updated,
+            has_verified_video=bool(coach.verified_video_url),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedJob:
+    """
+    Job-side scoring inputs with list fields encoded as bitsets
+    """
+
+    required_certs: int
+    preferred_certs: int
+    min_experience: int
+    required_slots: int
+    city: str
+    state: str
+    culture_tags: int
+
+    @classmethod
+    def from_dict(cls, job_data: Dict) -> "EncodedJob":
+        """
+        Encode a job dict (same shape accepted by FitScoreEngine.calculate_match)
+
+        Args:
+            job_data: Job listing data
+
+        Returns:
+            EncodedJob: Encoded profile
+        """
+        city, state = normalize_location(job_data)
+
+        return cls(
+            required_certs=CERTIFICATIONS.encode(job_data.get("required_certifications", [])),
+            preferred_certs=CERTIFICATIONS.encode(job_data.get("preferred_certifications", [])),
+            min_experience=job_data.get("min_experience", 0),
+            required_slots=TIME_SLOTS.encode(job_data.get("required_availability", [])),
+            city=city,
+            state=state,
+            culture_tags=CULTURE_TAGS.encode(job_data.get("culture_tags", [])),
+        )
+
+
+class ProfileCache:
+    """
+    Bounded LRU cache of encoded profiles
+
+    Keys are (entity id, version) where version is the row's update timestamp,
+    so an edited profile is simply a new key and stale entries age out.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[Hashable, Hashable], object]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_create(self, entity_id: Hashable, version: Hashable, factory: Callable[[], object]):
+        """
+        Return the cached profile for (entity_id, version), building it on a miss
+
+        Args:
+            entity_id: Coach or job ID
+            version: Update timestamp (or any value that changes on edit)
+            factory: Zero-argument callable that builds the encoded profile
+
+        Returns:
+            The cached or newly built profile
+        """
+        key = (entity_id, version)
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+
+        value = factory()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop all cached profiles"""
+        with self._lock:
+            self._entries.clear()
+
+
+def encode_coach_row(coach) -> EncodedCoach:
+    """
+    Encode a Coach ORM row
+
+    Args:
+        coach: Coach model instance
+
+    Returns:
+        EncodedCoach: Encoded profile
+    """
+    return EncodedCoach.from_row(coach)
+
+
+def get_encoded_coach(coach) -> EncodedCoach:
+    """
+    Get the encoded form of a Coach ORM row, encoding only on a cache miss
+
+    Args:
+        coach: Coach model instance
+
+    Returns:
+        EncodedCoach: Cached encoded profile
+    """
+    return coach_profile_cache.get_or_create(
+        coach.id, coach.last_updated, lambda: encode_coach_row(coach)
+    )
+
+
+def as_encoded_coach(coach) -> EncodedCoach:
+    """
+    Accept either an encoded profile or a Coach ORM row
+
+    Args:
+        coach: EncodedCoach or Coach model instance
+
+    Returns:
+        EncodedCoach: The profile itself, or the row's cached encoding
+    """
+    if isinstance(coach, EncodedCoach):
+        return coach
+    return get_encoded_coach(coach)
+
+
+coach_profile_cache = ProfileCache(maxsize=50_000)
+
+
+def encode_coach_certifications(coach_data: Dict) -> int:
+    """Encode a coach's certification names (dict items or plain strings)"""
+    mask = 0
+    for cert in coach_data.get("certifications", []):
+        if isinstance(cert, dict):
+            mask |= CERTIFICATIONS.bit(cert.get("name", ""))
+        else:
+            mask |= CERTIFICATIONS.bit(str(cert))
+    return mask
+
+
+def encode_coach_tags(coach_data: Dict) -> int:
+    """Encode the union of a coach's lifestyle/movement/instruction tags"""
+    mask = CULTURE_TAGS.encode(coach_data.get("lifestyle_tags", []))
+    mask |= CULTURE_TAGS.encode(coach_data.get("movement_tags", []))
+    mask |= CULTURE_TAGS.encode(coach_data.get("instruction_tags", []))
+    return mask
+
+
+def normalize_location(data: Dict) -> Tuple[str, str]:
+    """Normalize (city, state) for case-insensitive comparison"""
+    return data.get("city", "").strip().lower(), data.get("state", "").strip().upper()
+
+
+def parse_last_updated(value) -> Optional[datetime]:
+    """
+    Parse a coach's last_updated value into a datetime
+
+    Accepts datetimes or ISO-8601 strings (with optional "Z" suffix).
+    Returns None for missing or unparseable values.
+    """
+    if not value:
+        return None
+
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except (ValueError, AttributeError):
+            return None
+
+    if isinstance(value, datetime):
+        return value
+
+    return None
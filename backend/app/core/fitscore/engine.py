@@ -9,11 +9,120 @@ Deterministic scoring algorithm that ranks coach-job matches based on:
 6. Engagement (profile quality and recency)
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
 from dataclasses import dataclass
+from datetime import datetime
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from app.core.fitscore.compiled import CompiledJob, as_compiled_job
+from app.core.fitscore.encoding import (
+    CERTIFICATIONS,
+    CULTURE_TAGS,
+    TIME_SLOTS,
+    EncodedCoach,
+    EncodedJob,
+    as_encoded_coach,
+    encode_coach_certifications,
+    encode_coach_tags,
+    normalize_location,
+    parse_last_updated,
+)
+from app.core.fitscore.presets import get_preset_weights
+from app.core.fitscore.ranking import GridRanking, PruningStats, TopKSelector
+
+# Profile fields read by each score component: (coach fields, job fields).
+# Drives partial re-scoring: an edit only recomputes the components whose
+# inputs it touched. Preset weights are not inputs to any component.
+COMPONENT_INPUTS: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    "cert_score": (
+        ("certifications",),
+        ("required_certifications", "preferred_certifications"),
+    ),
+    "experience_score": (("years_experience",), ("min_experience",)),
+    "availability_score": (("available_times",), ("required_availability",)),
+    "location_score": (("city", "state"), ("city", "state")),
+    "culture_score": (
+        ("lifestyle_tags", "movement_tags", "instruction_tags"),
+        ("culture_tags",),
+    ),
+    "engagement_score": (
+        ("profile_completeness", "last_updated", "verified_video_url"),
+        (),
+    ),
+}
+
+# Every coach / job field the engine reads, in first-use order (scoring
+# queries can select just these columns instead of whole rows)
+COACH_INPUT_FIELDS: Tuple[str, ...] = tuple(dict.fromkeys(
+    name for coach_inputs, _ in COMPONENT_INPUTS.values() for name in coach_inputs
+))
+JOB_INPUT_FIELDS: Tuple[str, ...] = tuple(dict.fromkeys(
+    name for _, job_inputs in COMPONENT_INPUTS.values() for name in job_inputs
+))
+
+
+def components_for_fields(
+    coach_fields: Iterable[str] = (), job_fields: Iterable[str] = ()
+) -> FrozenSet[str]:
+    """
+    Get the score components affected by a set of changed profile fields
+
+    Args:
+        coach_fields: Changed coach fields
+        job_fields: Changed job fields
+
+    Returns:
+        FrozenSet[str]: Affected component names (MatchScore field names)
+    """
+    coach_fields = set(coach_fields)
+    job_fields = set(job_fields)
+    return frozenset(
+        component
+        for component, (coach_inputs, job_inputs) in COMPONENT_INPUTS.items()
+        if coach_fields.intersection(coach_inputs) or job_fields.intersection(job_inputs)
+    )
+
+
+# Components that drop to 0.0 when a job requirement is missed (all
+# required certifications / all required slots), whatever else the coach has
+HARD_GATES: Tuple[str, ...] = ("cert_score", "availability_score")
+
+# Coaches per block in grid sweeps (bounds the per-block working set)
+GRID_BLOCK_SIZE = 512
+
+# Days after a profile update that still earn the engagement recency bonus
+ENGAGEMENT_RECENCY_DAYS = 30
+
+# A coach for the typed entry points: encoded profile or Coach ORM row
+CoachInput = Union[EncodedCoach, Any]
+
+# A job for the typed entry points: compiled query or Job ORM row
+JobInput = Union[CompiledJob, Any]
+
+
+def resolve_clock(as_of: Optional[datetime] = None) -> datetime:
+    """
+    Get the clock reading used for engagement recency
+
+    Args:
+        as_of: Explicit timestamp (defaults to now)
 
-from app.core.fitscore.presets import get_preset
+    Returns:
+        datetime: Naive timestamp, comparable with stored last_updated values
+    """
+    if as_of is None:
+        return datetime.now()
+    return as_of.replace(tzinfo=None)
 
 
 @dataclass
@@ -49,38 +158,591 @@ class FitScoreEngine:
     """
 
     def calculate_match(
-        self, coach_data: Dict, job_data: Dict, preset: str = "balanced"
+        self,
+        coach_data: Dict,
+        job_data: Dict,
+        preset: str = "balanced",
+        as_of: Optional[datetime] = None,
     ) -> MatchScore:
         """
         Calculate complete FitScore for a coach-job pair
 
+        Thin adapter over the typed path: the dicts are encoded and scored
+        exactly as score_compiled would score them.
+
         Args:
             coach_data: Coach profile data
             job_data: Job listing data
             preset: Weighting preset name
+            as_of: Clock reading for the engagement recency check (defaults to now)
 
         Returns:
             MatchScore: Complete score breakdown
         """
         # Get weighting values for this preset
-        weights = get_preset(preset)
-
-        # Calculate all sub-scores
-        cert_score = self._score_certifications(coach_data, job_data)
-        exp_score = self._score_experience(coach_data, job_data)
-        avail_score = self._score_availability(coach_data, job_data)
-        loc_score = self._score_location(coach_data, job_data)
-        culture_score = self._score_culture(coach_data, job_data)
-        engage_score = self._score_engagement(coach_data)
-
-        # Calculate weighted final score
-        fitscore = (
-            weights["certifications"] * cert_score
-            + weights["experience"] * exp_score
-            + weights["availability"] * avail_score
-            + weights["location"] * loc_score
-            + weights["cultural_fit"] * culture_score
-            + weights["engagement"] * engage_score
+        weights = get_preset_weights(preset)
+
+        return self._score_profiles(
+            EncodedCoach.from_dict(coach_data),
+            EncodedJob.from_dict(job_data),
+            weights,
+            resolve_clock(as_of),
+        )
+
+    def compile_job(self, job_data: Dict, preset: str = "balanced") -> CompiledJob:
+        """
+        Compile a job's requirements and preset weights for repeated scoring
+
+        Args:
+            job_data: Job listing data
+            preset: Weighting preset name
+
+        Returns:
+            CompiledJob: Compiled job query, reusable for any number of coaches
+        """
+        return CompiledJob.compile(job_data, preset)
+
+    def score_batch(
+        self,
+        coaches: Sequence[Dict],
+        job_data: Dict,
+        preset: str = "balanced",
+        as_of: Optional[datetime] = None,
+    ) -> List[MatchScore]:
+        """
+        Calculate FitScores for many coaches against a single job
+
+        The job is compiled once for the whole batch instead of being
+        re-parsed for every coach. Results are identical to calling
+        calculate_match for each coach.
+
+        Args:
+            coaches: Coach profile data, one dict per coach
+            job_data: Job listing data
+            preset: Weighting preset name
+            as_of: Clock reading for the engagement recency check (defaults to now)
+
+        Returns:
+            List[MatchScore]: Score breakdowns in the same order as coaches
+        """
+        return self.score_compiled(
+            [EncodedCoach.from_dict(coach_data) for coach_data in coaches],
+            self.compile_job(job_data, preset),
+            as_of,
+        )
+
+    def score_compiled(
+        self,
+        coaches: Sequence[CoachInput],
+        job: JobInput,
+        as_of: Optional[datetime] = None,
+    ) -> List[MatchScore]:
+        """
+        Calculate FitScores for encoded coaches against a compiled job
+
+        ORM rows are accepted too and resolved through the caches in
+        app.core.fitscore.encoding and app.core.fitscore.compiled, so
+        unchanged coaches and jobs are not re-encoded between requests.
+        The whole sweep uses a single clock reading.
+
+        Args:
+            coaches: Encoded coach profiles or Coach rows
+            job: Compiled job query or Job row (carries its own preset weights)
+            as_of: Clock reading for the engagement recency check (defaults to now)
+
+        Returns:
+            List[MatchScore]: Score breakdowns in the same order as coaches
+        """
+        job = as_compiled_job(job)
+        encoded_job = job.encoded
+        weights = job.weights
+        now = resolve_clock(as_of)
+        return [
+            self._score_profiles(as_encoded_coach(coach), encoded_job, weights, now)
+            for coach in coaches
+        ]
+
+    def score_jobs_for_coach(
+        self,
+        coach_data: Dict,
+        jobs: Sequence[Dict],
+        presets: Optional[Sequence[str]] = None,
+        as_of: Optional[datetime] = None,
+    ) -> List[MatchScore]:
+        """
+        Calculate FitScores for a single coach against many jobs
+
+        Mirror of score_batch: the coach profile is parsed once and each job
+        is scored with its own weighting preset.
+
+        Args:
+            coach_data: Coach profile data
+            jobs: Job listing data, one dict per job
+            presets: Weighting preset name per job (defaults to "balanced")
+            as_of: Clock reading for the engagement recency check (defaults to now)
+
+        Returns:
+            List[MatchScore]: Score breakdowns in the same order as jobs
+        """
+        if presets is None:
+            presets = ["balanced"] * len(jobs)
+        elif len(presets) != len(jobs):
+            raise ValueError("presets must have one entry per job")
+
+        return self.score_compiled_jobs(
+            EncodedCoach.from_dict(coach_data),
+            [
+                self.compile_job(job_data, preset)
+                for job_data, preset in zip(jobs, presets, strict=True)
+            ],
+            as_of,
+        )
+
+    def score_compiled_jobs(
+        self,
+        coach: CoachInput,
+        jobs: Sequence[JobInput],
+        as_of: Optional[datetime] = None,
+    ) -> List[MatchScore]:
+        """
+        Calculate FitScores for an encoded coach against compiled jobs
+
+        Args:
+            coach: Encoded coach profile or Coach row
+            jobs: Compiled job queries or Job rows (each carries its own preset weights)
+            as_of: Clock reading for the engagement recency check (defaults to now)
+
+        Returns:
+            List[MatchScore]: Score breakdowns in the same order as jobs
+        """
+        coach = as_encoded_coach(coach)
+        now = resolve_clock(as_of)
+        scores = []
+        for job in jobs:
+            job = as_compiled_job(job)
+            scores.append(self._score_profiles(coach, job.encoded, job.weights, now))
+        return scores
+
+    def rank_candidates(
+        self,
+        coaches: Sequence[CoachInput],
+        job: JobInput,
+        threshold: float,
+        limit: int,
+        stats: Optional[PruningStats] = None,
+        as_of: Optional[datetime] = None,
+    ) -> List[Tuple[int, MatchScore]]:
+        """
+        Select the top coaches for a job without scoring the whole pool
+
+        Equivalent to scoring every coach, keeping those with
+        fitscore >= threshold, stable-sorting by fitscore descending and
+        slicing to limit. Coaches whose upper bound (from the cheap gating
+        components) cannot reach the threshold or beat the current k-th best
+        are skipped before culture and engagement are computed.
+
+        Args:
+            coaches: Encoded coach profiles or Coach rows, in tie-break order
+            job: Compiled job query or Job row
+            threshold: Minimum FitScore to include
+            limit: Maximum number of results
+            stats: Optional counters to update
+            as_of: Clock reading for the engagement recency check (defaults to now)
+
+        Returns:
+            List[Tuple[int, MatchScore]]: (index into coaches, score), best first
+        """
+        if stats is None:
+            stats = PruningStats()
+
+        selector = TopKSelector(limit)
+        job = as_compiled_job(job)
+        encoded_job = job.encoded
+        weights = job.weights
+        now = resolve_clock(as_of)
+
+        for index, coach in enumerate(coaches):
+            score = self._score_bounded(
+                as_encoded_coach(coach), encoded_job, weights, threshold, selector, stats, now
+            )
+            if score is not None:
+                selector.push(index, score)
+
+        return selector.results()
+
+    def rank_jobs(
+        self,
+        coach: CoachInput,
+        jobs: Sequence[JobInput],
+        thresholds: Sequence[float],
+        limit: int,
+        stats: Optional[PruningStats] = None,
+        as_of: Optional[datetime] = None,
+    ) -> List[Tuple[int, MatchScore]]:
+        """
+        Select the top jobs for a coach without scoring every job
+
+        Mirror of rank_candidates; each job is filtered by its own threshold.
+
+        Args:
+            coach: Encoded coach profile or Coach row
+            jobs: Compiled job queries or Job rows, in tie-break order
+            thresholds: Minimum FitScore per job
+            limit: Maximum number of results
+            stats: Optional counters to update
+            as_of: Clock reading for the engagement recency check (defaults to now)
+
+        Returns:
+            List[Tuple[int, MatchScore]]: (index into jobs, score), best first
+        """
+        if len(thresholds) != len(jobs):
+            raise ValueError("thresholds must have one entry per job")
+        if stats is None:
+            stats = PruningStats()
+
+        selector = TopKSelector(limit)
+        coach = as_encoded_coach(coach)
+        now = resolve_clock(as_of)
+
+        for index, (job, threshold) in enumerate(zip(jobs, thresholds, strict=True)):
+            job = as_compiled_job(job)
+            score = self._score_bounded(
+                coach, job.encoded, job.weights, threshold, selector, stats, now
+            )
+            if score is not None:
+                selector.push(index, score)
+
+        return selector.results()
+
+    def _score_bounded(
+        self,
+        coach: EncodedCoach,
+        job: EncodedJob,
+        weights: Tuple[float, ...],
+        threshold: float,
+        selector: TopKSelector,
+        stats: PruningStats,
+        now: datetime,
+    ) -> Optional[MatchScore]:
+        """
+        Score a pair unless its upper bound rules it out
+
+        The bound replaces culture and engagement with their maximum (1.0).
+        Float multiply/add are monotonic and the sum uses the same term
+        order as the real score, so round(bound) >= round(fitscore).
+        """
+        stats.considered += 1
+
+        cert_score = _certification_component(coach.certs, job.required_certs, job.preferred_certs)
+        exp_score = _experience_component(coach.years_experience, job.min_experience)
+        avail_score = _availability_component(coach.slots, job.required_slots)
+        loc_score = _location_component(coach.city, coach.state, job.city, job.state)
+
+        bound = round(
+            _weighted_sum(weights, cert_score, exp_score, avail_score, loc_score, 1.0, 1.0), 3
+        )
+        if bound < threshold:
+            stats.pruned_threshold += 1
+            return None
+        if not selector.can_admit(bound):
+            stats.pruned_top_k += 1
+            return None
+
+        stats.scored += 1
+        score = self._combine(
+            weights,
+            cert_score,
+            exp_score,
+            avail_score,
+            loc_score,
+            _culture_component(coach.tags, job.culture_tags),
+            _engagement_component(
+                coach.profile_completeness,
+                coach.last_updated,
+                coach.has_verified_video,
+                now,
+            ),
+        )
+        if score.fitscore < threshold:
+            return None
+        return score
+
+    def component_scores(
+        self,
+        coach: EncodedCoach,
+        job: EncodedJob,
+        components: Optional[Iterable[str]] = None,
+        as_of: Optional[datetime] = None,
+    ) -> Dict[str, float]:
+        """
+        Calculate unrounded sub-scores for an encoded pair
+
+        Args:
+            coach: Encoded coach profile
+            job: Encoded job profile
+            components: Component names to compute (defaults to all)
+            as_of: Clock reading for the engagement recency check (defaults to now)
+
+        Returns:
+            Dict[str, float]: Unrounded sub-scores keyed by MatchScore field name
+        """
+        if components is None:
+            components = COMPONENT_INPUTS
+        now = resolve_clock(as_of)
+
+        calculators = {
+            "cert_score": lambda: _certification_component(
+                coach.certs, job.required_certs, job.preferred_certs
+            ),
+            "experience_score": lambda: _experience_component(
+                coach.years_experience, job.min_experience
+            ),
+            "availability_score": lambda: _availability_component(
+                coach.slots, job.required_slots
+            ),
+            "location_score": lambda: _location_component(
+                coach.city, coach.state, job.city, job.state
+            ),
+            "culture_score": lambda: _culture_component(coach.tags, job.culture_tags),
+            "engagement_score": lambda: _engagement_component(
+                coach.profile_completeness, coach.last_updated, coach.has_verified_video, now
+            ),
+        }
+        return {component: calculators[component]() for component in components}
+
+    def combine_components(
+        self, weights: Tuple[float, ...], components: Dict[str, float]
+    ) -> MatchScore:
+        """
+        Recombine unrounded sub-scores into a MatchScore
+
+        Given the same sub-scores, the result is identical to the one
+        calculate_match produced originally.
+
+        Args:
+            weights: Preset weight vector (COMPONENTS order)
+            components: Unrounded sub-scores keyed by MatchScore field name
+
+        Returns:
+            MatchScore: Complete score breakdown
+        """
+        return self._combine(
+            weights,
+            components["cert_score"],
+            components["experience_score"],
+            components["availability_score"],
+            components["location_score"],
+            components["culture_score"],
+            components["engagement_score"],
+        )
+
+    def combine_matrix(
+        self,
+        weight_matrix: Sequence[Tuple[float, ...]],
+        components: Dict[str, float],
+    ) -> List[MatchScore]:
+        """
+        Recombine one pair's sub-scores under several weight vectors
+
+        Each row gives exactly the MatchScore that scoring with that
+        row's weights alone would give.
+
+        Args:
+            weight_matrix: Weight vectors (COMPONENTS order), e.g. PRESET_WEIGHT_MATRIX
+            components: Unrounded sub-scores keyed by MatchScore field name
+
+        Returns:
+            List[MatchScore]: One score per weight vector, in matrix row order
+        """
+        return [self.combine_components(weights, components) for weights in weight_matrix]
+
+    def score_matrix(
+        self,
+        coaches: Sequence[CoachInput],
+        job: JobInput,
+        weight_matrix: Sequence[Tuple[float, ...]],
+        as_of: Optional[datetime] = None,
+    ) -> List[List[MatchScore]]:
+        """
+        Score coaches against a job under several weight vectors in one pass
+
+        Sub-scores are computed once per coach; each weight vector then
+        costs only a weighted sum. The job's own preset is ignored.
+
+        Args:
+            coaches: Encoded coach profiles or Coach rows
+            job: Compiled job query or Job row
+            weight_matrix: Weight vectors (COMPONENTS order), e.g. PRESET_WEIGHT_MATRIX
+            as_of: Clock reading for the engagement recency check (defaults to now)
+
+        Returns:
+            List[List[MatchScore]]: One list per weight vector, each in coach order
+        """
+        encoded_job = as_compiled_job(job).encoded
+        now = resolve_clock(as_of)
+
+        by_coach = [
+            self.combine_matrix(
+                weight_matrix,
+                self.component_scores(as_encoded_coach(coach), encoded_job, as_of=now),
+            )
+            for coach in coaches
+        ]
+        if not by_coach:
+            return [[] for _ in weight_matrix]
+        return [list(row) for row in zip(*by_coach, strict=True)]
+
+    def iter_grid(
+        self,
+        coaches: Sequence[CoachInput],
+        jobs: Sequence[JobInput],
+        as_of: Optional[datetime] = None,
+        block_size: int = GRID_BLOCK_SIZE,
+    ) -> Iterator[Tuple[int, int, MatchScore]]:
+        """
+        Score every coach against every job, one block of coaches at a time
+
+        Jobs are compiled once for the whole sweep. Per block, coaches are
+        encoded once and their engagement (which does not depend on the
+        job) is computed once instead of per pair. Scores are yielded as
+        they are produced, so callers can reduce them (e.g. into top-k
+        lists) without materializing the full matrix.
+
+        Args:
+            coaches: Encoded coach profiles or Coach rows
+            jobs: Compiled job queries or Job rows (each with its own preset weights)
+            as_of: Clock reading for the engagement recency check (defaults to now)
+            block_size: Coaches per block
+
+        Yields:
+            Tuple[int, int, MatchScore]: (coach index, job index, score); for any
+            given job, coach indexes are increasing
+        """
+        now = resolve_clock(as_of)
+        compiled = [as_compiled_job(job) for job in jobs]
+
+        for start in range(0, len(coaches), block_size):
+            block = [as_encoded_coach(coach) for coach in coaches[start:start + block_size]]
+            engagement = [
+                _engagement_component(
+                    coach.profile_completeness, coach.last_updated, coach.has_verified_video, now
+                )
+                for coach in block
+            ]
+
+            for job_index, job in enumerate(compiled):
+                encoded_job = job.encoded
+                weights = job.weights
+                for offset, coach in enumerate(block):
+                    yield start + offset, job_index, self._combine(
+                        weights,
+                        _certification_component(
+                            coach.certs, encoded_job.required_certs, encoded_job.preferred_certs
+                        ),
+                        _experience_component(coach.years_experience, encoded_job.min_experience),
+                        _availability_component(coach.slots, encoded_job.required_slots),
+                        _location_component(
+                            coach.city, coach.state, encoded_job.city, encoded_job.state
+                        ),
+                        _culture_component(coach.tags, encoded_job.culture_tags),
+                        engagement[offset],
+                    )
+
+    def rank_grid(
+        self,
+        coaches: Sequence[CoachInput],
+        jobs: Sequence[JobInput],
+        thresholds: Sequence[float],
+        k: int,
+        as_of: Optional[datetime] = None,
+        coach_roles: Optional[Sequence[Any]] = None,
+        job_roles: Optional[Sequence[Any]] = None,
+        coach_offset: int = 0,
+    ) -> GridRanking:
+        """
+        Reduce a coach x job sweep to per-job and per-coach top-k lists
+
+        Per-coach lists keep every job above its threshold. When roles are
+        given, per-job lists only keep coaches whose role equals the job's.
+
+        Args:
+            coaches: Encoded coach profiles or Coach rows, in tie-break order
+            jobs: Compiled job queries or Job rows, in tie-break order
+            thresholds: Minimum FitScore per job
+            k: Length of each top-k list
+            as_of: Clock reading for the engagement recency check (defaults to now)
+            coach_roles: Role per coach (optional, enables the role filter)
+            job_roles: Role per job (optional, enables the role filter)
+            coach_offset: Added to reported coach indexes (for chunked sweeps)
+
+        Returns:
+            GridRanking: Top-k lists and counts
+        """
+        if len(thresholds) != len(jobs):
+            raise ValueError("thresholds must have one entry per job")
+        role_filter = coach_roles is not None and job_roles is not None
+
+        job_top = [TopKSelector(k) for _ in jobs]
+        job_counts = [0] * len(jobs)
+        coach_top = [TopKSelector(k) for _ in coaches]
+        coach_counts = [0] * len(coaches)
+        pairs_scored = 0
+
+        for coach_index, job_index, score in self.iter_grid(coaches, jobs, as_of):
+            pairs_scored += 1
+            if score.fitscore < thresholds[job_index]:
+                continue
+
+            coach_counts[coach_index] += 1
+            coach_top[coach_index].push(job_index, score)
+            if not role_filter or coach_roles[coach_index] == job_roles[job_index]:
+                job_counts[job_index] += 1
+                job_top[job_index].push(coach_offset + coach_index, score)
+
+        return GridRanking(
+            job_top=[selector.results() for selector in job_top],
+            job_counts=job_counts,
+            coach_top=[selector.results() for selector in coach_top],
+            coach_counts=coach_counts,
+            pairs_scored=pairs_scored,
+        )
+
+    def _score_profiles(
+        self,
+        coach: EncodedCoach,
+        job: EncodedJob,
+        weights: Tuple[float, ...],
+        now: datetime,
+    ) -> MatchScore:
+        """Score an encoded coach/job pair (shared by the batch entry points)"""
+        return self._combine(
+            weights,
+            _certification_component(coach.certs, job.required_certs, job.preferred_certs),
+            _experience_component(coach.years_experience, job.min_experience),
+            _availability_component(coach.slots, job.required_slots),
+            _location_component(coach.city, coach.state, job.city, job.state),
+            _culture_component(coach.tags, job.culture_tags),
+            _engagement_component(
+                coach.profile_completeness,
+                coach.last_updated,
+                coach.has_verified_video,
+                now,
+            ),
+        )
+
+    @staticmethod
+    def _combine(
+        weights: Tuple[float, ...],
+        cert_score: float,
+        exp_score: float,
+        avail_score: float,
+        loc_score: float,
+        culture_score: float,
+        engage_score: float,
+    ) -> MatchScore:
+        """Apply a preset weight vector (COMPONENTS order) and round for the API"""
+        fitscore = _weighted_sum(
+            weights, cert_score, exp_score, avail_score, loc_score, culture_score, engage_score
         )
 
         return MatchScore(
@@ -109,33 +771,11 @@ class FitScoreEngine:
         Returns:
             float: Score from 0.0 to 1.0
         """
-        # Extract certification names from coach data
-        coach_certs = set()
-        for cert in coach_data.get("certifications", []):
-            if isinstance(cert, dict):
-                coach_certs.add(cert.get("name", ""))
-            else:
-                coach_certs.add(str(cert))
-
-        # Get required and preferred certifications from job
-        required = set(job_data.get("required_certifications", []))
-        preferred = set(job_data.get("preferred_certifications", []))
-
-        # Must have all required certifications
-        if not required.issubset(coach_certs):
-            return 0.0
-
-        # Base score for meeting requirements
-        base_score = 0.7
-
-        # Bonus for preferred certifications
-        if preferred:
-            preferred_match_count = len(coach_certs & preferred)
-            preferred_bonus = (preferred_match_count / len(preferred)) * 0.3
-        else:
-            preferred_bonus = 0.0
-
-        return base_score + preferred_bonus
+        return _certification_component(
+            encode_coach_certifications(coach_data),
+            CERTIFICATIONS.encode(job_data.get("required_certifications", [])),
+            CERTIFICATIONS.encode(job_data.get("preferred_certifications", [])),
+        )
 
     def _score_experience(self, coach_data: Dict, job_data: Dict) -> float:
         """
@@ -153,22 +793,9 @@ class FitScoreEngine:
         Returns:
             float: Score from 0.0 to 1.0
         """
-        coach_years = coach_data.get("years_experience", 0)
-        min_years = job_data.get("min_experience", 0)
-
-        # Must meet minimum experience
-        if coach_years < min_years:
-            return 0.0
-
-        # Base score for meeting minimum
-        base_score = 0.7
-
-        # Bonus for additional experience (diminishing returns)
-        years_over = coach_years - min_years
-        # Max bonus of 0.3 for 10+ years over minimum
-        bonus = min(years_over / 10.0, 0.3)
-
-        return base_score + bonus
+        return _experience_component(
+            coach_data.get("years_experience", 0), job_data.get("min_experience", 0)
+        )
 
     def _score_availability(self, coach_data: Dict, job_data: Dict) -> float:
         """
@@ -186,22 +813,10 @@ class FitScoreEngine:
         Returns:
             float: Score from 0.0 to 1.0
         """
-        coach_slots = set(coach_data.get("available_times", []))
-        required_slots = set(job_data.get("required_availability", []))
-
-        # Must cover all required slots
-        if not required_slots.issubset(coach_slots):
-            return 0.0
-
-        # Base score for covering requirements
-        base_score = 0.7
-
-        # Bonus for additional availability (flexibility)
-        extra_slots = len(coach_slots - required_slots)
-        # Max bonus of 0.3 for 10+ extra slots
-        flexibility_bonus = min(extra_slots / 10.0, 1.0) * 0.3
-
-        return base_score + flexibility_bonus
+        return _availability_component(
+            TIME_SLOTS.encode(coach_data.get("available_times", [])),
+            TIME_SLOTS.encode(job_data.get("required_availability", [])),
+        )
 
     def _score_location(self, coach_data: Dict, job_data: Dict) -> float:
         """
@@ -220,16 +835,10 @@ class FitScoreEngine:
         Returns:
             float: Score from 0.0 to 1.0
         """
-        coach_city = coach_data.get("city", "").strip().lower()
-        coach_state = coach_data.get("state", "").strip().upper()
-        job_city = job_data.get("city", "").strip().lower()
-        job_state = job_data.get("state", "").strip().upper()
-
-        # Exact city and state match
-        if coach_city == job_city and coach_state == job_state:
-            return 1.0
+        coach_city, coach_state = normalize_location(coach_data)
+        job_city, job_state = normalize_location(job_data)
 
-        return 0.0
+        return _location_component(coach_city, coach_state, job_city, job_state)
 
     def _score_culture(self, coach_data: Dict, job_data: Dict) -> float:
         """
@@ -247,24 +856,9 @@ class FitScoreEngine:
         Returns:
             float: Score from 0.0 to 1.0
         """
-        # Combine all coach tags
-        coach_tags = set()
-        coach_tags.update(coach_data.get("lifestyle_tags", []))
-        coach_tags.update(coach_data.get("movement_tags", []))
-        coach_tags.update(coach_data.get("instruction_tags", []))
-
-        # Get job culture tags
-        job_tags = set(job_data.get("culture_tags", []))
-
-        # If no culture requirements, perfect match
-        if not job_tags:
-            return 1.0
-
-        # Calculate overlap percentage
-        overlap = coach_tags & job_tags
-        score = len(overlap) / len(job_tags)
-
-        return score
+        return _culture_component(
+            encode_coach_tags(coach_data), CULTURE_TAGS.encode(job_data.get("culture_tags", []))
+        )
 
     def _score_engagement(self, coach_data: Dict) -> float:
         """
@@ -283,32 +877,127 @@ class FitScoreEngine:
         Returns:
             float: Score from 0.0 to 1.0
         """
-        score = 0.5
+        return _engagement_component(
+            coach_data.get("profile_completeness", 0.0),
+            parse_last_updated(coach_data.get("last_updated")),
+            bool(coach_data.get("verified_video_url")),
+            datetime.now(),
+        )
 
-        # Profile completeness bonus
-        completeness = coach_data.get("profile_completeness", 0.0)
-        if completeness >= 0.9:
-            score += 0.2
 
-        # Recent activity bonus
-        last_updated = coach_data.get("last_updated")
-        if last_updated:
-            if isinstance(last_updated, str):
-                # Parse ISO format datetime string
-                try:
-                    last_updated = datetime.fromisoformat(
-                        last_updated.replace("Z", "+00:00")
-                    )
-                except (ValueError, AttributeError):
-                    last_updated = None
+def _weighted_sum(
+    weights: Tuple[float, ...],
+    cert_score: float,
+    exp_score: float,
+    avail_score: float,
+    loc_score: float,
+    culture_score: float,
+    engage_score: float,
+) -> float:
+    """Weighted final score (unrounded); the single place the term order is defined"""
+    w_cert, w_exp, w_avail, w_loc, w_culture, w_engage = weights
+
+    return (
+        w_cert * cert_score
+        + w_exp * exp_score
+        + w_avail * avail_score
+        + w_loc * loc_score
+        + w_culture * culture_score
+        + w_engage * engage_score
+    )
+
+
+def _certification_component(coach_certs: int, required: int, preferred: int) -> float:
+    """Certification sub-score from encoded bitsets (see _score_certifications)"""
+    # Must have all required certifications
+    if required & ~coach_certs:
+        return 0.0
+
+    # Base score for meeting requirements
+    base_score = 0.7
+
+    # Bonus for preferred certifications
+    if preferred:
+        preferred_match_count = (coach_certs & preferred).bit_count()
+        preferred_bonus = (preferred_match_count / preferred.bit_count()) * 0.3
+    else:
+        preferred_bonus = 0.0
 
-            if last_updated and isinstance(last_updated, datetime):
-                days_since_update = (datetime.now() - last_updated.replace(tzinfo=None)).days
-                if days_since_update <= 30:
-                    score += 0.2
+    return base_score + preferred_bonus
+
+
+def _experience_component(coach_years: int, min_years: int) -> float:
+    """Experience sub-score from years (see _score_experience)"""
+    # Must meet minimum experience
+    if coach_years < min_years:
+        return 0.0
+
+    # Base score for meeting minimum
+    base_score = 0.7
+
+    # Bonus for additional experience (diminishing returns)
+    years_over = coach_years - min_years
+    # Max bonus of 0.3 for 10+ years over minimum
+    bonus = min(years_over / 10.0, 0.3)
+
+    return base_score + bonus
+
+
+def _availability_component(coach_slots: int, required_slots: int) -> float:
+    """Availability sub-score from encoded bitsets (see _score_availability)"""
+    # Must cover all required slots
+    if required_slots & ~coach_slots:
+        return 0.0
+
+    # Base score for covering requirements
+    base_score = 0.7
+
+    # Bonus for additional availability (flexibility)
+    extra_slots = (coach_slots & ~required_slots).bit_count()
+    # Max bonus of 0.3 for 10+ extra slots
+    flexibility_bonus = min(extra_slots / 10.0, 1.0) * 0.3
+
+    return base_score + flexibility_bonus
+
+
+def _location_component(coach_city: str, coach_state: str, job_city: str, job_state: str) -> float:
+    """Location sub-score from normalized city/state (see _score_location)"""
+    # Exact city and state match
+    if coach_city == job_city and coach_state == job_state:
+        return 1.0
+
+    return 0.0
+
+
+def _culture_component(coach_tags: int, job_tags: int) -> float:
+    """Culture sub-score from encoded bitsets (see _score_culture)"""
+    # If no culture requirements, perfect match
+    if not job_tags:
+        return 1.0
+
+    # Calculate overlap percentage
+    overlap = coach_tags & job_tags
+    return overlap.bit_count() / job_tags.bit_count()
+
+
+def _engagement_component(
+    completeness: float, last_updated: Optional[datetime], has_verified_video: bool, now: datetime
+) -> float:
+    """Engagement sub-score from parsed signals (see _score_engagement)"""
+    score = 0.5
+
+    # Profile completeness bonus
+    if completeness >= 0.9:
+        score += 0.2
+
+    # Recent activity bonus
+    if last_updated:
+        days_since_update = (now - last_updated.replace(tzinfo=None)).days
+        if days_since_update <= ENGAGEMENT_RECENCY_DAYS:
+            score += 0.2
 
-        # Verified video bonus
-        if coach_data.get("verified_video_url"):
-            score += 0.1
+    # Verified video bonus
+    if has_verified_video:
+        score += 0.1
 
-        return min(score, 1.0)
+    return min(score, 1.0)
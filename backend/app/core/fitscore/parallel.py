@@ -0,0 +1,433 @@
+"""Process-pool parallel FitScore sweeps
+
+Scoring is CPU-bound pure Python, so threads cannot use more than one core.
+ParallelScorer splits the coach (or job) set into contiguous chunks and
+scores them in a ProcessPoolExecutor:
+- the pool is long-lived: start() creates it once (the API does so in its
+  lifespan) and stop() shuts it down; workers are spawned, not forked, so
+  they never inherit the server's threads, sockets or connection pools
+- every task carries the shared side of the sweep (compiled job(s),
+  preset weights, clock) next to its chunk of encoded profiles; with one
+  chunk per worker that is one copy per worker, as before
+- each chunk returns its own top-k, which the parent merges by
+  (fitscore desc, position asc), so results are identical to the serial
+  engine methods regardless of chunking or completion order
+
+Without a started pool (max_workers=1, the default) every sweep runs
+serially, as do sweeps below min_parallel_pairs, where pickling overhead
+outweighs the work. Request handlers use rank_grid_async, which awaits the
+chunks through loop.run_in_executor (or runs a serial sweep on a thread)
+instead of blocking the event loop.
+
+Benchmark with: python -m app.core.fitscore.parallel [workers]
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from app.core.fitscore.compiled import CompiledJob, as_compiled_job
+from app.core.fitscore.encoding import EncodedCoach, as_encoded_coach
+from app.core.fitscore.engine import (
+    CoachInput,
+    FitScoreEngine,
+    JobInput,
+    MatchScore,
+    resolve_clock,
+)
+from app.core.fitscore.ranking import GridRanking, PruningStats, merge_ranked
+
+# Below this many coach-job pairs a sweep runs in-process
+PARALLEL_MIN_PAIRS = 20_000
+
+# Tasks are (shared, chunk) pairs: the sweep's common inputs and one chunk
+
+
+def _score_chunk(task: Tuple[Tuple, List[EncodedCoach]]) -> List[MatchScore]:
+    (job, now), coaches = task
+    return FitScoreEngine().score_compiled(coaches, job, now)
+
+
+def _rank_candidates_chunk(task: Tuple[Tuple, Tuple[int, List[EncodedCoach]]]):
+    (job, threshold, limit, now), (offset, coaches) = task
+    stats = PruningStats()
+    ranked = FitScoreEngine().rank_candidates(coaches, job, threshold, limit, stats, now)
+    return [(offset + position, score) for position, score in ranked], stats
+
+
+def _rank_jobs_chunk(task: Tuple[Tuple, Tuple[int, List[CompiledJob], List[float]]]):
+    (coach, limit, now), (offset, jobs, thresholds) = task
+    stats = PruningStats()
+    ranked = FitScoreEngine().rank_jobs(coach, jobs, thresholds, limit, stats, now)
+    return [(offset + position, score) for position, score in ranked], stats
+
+
+def _rank_grid_chunk(
+    task: Tuple[Tuple, Tuple[int, List[EncodedCoach], Optional[List[Any]]]]
+) -> GridRanking:
+    (jobs, thresholds, k, job_roles, now), (offset, coaches, coach_roles) = task
+    return FitScoreEngine().rank_grid(
+        coaches, jobs, thresholds, k, now, coach_roles, job_roles, coach_offset=offset
+    )
+
+
+def _chunk_bounds(size: int, chunks: int) -> List[Tuple[int, int]]:
+    """Split range(size) into at most `chunks` contiguous, near-equal ranges"""
+    chunks = max(1, min(chunks, size))
+    step, extra = divmod(size, chunks)
+    bounds = []
+    start = 0
+    for index in range(chunks):
+        end = start + step + (1 if index < extra else 0)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+class ParallelScorer:
+    """
+    Runs large FitScore sweeps across a process pool, small ones serially
+
+    Every method returns exactly what the FitScoreEngine method of the same
+    name returns (pruning counters aside: each chunk prunes against its own
+    top-k). Sweeps only use the pool between start() and stop().
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 1,
+        min_parallel_pairs: int = PARALLEL_MIN_PAIRS,
+        chunks_per_worker: int = 1,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_parallel_pairs = min_parallel_pairs
+        self.chunks_per_worker = chunks_per_worker
+        self.engine = FitScoreEngine()
+        self.pool: Optional[ProcessPoolExecutor] = None
+
+    def start(self) -> None:
+        """Create the worker pool (no-op when serial or already started)"""
+        if self.pool is None and self.max_workers > 1:
+            self.pool = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+
+    def stop(self) -> None:
+        """Shut the worker pool down, cancelling queued chunks"""
+        if self.pool is not None:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+            self.pool = None
+
+    def _use_pool(self, pairs: int) -> bool:
+        """Whether a sweep of this many pairs is worth the process pool"""
+        return self.pool is not None and pairs >= self.min_parallel_pairs
+
+    def _map(self, shared: Tuple, task: Callable, chunks: Sequence) -> list:
+        """Run task over (shared, chunk) pairs in the pool, in chunk order"""
+        return list(self.pool.map(task, [(shared, chunk) for chunk in chunks]))
+
+    async def _map_async(self, shared: Tuple, task: Callable, chunks: Sequence) -> list:
+        """_map awaited through the event loop's run_in_executor"""
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(
+            *(loop.run_in_executor(self.pool, task, (shared, chunk)) for chunk in chunks)
+        )
+
+    def _coach_chunks(self, coaches: Sequence[EncodedCoach]) -> List[Tuple[int, int]]:
+        return _chunk_bounds(len(coaches), self.max_workers * self.chunks_per_worker)
+
+    def score_compiled(
+        self,
+        coaches: Sequence[CoachInput],
+        job: JobInput,
+        as_of: Optional[datetime] = None,
+    ) -> List[MatchScore]:
+        """
+        Parallel FitScoreEngine.score_compiled
+
+        Args:
+            coaches: Encoded coach profiles or Coach rows
+            job: Compiled job query or Job row
+            as_of: Clock reading for the engagement recency check (defaults to now)
+
+        Returns:
+            List[MatchScore]: Score breakdowns in the same order as coaches
+        """
+        now = resolve_clock(as_of)
+        if not self._use_pool(len(coaches)):
+            return self.engine.score_compiled(coaches, job, now)
+
+        coaches = [as_encoded_coach(coach) for coach in coaches]
+        chunks = [coaches[start:end] for start, end in self._coach_chunks(coaches)]
+        results = self._map((as_compiled_job(job), now), _score_chunk, chunks)
+        return [score for chunk in results for score in chunk]
+
+    def rank_candidates(
+        self,
+        coaches: Sequence[CoachInput],
+        job: JobInput,
+        threshold: float,
+        limit: int,
+        stats: Optional[PruningStats] = None,
+        as_of: Optional[datetime] = None,
+    ) -> List[Tuple[int, MatchScore]]:
+        """
+        Parallel FitScoreEngine.rank_candidates
+
+        Args:
+            coaches: Encoded coach profiles or Coach rows, in tie-break order
+            job: Compiled job query or Job row
+            threshold: Minimum FitScore to include
+            limit: Maximum number of results
+            stats: Optional counters to update
+            as_of: Clock reading for the engagement recency check (defaults to now)
+
+        Returns:
+            List[Tuple[int, MatchScore]]: (index into coaches, score), best first
+        """
+        now = resolve_clock(as_of)
+        if not self._use_pool(len(coaches)):
+            return self.engine.rank_candidates(coaches, job, threshold, limit, stats, now)
+
+        coaches = [as_encoded_coach(coach) for coach in coaches]
+        tasks = [(start, coaches[start:end]) for start, end in self._coach_chunks(coaches)]
+        results = self._map(
+            (as_compiled_job(job), threshold, limit, now), _rank_candidates_chunk, tasks
+        )
+
+        if stats is not None:
+            for _, chunk_stats in results:
+                stats.merge(chunk_stats)
+        return merge_ranked([ranked for ranked, _ in results], limit)
+
+    def rank_jobs(
+        self,
+        coach: CoachInput,
+        jobs: Sequence[JobInput],
+        thresholds: Sequence[float],
+        limit: int,
+        stats: Optional[PruningStats] = None,
+        as_of: Optional[datetime] = None,
+    ) -> List[Tuple[int, MatchScore]]:
+        """
+        Parallel FitScoreEngine.rank_jobs (the job set is chunked)
+
+        Args:
+            coach: Encoded coach profile or Coach row
+            jobs: Compiled job queries or Job rows, in tie-break order
+            thresholds: Minimum FitScore per job
+            limit: Maximum number of results
+            stats: Optional counters to update
+            as_of: Clock reading for the engagement recency check (defaults to now)
+
+        Returns:
+            List[Tuple[int, MatchScore]]: (index into jobs, score), best first
+        """
+        if len(thresholds) != len(jobs):
+            raise ValueError("thresholds must have one entry per job")
+        now = resolve_clock(as_of)
+        if not self._use_pool(len(jobs)):
+            return self.engine.rank_jobs(coach, jobs, thresholds, limit, stats, now)
+
+        jobs = [as_compiled_job(job) for job in jobs]
+        tasks = [
+            (start, jobs[start:end], list(thresholds[start:end]))
+            for start, end in _chunk_bounds(len(jobs), self.max_workers * self.chunks_per_worker)
+        ]
+        results = self._map((as_encoded_coach(coach), limit, now), _rank_jobs_chunk, tasks)
+
+        if stats is not None:
+            for _, chunk_stats in results:
+                stats.merge(chunk_stats)
+        return merge_ranked([ranked for ranked, _ in results], limit)
+
+    def rank_grid(
+        self,
+        coaches: Sequence[CoachInput],
+        jobs: Sequence[JobInput],
+        thresholds: Sequence[float],
+        k: int,
+        as_of: Optional[datetime] = None,
+        coach_roles: Optional[Sequence[Any]] = None,
+        job_roles: Optional[Sequence[Any]] = None,
+    ) -> GridRanking:
+        """
+        Parallel FitScoreEngine.rank_grid (the coach set is chunked)
+
+        Args:
+            coaches: Encoded coach profiles or Coach rows, in tie-break order
+            jobs: Compiled job queries or Job rows, in tie-break order
+            thresholds: Minimum FitScore per job
+            k: Length of each top-k list
+            as_of: Clock reading for the engagement recency check (defaults to now)
+            coach_roles: Role per coach (optional, enables the role filter)
+            job_roles: Role per job (optional, enables the role filter)
+
+        Returns:
+            GridRanking: Top-k lists and counts
+        """
+        now = resolve_clock(as_of)
+        if not self._use_pool(len(coaches) * len(jobs)):
+            return self.engine.rank_grid(coaches, jobs, thresholds, k, now, coach_roles, job_roles)
+
+        shared, tasks = self._grid_tasks(coaches, jobs, thresholds, k, now, coach_roles, job_roles)
+        return GridRanking.merge(self._map(shared, _rank_grid_chunk, tasks), k)
+
+    async def rank_grid_async(
+        self,
+        coaches: Sequence[CoachInput],
+        jobs: Sequence[JobInput],
+        thresholds: Sequence[float],
+        k: int,
+        as_of: Optional[datetime] = None,
+        coach_roles: Optional[Sequence[Any]] = None,
+        job_roles: Optional[Sequence[Any]] = None,
+    ) -> GridRanking:
+        """
+        rank_grid for async callers: the sweep never runs on the event loop
+
+        Pool chunks are awaited via loop.run_in_executor; serial sweeps run
+        on the loop's default thread executor.
+
+        Args:
+            coaches: Encoded coach profiles or Coach rows, in tie-break order
+            jobs: Compiled job queries or Job rows, in tie-break order
+            thresholds: Minimum FitScore per job
+            k: Length of each top-k list
+            as_of: Clock reading for the engagement recency check (defaults to now)
+            coach_roles: Role per coach (optional, enables the role filter)
+            job_roles: Role per job (optional, enables the role filter)
+
+        Returns:
+            GridRanking: Top-k lists and counts
+        """
+        now = resolve_clock(as_of)
+        if not self._use_pool(len(coaches) * len(jobs)):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None,
+                self.engine.rank_grid,
+                coaches,
+                jobs,
+                thresholds,
+                k,
+                now,
+                coach_roles,
+                job_roles,
+            )
+
+        shared, tasks = self._grid_tasks(coaches, jobs, thresholds, k, now, coach_roles, job_roles)
+        return GridRanking.merge(await self._map_async(shared, _rank_grid_chunk, tasks), k)
+
+    def _grid_tasks(
+        self,
+        coaches: Sequence[CoachInput],
+        jobs: Sequence[JobInput],
+        thresholds: Sequence[float],
+        k: int,
+        now: datetime,
+        coach_roles: Optional[Sequence[Any]],
+        job_roles: Optional[Sequence[Any]],
+    ) -> Tuple[Tuple, List[Tuple]]:
+        """Shared inputs and per-chunk tasks of a rank_grid sweep"""
+        coaches = [as_encoded_coach(coach) for coach in coaches]
+        tasks = [
+            (
+                start,
+                coaches[start:end],
+                list(coach_roles[start:end]) if coach_roles is not None else None,
+            )
+            for start, end in self._coach_chunks(coaches)
+        ]
+        shared = (
+            [as_compiled_job(job) for job in jobs],
+            list(thresholds),
+            k,
+            list(job_roles) if job_roles is not None else None,
+            now,
+        )
+        return shared, tasks
+
+
+if __name__ == "__main__":
+    # Serial vs parallel timings on synthetic profiles
+    import random
+    import sys
+    import time
+
+    rng = random.Random(42)
+    certs = [f"CERT-{i}" for i in range(12)]
+    slots = [
+        f"{day} {part}"
+        for day in ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat")
+        for part in ("AM", "PM")
+    ]
+    tags = [f"tag-{i}" for i in range(20)]
+
+    def random_coach() -> EncodedCoach:
+        return EncodedCoach.from_dict(
+            {
+                "certifications": rng.sample(certs, rng.randint(0, 4)),
+                "years_experience": rng.randint(0, 15),
+                "available_times": rng.sample(slots, rng.randint(0, 8)),
+                "city": "Denver",
+                "state": "CO",
+                "lifestyle_tags": rng.sample(tags, rng.randint(0, 5)),
+                "profile_completeness": rng.random(),
+                "last_updated": datetime.now().isoformat(),
+            }
+        )
+
+    def random_job() -> CompiledJob:
+        return CompiledJob.compile(
+            {
+                "required_certifications": rng.sample(certs, rng.randint(0, 1)),
+                "preferred_certifications": rng.sample(certs, rng.randint(0, 3)),
+                "min_experience": rng.randint(0, 5),
+                "required_availability": rng.sample(slots, rng.randint(0, 3)),
+                "city": "Denver",
+                "state": "CO",
+                "culture_tags": rng.sample(tags, rng.randint(0, 4)),
+            }
+        )
+
+    coaches = [random_coach() for _ in range(20_000)]
+    jobs = [random_job() for _ in range(20)]
+    thresholds = [0.6] * len(jobs)
+    as_of = datetime.now()
+
+    serial = ParallelScorer(max_workers=1)
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+    parallel = ParallelScorer(max_workers=workers, min_parallel_pairs=0)
+    parallel.start()
+    print(f"workers={parallel.max_workers} coaches={len(coaches)} jobs={len(jobs)}")
+
+    # Spawn the workers before timing anything
+    parallel.score_compiled(coaches[: parallel.max_workers], jobs[0], as_of)
+
+    for name, run in (
+        ("score_compiled", lambda scorer: scorer.score_compiled(coaches, jobs[0], as_of)),
+        (
+            "rank_candidates",
+            lambda scorer: scorer.rank_candidates(coaches, jobs[0], 0.6, 20, as_of=as_of),
+        ),
+        ("rank_grid", lambda scorer: scorer.rank_grid(coaches, jobs, thresholds, 10, as_of)),
+    ):
+        started = time.perf_counter()
+        expected = run(serial)
+        serial_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        result = run(parallel)
+        parallel_time = time.perf_counter() - started
+
+        assert result == expected
+        print(
+            f"{name:16s} serial={serial_time:.3f}s parallel={parallel_time:.3f}s "
+            f"speedup={serial_time / parallel_time:.2f}x"
+        )
+
+    parallel.stop()
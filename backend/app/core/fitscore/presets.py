@@ -3,7 +3,18 @@
 Defines different scoring emphasis strategies for different job types.
 """
 
-from typing import Dict
+import math
+from typing import Dict, Optional, Sequence, Tuple
+
+# Order of score components in weight vectors
+COMPONENTS: Tuple[str, ...] = (
+    "certifications",
+    "experience",
+    "availability",
+    "location",
+    "cultural_fit",
+    "engagement",
+)
 
 # Weighting presets for FitScore calculation
 WEIGHTING_PRESETS: Dict[str, Dict[str, float]] = {
@@ -76,9 +87,83 @@ def get_preset(preset_name: str) -> Dict[str, float]:
         ValueError: If preset name doesn't exist
     """
     if preset_name not in WEIGHTING_PRESETS:
+        available = ", ".join(WEIGHTING_PRESETS)
+        raise ValueError(f"Unknown preset '{preset_name}'. Available: {available}")
+
+    return WEIGHTING_PRESETS[preset_name]
+
+
+def get_preset_weights(preset_name: str) -> Tuple[float, ...]:
+    """
+    Get weighting values for a preset as a vector in COMPONENTS order
+
+    Args:
+        preset_name: Name of the preset
+
+    Returns:
+        Tuple[float, ...]: One weight per score component
+
+    Raises:
+        ValueError: If preset name doesn't exist
+    """
+    weights = get_preset(preset_name)
+    return tuple(weights[component] for component in COMPONENTS)
+
+
+def build_weight_matrix(
+    preset_names: Optional[Sequence[str]] = None,
+) -> Tuple[Tuple[float, ...], ...]:
+    """
+    Stack preset weight vectors into a matrix (one row per preset)
+
+    Args:
+        preset_names: Presets to include, in row order (defaults to all)
+
+    Returns:
+        Tuple[Tuple[float, ...], ...]: Rows in COMPONENTS order
+
+    Raises:
+        ValueError: If a preset name doesn't exist
+    """
+    if preset_names is None:
+        preset_names = PRESET_NAMES
+    return tuple(get_preset_weights(name) for name in preset_names)
+
+
+def parse_custom_weights(weights: Sequence[float]) -> Tuple[float, ...]:
+    """
+    Validate a custom weight vector given in COMPONENTS order
+
+    Args:
+        weights: One finite, non-negative weight per score component
+
+    Returns:
+        Tuple[float, ...]: The validated weight vector
+
+    Raises:
+        ValueError: If the vector has the wrong length, a NaN, infinite or
+            negative weight, or does not sum to 1.0
+    """
+    weights = tuple(float(weight) for weight in weights)
+    if len(weights) != len(COMPONENTS):
         raise ValueError(
-            f"Unknown preset '{preset_name}'. "
-            f"Available: {', '.join(WEIGHTING_PRESETS.keys())}"
+            f"Expected {len(COMPONENTS)} weights ({', '.join(COMPONENTS)}), got {len(weights)}"
         )
+    # NaN compares false against everything, so it would pass the checks below
+    if not all(math.isfinite(weight) for weight in weights):
+        raise ValueError("Weights must be finite numbers")
+    if any(weight < 0 for weight in weights):
+        raise ValueError("Weights must be non-negative")
 
-    return WEIGHTING_PRESETS[preset_name]
+    # Allow small floating point error
+    if abs(sum(weights) - 1.0) >= 0.001:
+        raise ValueError("Weights must sum to 1.0")
+
+    return weights
+
+
+# Preset names in weight matrix row order
+PRESET_NAMES: Tuple[str, ...] = tuple(WEIGHTING_PRESETS)
+
+# Every preset's weights, compiled once (rows follow PRESET_NAMES)
+PRESET_WEIGHT_MATRIX: Tuple[Tuple[float, ...], ...] = build_weight_matrix()
@@ -0,0 +1,193 @@
+"""Top-k selection and pruning counters for FitScore ranking
+
+Ranking keeps only the best k matches in a bounded heap instead of scoring,
+sorting and slicing the whole pool. Order is identical to a stable
+descending sort on fitscore: ties are broken by input position, so earlier
+candidates win.
+"""
+
+import heapq
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from app.core.fitscore.engine import MatchScore
+
+
+@dataclass
+class PruningStats:
+    """
+    Counters for a ranking sweep
+
+    considered: pairs examined
+    pruned_threshold: pairs skipped because their upper bound is below the threshold
+    pruned_top_k: pairs skipped because their upper bound cannot enter the top k
+    scored: pairs fully scored
+    """
+
+    considered: int = 0
+    pruned_threshold: int = 0
+    pruned_top_k: int = 0
+    scored: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def pruned(self) -> int:
+        """Total pairs skipped before their expensive components were computed"""
+        return self.pruned_threshold + self.pruned_top_k
+
+    def __getstate__(self) -> Dict[str, int]:
+        """Pickle without the lock (stats are returned from worker processes)"""
+        return {name: value for name, value in self.__dict__.items() if name != "_lock"}
+
+    def __setstate__(self, state: Dict[str, int]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def merge(self, other: "PruningStats") -> None:
+        """Add another sweep's counters into this one"""
+        with self._lock:
+            self.considered += other.considered
+            self.pruned_threshold += other.pruned_threshold
+            self.pruned_top_k += other.pruned_top_k
+            self.scored += other.scored
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert to dictionary for logging/metrics"""
+        return {
+            "considered": self.considered,
+            "pruned_threshold": self.pruned_threshold,
+            "pruned_top_k": self.pruned_top_k,
+            "pruned": self.pruned,
+            "scored": self.scored,
+        }
+
+
+class TopKSelector:
+    """
+    Bounded min-heap keeping the k best (fitscore, position) entries
+
+    Positions must be pushed in increasing order; a later entry only
+    displaces the current k-th best if its fitscore is strictly higher.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: List[Tuple[float, int, "MatchScore"]] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def can_admit(self, fitscore: float) -> bool:
+        """
+        Check whether a match with this (rounded) fitscore could enter the top k
+
+        Args:
+            fitscore: Score, or an upper bound on it
+
+        Returns:
+            bool: False if the match is guaranteed to be cut
+        """
+        if self.k <= 0:
+            return False
+        if len(self._heap) < self.k:
+            return True
+        return fitscore > self._heap[0][0]
+
+    def push(self, position: int, score: "MatchScore") -> None:
+        """
+        Offer a scored match to the selector
+
+        Args:
+            position: Index of the match in the input sequence
+            score: Complete score breakdown
+        """
+        if not self.can_admit(score.fitscore):
+            return
+
+        entry = (score.fitscore, -position, score)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        else:
+            heapq.heapreplace(self._heap, entry)
+
+    def results(self) -> List[Tuple[int, "MatchScore"]]:
+        """
+        Get selected matches, best first
+
+        Returns:
+            List[Tuple[int, MatchScore]]: (input position, score) pairs
+        """
+        ordered = sorted(self._heap, key=lambda entry: (-entry[0], -entry[1]))
+        return [(-neg_position, score) for _, neg_position, score in ordered]
+
+
+def merge_ranked(
+    lists: Sequence[List[Tuple[int, "MatchScore"]]], limit: int
+) -> List[Tuple[int, "MatchScore"]]:
+    """
+    Merge top-k lists over disjoint position ranges into one top-k list
+
+    Order matches a single TopKSelector fed every position: fitscore
+    descending, ties by position ascending.
+
+    Args:
+        lists: (position, score) lists, each best first
+        limit: Maximum number of results
+
+    Returns:
+        List[Tuple[int, MatchScore]]: Merged (position, score) pairs, best first
+    """
+    merged = [entry for ranked in lists for entry in ranked]
+    merged.sort(key=lambda entry: (-entry[1].fitscore, entry[0]))
+    return merged[:limit]
+
+
+@dataclass
+class GridRanking:
+    """
+    Top-k lists from a coach x job sweep
+
+    job_top: per job, (coach index, score) pairs best first
+    job_counts: per job, coaches above threshold (and passing the role filter)
+    coach_top: per coach, (job index, score) pairs best first
+    coach_counts: per coach, jobs above threshold
+    pairs_scored: coach-job pairs scored
+    """
+
+    job_top: List[List[Tuple[int, "MatchScore"]]]
+    job_counts: List[int]
+    coach_top: List[List[Tuple[int, "MatchScore"]]]
+    coach_counts: List[int]
+    pairs_scored: int = 0
+
+    @classmethod
+    def merge(cls, parts: Sequence["GridRanking"], k: int) -> "GridRanking":
+        """
+        Combine sweeps over consecutive coach ranges (same jobs)
+
+        Coach indexes in each part must already be global.
+
+        Args:
+            parts: Partial rankings, in coach order
+            k: Length of each top-k list
+
+        Returns:
+            GridRanking: Same result as a single sweep over all coaches
+        """
+        job_count = len(parts[0].job_top) if parts else 0
+        return cls(
+            job_top=[
+                merge_ranked([part.job_top[j] for part in parts], k) for j in range(job_count)
+            ],
+            job_counts=[sum(part.job_counts[j] for part in parts) for j in range(job_count)],
+            coach_top=[ranked for part in parts for ranked in part.coach_top],
+            coach_counts=[count for part in parts for count in part.coach_counts],
+            pairs_scored=sum(part.pairs_scored for part in parts),
+        )
+
+
+# Process-wide totals, accumulated by on-demand ranking (match lists of
+# coaches without stored rows, see app.services.matching.live_ranked_matches)
+pruning_stats = PruningStats()
@@ -0,0 +1,307 @@
+"""Monthly range partitions for the append-only event tables
+
+audit_logs and match_events are partitioned by RANGE ("timestamp"), one
+partition per calendar month named <table>_yYYYYmMM. Inserts and index
+maintenance only touch the current month's partition, and queries bounded
+on timestamp are pruned to the partitions they overlap.
+
+maintain_partitions keeps partitions created a few months ahead and retires
+months past the retention window by detaching, and optionally dropping,
+whole partitions instead of DELETEing rows. Each table also has a DEFAULT
+partition, <table>_default, so an event outside every monthly range (a
+skewed clock, or maintenance that has not run) is still stored rather than
+failing its whole write-behind batch; maintenance moves such rows into
+their months' partitions. Application startup creates upcoming partitions
+only; schedule the full run (creation and retention), e.g. daily:
+
+    python -m app.db.partitions
+"""
+
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+# Tables partitioned by month on "timestamp"
+PARTITIONED_TABLES = ("audit_logs", "match_events")
+
+# Serializes maintenance across workers starting at the same time
+_ADVISORY_LOCK_ID = 0x46485054  # "FHPT"
+
+_PARTITION_NAME = re.compile(r"^(?P<table>\w+)_y(?P<year>\d{4})m(?P<month>\d{2})$")
+
+
+def month_start(value: date) -> date:
+    """First day of the month containing value"""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    """
+    Shift a month by count months
+
+    Args:
+        month: First day of a month
+        count: Months to add (may be negative)
+
+    Returns:
+        date: First day of the shifted month
+    """
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """Name of a table's partition for a month"""
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def default_partition_name(table: str) -> str:
+    """Name of a table's DEFAULT partition (rows outside every monthly range)"""
+    return f"{table}_default"
+
+
+def parse_partition_month(table: str, name: str) -> Optional[date]:
+    """
+    Read the month back from a partition name
+
+    Args:
+        table: Parent table name
+        name: Partition name
+
+    Returns:
+        Optional[date]: First day of its month, or None if name is not a
+        monthly partition of table
+    """
+    match = _PARTITION_NAME.match(name)
+    if not match or match["table"] != table:
+        return None
+    return date(int(match["year"]), int(match["month"]), 1)
+
+
+def create_partition_sql(table: str, month: date) -> str:
+    """
+    DDL creating a table's partition for a month, if missing
+
+    Args:
+        table: Parent (partitioned) table name
+        month: First day of the month
+
+    Returns:
+        str: CREATE TABLE ... PARTITION OF statement
+    """
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(table, month)}" '
+        f'PARTITION OF "{table}" '
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+def create_default_partition_sql(table: str) -> str:
+    """
+    DDL creating a table's DEFAULT partition, if missing
+
+    Args:
+        table: Parent (partitioned) table name
+
+    Returns:
+        str: CREATE TABLE ... PARTITION OF ... DEFAULT statement
+    """
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{default_partition_name(table)}" '
+        f'PARTITION OF "{table}" DEFAULT'
+    )
+
+
+def months_between(first: date, last: date) -> List[date]:
+    """
+    Every month from first through last, inclusive
+
+    Args:
+        first: Any day of the first month
+        last: Any day of the last month
+
+    Returns:
+        List[date]: First day of each month
+    """
+    months = []
+    month = month_start(first)
+    while month <= month_start(last):
+        months.append(month)
+        month = add_months(month, 1)
+    return months
+
+
+def expired_partitions(
+    table: str, partitions: List[str], today: date, retention_months: int
+) -> List[Tuple[str, date]]:
+    """
+    Pick the partitions entirely older than the retention window
+
+    Args:
+        table: Parent table name
+        partitions: Names of the table's current partitions
+        today: Reference date
+        retention_months: Full months kept before the current one (0 = keep all)
+
+    Returns:
+        List[Tuple[str, date]]: (name, month) of expired partitions, oldest first
+    """
+    if retention_months <= 0:
+        return []
+    cutoff = add_months(month_start(today), -retention_months)
+    expired = []
+    for name in partitions:
+        month = parse_partition_month(table, name)
+        if month is not None and month < cutoff:
+            expired.append((name, month))
+    return sorted(expired, key=lambda item: item[1])
+
+
+@dataclass
+class MaintenanceReport:
+    """Partitions created and retired, and default-partition rows moved, by one maintenance run"""
+
+    created: List[str] = field(default_factory=list)
+    detached: List[str] = field(default_factory=list)
+    dropped: List[str] = field(default_factory=list)
+    moved: int = 0
+
+
+def list_partitions(conn: Connection, table: str) -> List[str]:
+    """
+    Names of a partitioned table's current partitions
+
+    The table is resolved through the search_path, like the DDL that
+    creates and detaches partitions, so a same-named table in another
+    schema is never listed.
+
+    Args:
+        conn: Database connection
+        table: Parent table name
+
+    Returns:
+        List[str]: Partition names
+    """
+    rows = conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = CAST(:table AS regclass)"
+        ),
+        {"table": table},
+    )
+    return [name for (name,) in rows]
+
+
+def default_partition_months(conn: Connection, table: str) -> List[date]:
+    """
+    Months that have rows in a table's DEFAULT partition
+
+    Args:
+        conn: Database connection
+        table: Parent table name
+
+    Returns:
+        List[date]: First day of each month, oldest first
+    """
+    rows = conn.execute(
+        text(
+            "SELECT DISTINCT date_trunc('month', \"timestamp\")::date "
+            f'FROM "{default_partition_name(table)}" ORDER BY 1'
+        )
+    )
+    return [month for (month,) in rows]
+
+
+def maintain_partitions(
+    conn: Connection,
+    months_ahead: int = 3,
+    retention_months: int = 0,
+    drop: bool = True,
+    today: Optional[date] = None,
+) -> MaintenanceReport:
+    """
+    Create upcoming monthly partitions and retire expired ones
+
+    Also creates each table's DEFAULT partition and empties it: rows there
+    get their months' partitions and are moved into them (the DEFAULT
+    partition is detached meanwhile, as PostgreSQL refuses a new range
+    that overlaps rows it holds). Runs in the caller's transaction, under
+    an advisory lock so concurrent runs do not race.
+
+    Args:
+        conn: Database connection (in a transaction)
+        months_ahead: Months after the current one to create in advance
+        retention_months: Full months kept before the current one (0 = keep all)
+        drop: Drop retired partitions; if False they are only detached
+            (left as standalone tables, e.g. for archiving)
+        today: Reference date (defaults to the current UTC date)
+
+    Returns:
+        MaintenanceReport: Partitions created, detached and dropped, and rows moved
+    """
+    today = today or datetime.utcnow().date()
+    report = MaintenanceReport()
+    conn.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": _ADVISORY_LOCK_ID})
+
+    for table in PARTITIONED_TABLES:
+        existing = set(list_partitions(conn, table))
+        default = default_partition_name(table)
+        if default in existing:
+            stray = default_partition_months(conn, table)
+        else:
+            conn.execute(text(create_default_partition_sql(table)))
+            report.created.append(default)
+            stray = []
+
+        if stray:
+            conn.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{default}"'))
+        for month in sorted(set(months_between(today, add_months(today, months_ahead)) + stray)):
+            name = partition_name(table, month)
+            if name not in existing:
+                conn.execute(text(create_partition_sql(table, month)))
+                report.created.append(name)
+        if stray:
+            # Every month in the detached default now has a partition to route to
+            report.moved += conn.execute(
+                text(f'INSERT INTO "{table}" SELECT * FROM "{default}"')
+            ).rowcount
+            conn.execute(text(f'TRUNCATE "{default}"'))
+            conn.execute(text(f'ALTER TABLE "{table}" ATTACH PARTITION "{default}" DEFAULT'))
+
+        for name, _ in expired_partitions(
+            table, list_partitions(conn, table), today, retention_months
+        ):
+            conn.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"'))
+            report.detached.append(name)
+            if drop:
+                conn.execute(text(f'DROP TABLE "{name}"'))
+                report.dropped.append(name)
+
+    return report
+
+
+def main() -> None:
+    """Run partition maintenance with the configured settings"""
+    from app.config import settings
+    from app.db.session import engine
+
+    with engine.begin() as conn:
+        report = maintain_partitions(
+            conn,
+            months_ahead=settings.partition_months_ahead,
+            retention_months=settings.event_retention_months,
+            drop=settings.event_retention_drop,
+        )
+    print(
+        f"created={report.created} detached={report.detached} dropped={report.dropped} "
+        f"moved={report.moved}"
+    )
+
+
+if __name__ == "__main__":
+    main()
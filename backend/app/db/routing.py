@@ -0,0 +1,80 @@
+"""Read-your-writes tracking for read-replica routing
+
+Read-only routes query the replica, which may lag the primary. A client
+that has just written is pinned to the primary for a short window, so
+it sees its own change on the next read.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Hashable, Optional
+
+
+class ReadYourWrites:
+    """
+    Thread-safe record of recent writers, each kept for a fixed window
+
+    State is per process: with several workers, a client stays sticky
+    only on the worker that handled its write. Size the window to
+    cover typical replica lag.
+    """
+
+    def __init__(
+        self,
+        window: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+        maxsize: int = 100_000,
+    ):
+        self.window = window
+        self.maxsize = maxsize
+        self._clock = clock
+        self._until: Dict[Hashable, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._until)
+
+    def record_write(self, client: Optional[Hashable]) -> None:
+        """
+        Pin a client to the primary for the next window seconds
+
+        Args:
+            client: Client identity (e.g. the JWT subject); None is ignored
+        """
+        if client is None or self.window <= 0:
+            return
+        now = self._clock()
+        with self._lock:
+            self._until.pop(client, None)
+            self._until[client] = now + self.window
+            if len(self._until) > self.maxsize:
+                self._prune(now)
+
+    def is_sticky(self, client: Optional[Hashable]) -> bool:
+        """
+        Check whether a client's reads must still go to the primary
+
+        Args:
+            client: Client identity; None is never sticky
+
+        Returns:
+            bool: True within the window after the client's last write
+        """
+        if client is None:
+            return False
+        with self._lock:
+            until = self._until.get(client)
+            if until is None:
+                return False
+            if self._clock() >= until:
+                del self._until[client]
+                return False
+            return True
+
+    def _prune(self, now: float) -> None:
+        """Drop expired entries, then the oldest ones beyond maxsize (lock held)"""
+        for client in [client for client, until in self._until.items() if until <= now]:
+            del self._until[client]
+        # Entries are kept in write order, so the first ones are the oldest
+        while len(self._until) > self.maxsize:
+            del self._until[next(iter(self._until))]
@@ -1,12 +1,38 @@
 """Database session and engine configuration"""
 
-from sqlalchemy import create_engine
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Hashable, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.config import settings
+from app.db.routing import ReadYourWrites
+
+
+def async_database_url(database_url: str) -> str:
+    """
+    Get the asyncpg form of a PostgreSQL connection string
+
+    Args:
+        database_url: postgresql:// (or postgresql+psycopg2://) URL
 
-# Create SQLAlchemy engine
+    Returns:
+        str: postgresql+asyncpg:// URL
+    """
+    url = make_url(database_url)
+    if url.drivername in ("postgresql", "postgres", "postgresql+psycopg2"):
+        url = url.set(drivername="postgresql+asyncpg")
+    # asyncpg spells libpq's sslmode as ssl
+    if "sslmode" in url.query:
+        url = url.update_query_dict({"ssl": url.query["sslmode"]}).difference_update_query(["sslmode"])
+    return url.render_as_string(hide_password=False)
+
+
+# Create SQLAlchemy engine (scripts, migrations and backfills)
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,  # Verify connections before using
@@ -18,6 +44,43 @@ engine = create_engine(
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create async engine (API routes) with the same pool settings
+async_engine = create_async_engine(
+    async_database_url(settings.database_url),
+    pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+)
+
+# Create AsyncSessionLocal class (objects stay readable after commit)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+# Create read replica engine (read-only routes); falls back to the primary
+replica_engine = create_async_engine(
+    async_database_url(settings.database_replica_url),
+    pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+) if settings.database_replica_url else async_engine
+
+# Create AsyncReadSessionLocal class
+AsyncReadSessionLocal = async_sessionmaker(
+    replica_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+# Clients that wrote recently read from the primary (read-your-writes)
+read_your_writes = ReadYourWrites(window=settings.replica_sticky_seconds)
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_committed(session: Session) -> None:
+    """Flag sessions that committed, so their client can be made sticky"""
+    session.info["committed"] = True
+
 # Create Base class for models
 Base = declarative_base()
 
@@ -36,3 +99,42 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+@asynccontextmanager
+async def primary_session(client: Optional[Hashable] = None) -> AsyncIterator[AsyncSession]:
+    """
+    Open an async session on the primary (writes).
+
+    Synchronous service code runs on the same connection and transaction
+    via db.run_sync(fn, *args). A commit pins the client's reads to the
+    primary for settings.replica_sticky_seconds. Route handlers get it
+    through app.api.deps.get_async_db.
+
+    Args:
+        client: Client identity for read-your-writes (None skips tracking)
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+        if db.info.get("committed"):
+            read_your_writes.record_write(client)
+
+
+@asynccontextmanager
+async def read_session(client: Optional[Hashable] = None) -> AsyncIterator[AsyncSession]:
+    """
+    Open an async session for read-only work.
+
+    Reads go to the replica (when configured), except for clients that
+    wrote within the stickiness window, who read from the primary. Route
+    handlers get it through app.api.deps.get_read_db.
+
+    Args:
+        client: Client identity for read-your-writes (None always uses the replica)
+    """
+    if read_your_writes.is_sticky(client):
+        factory = AsyncSessionLocal
+    else:
+        factory = AsyncReadSessionLocal
+    async with factory() as db:
+        yield db
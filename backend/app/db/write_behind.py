@@ -0,0 +1,208 @@
+"""Write-behind buffer for append-only event rows
+
+Request handlers enqueue rows without touching the database; a background
+task writes them as multi-row INSERTs once max_batch rows are pending or
+flush_interval seconds have passed, whichever comes first. Memory and
+flush time are bounded: rows beyond max_pending are dropped (and counted),
+and each write is cut off after flush_timeout seconds. Pending rows are
+written out when the buffer is stopped.
+
+Delivery is best effort. Rows still pending when a worker dies, and
+batches whose write fails, are lost, so only use it for data that can
+tolerate that (view events, audit trails), never for business state.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Writes one batch of rows for one model (e.g. a multi-row INSERT)
+BatchWriter = Callable[[Any, List[Dict[str, Any]]], Awaitable[None]]
+
+
+@dataclass
+class WriteBehindStats:
+    """
+    Counters for a write-behind buffer
+
+    enqueued: rows accepted
+    written: rows written
+    dropped: rows refused because the buffer was full
+    failed: rows lost because their batch write failed or timed out
+    flushes: batch writes attempted
+    """
+
+    enqueued: int = 0
+    written: int = 0
+    dropped: int = 0
+    failed: int = 0
+    flushes: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, counter: str, amount: int = 1) -> None:
+        """Increment a counter by name"""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert to dictionary for logging/metrics"""
+        return {
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "flushes": self.flushes,
+        }
+
+
+class WriteBehindBuffer:
+    """
+    Bounded in-memory queue of rows, flushed in batches by a background task
+
+    Rows for different models share the queue and are grouped per model
+    at flush time, keeping their relative order within each model.
+    """
+
+    def __init__(
+        self,
+        write: BatchWriter,
+        max_batch: int = 500,
+        flush_interval: float = 1.0,
+        max_pending: int = 50_000,
+        flush_timeout: float = 10.0,
+    ):
+        self.write = write
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.flush_timeout = flush_timeout
+        self.stats = WriteBehindStats()
+        self._pending: Deque[Tuple[Any, Dict[str, Any]]] = deque()
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._flush_lock: Optional[asyncio.Lock] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def running(self) -> bool:
+        """Whether the background flush task is active"""
+        return self._task is not None and not self._task.done()
+
+    def enqueue(self, model, row: Dict[str, Any]) -> bool:
+        """
+        Queue one row for insertion without blocking
+
+        Args:
+            model: Mapped class the row belongs to
+            row: Column values
+
+        Returns:
+            bool: False if the row was dropped because the buffer is full
+        """
+        if len(self._pending) >= self.max_pending:
+            self.stats.record("dropped")
+            return False
+        self._pending.append((model, row))
+        self.stats.record("enqueued")
+        if self._wake is not None and len(self._pending) >= self.max_batch:
+            self._wake.set()
+        return True
+
+    def enqueue_many(self, model, rows: List[Dict[str, Any]]) -> int:
+        """
+        Queue several rows for the same model
+
+        Args:
+            model: Mapped class the rows belong to
+            rows: Column values per row
+
+        Returns:
+            int: Number of rows accepted
+        """
+        return sum(self.enqueue(model, row) for row in rows)
+
+    async def start(self) -> None:
+        """Start the background flush task (call once the event loop runs)"""
+        if self.running:
+            return
+        self._stopping = False
+        self._wake = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background task after writing out pending rows
+
+        Args:
+            timeout: Seconds to wait for the drain (None = until done)
+        """
+        if not self.running:
+            await self.flush()
+            return
+        self._stopping = True
+        self._wake.set()
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Write-behind drain timed out with %d rows pending", len(self._pending))
+        self._task = None
+
+    async def flush(self) -> int:
+        """
+        Write out every row pending now, in batches of at most max_batch
+
+        Returns:
+            int: Number of rows written
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            written = 0
+            while self._pending:
+                written += await self._flush_batch()
+            return written
+
+    async def _run(self) -> None:
+        """Flush on size or time until stopped, then drain"""
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+        await self.flush()
+
+    async def _flush_batch(self) -> int:
+        """Write up to max_batch pending rows, one write per model"""
+        batches: Dict[Any, List[Dict[str, Any]]] = {}
+        for _ in range(min(self.max_batch, len(self._pending))):
+            model, row = self._pending.popleft()
+            batches.setdefault(model, []).append(row)
+
+        written = 0
+        for model, rows in batches.items():
+            self.stats.record("flushes")
+            try:
+                await asyncio.wait_for(self.write(model, rows), self.flush_timeout)
+            except Exception:
+                self.stats.record("failed", len(rows))
+                logger.warning(
+                    "Write-behind flush of %d %s rows failed",
+                    len(rows),
+                    getattr(model, "__name__", model),
+                    exc_info=True,
+                )
+            else:
+                self.stats.record("written", len(rows))
+                written += len(rows)
+        return written
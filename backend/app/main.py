@@ -1,10 +1,53 @@
 """FitHire FastAPI Application Entry Point"""
 
-from fastapi import FastAPI
+import asyncio
+import contextlib
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.config import settings
+from app.utils.auth import require_role
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Prepare event partitions; run the event writer, scoring pool and engagement re-aging while the worker lives"""
+    from app.db.partitions import maintain_partitions
+    from app.db.session import async_engine
+    from app.services.coverage import parallel_scorer
+    from app.services.events import event_buffer
+    from app.services.matching import refresh_engagement_periodically
+
+    # Make sure upcoming monthly partitions exist (retention runs as a scheduled job)
+    try:
+        async with async_engine.begin() as conn:
+            await conn.run_sync(maintain_partitions, months_ahead=settings.partition_months_ahead)
+    except Exception:
+        logger.warning("Event partition maintenance failed", exc_info=True)
+
+    await event_buffer.start()
+    parallel_scorer.start()
+    # Stored engagement scores age out of the recency bonus without any profile edit
+    engagement_task = None
+    if settings.engagement_refresh_seconds > 0:
+        engagement_task = asyncio.create_task(
+            refresh_engagement_periodically(settings.engagement_refresh_seconds)
+        )
+    yield
+    if engagement_task is not None:
+        engagement_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await engagement_task
+    parallel_scorer.stop()
+    # Write out queued events before the worker exits
+    await event_buffer.stop(timeout=30)
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -13,6 +56,7 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs" if settings.is_development else None,  # Disable docs in production
     redoc_url="/redoc" if settings.is_development else None,
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -43,6 +87,32 @@ async def health_check():
     )
 
 
+@app.get(
+    "/metrics",
+    tags=["Health"],
+    dependencies=[Depends(require_role("regional_director", "brand_admin"))],
+)
+async def metrics():
+    """
+    FitScore cache and ranking counters for this worker (admins only).
+
+    Returns:
+        dict: Score and response cache hit/miss/eviction counters, pruning
+        counters of live match ranking (coaches without stored matches) and
+        buffered event writer counters
+    """
+    from app.core.fitscore.ranking import pruning_stats
+    from app.services.events import event_buffer
+    from app.services.matching import response_cache, score_cache
+
+    return {
+        "score_cache": {**score_cache.stats.to_dict(), "size": len(score_cache.local)},
+        "response_cache": {**response_cache.stats.to_dict(), "size": len(response_cache.local)},
+        "ranking": pruning_stats.to_dict(),
+        "events": {**event_buffer.stats.to_dict(), "pending": len(event_buffer)},
+    }
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """
@@ -59,10 +129,11 @@ async def root():
 
 
 # API v1 routes
-from app.api.v1.routes import coaches, jobs
+from app.api.v1.routes import admin, coaches, jobs  # noqa: E402
 
 app.include_router(coaches.router, prefix="/api/v1")
 app.include_router(jobs.router, prefix="/api/v1")
+app.include_router(admin.router, prefix="/api/v1")
 
 
 if __name__ == "__main__":
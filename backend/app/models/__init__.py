@@ -4,11 +4,13 @@ Import all models here so Alembic can detect them for migrations.
 """
 
 from app.db.session import Base  # noqa: F401
-from app.models.brand import Brand, Region, Location  # noqa: F401
-from app.models.user import User, UserScope  # noqa: F401
+from app.models.analytics import MatchFunnelRollup, RollupWatermark  # noqa: F401
+from app.models.audit import AuditLog, MatchEvent  # noqa: F401
+from app.models.brand import Brand, Location, Region  # noqa: F401
 from app.models.coach import Coach  # noqa: F401
 from app.models.job import Job  # noqa: F401
-from app.models.audit import AuditLog, MatchEvent  # noqa: F401
+from app.models.match import Match, PoolVersion  # noqa: F401
+from app.models.user import User, UserScope  # noqa: F401
 
 # Export all models
 __all__ = [
@@ -20,6 +22,10 @@ __all__ = [
     "UserScope",
     "Coach",
     "Job",
+    "Match",
+    "PoolVersion",
     "AuditLog",
     "MatchEvent",
+    "MatchFunnelRollup",
+    "RollupWatermark",
 ]
\ No newline at end of file
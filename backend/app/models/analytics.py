@@ -0,0 +1,65 @@
+"""Incrementally maintained analytics rollups"""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, SmallInteger, String
+from sqlalchemy.orm import relationship
+
+from app.db.session import Base
+
+
+class MatchFunnelRollup(Base):
+    """
+    MatchEvent counts per job and FitScore band
+
+    Maintained by app.services.funnel from new match_events rows only
+    (see RollupWatermark), so funnel reports never scan the event history.
+    Brand totals are sums over the brand's rows. score_band is the tenth
+    of the FitScore range of fitscore_at_event (0-9), or -1 if none was
+    recorded (see app.utils.funnel).
+    """
+
+    __tablename__ = "match_funnel_rollups"
+
+    brand_id = Column(Integer, ForeignKey("brands.id"), primary_key=True)
+    job_id = Column(
+        Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
+    score_band = Column(SmallInteger, primary_key=True)
+
+    # Event counts
+    viewed = Column(BigInteger, nullable=False, default=0)
+    applied = Column(BigInteger, nullable=False, default=0)
+    interviewed = Column(BigInteger, nullable=False, default=0)
+    hired = Column(BigInteger, nullable=False, default=0)
+    rejected = Column(BigInteger, nullable=False, default=0)
+
+    # Metadata
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    job = relationship("Job")
+
+    def __repr__(self):
+        return f"<MatchFunnelRollup(job_id={self.job_id}, score_band={self.score_band}, viewed={self.viewed})>"
+
+
+class RollupWatermark(Base):
+    """
+    Progress of an incremental rollup through its source table
+
+    Events with id <= last_event_id are counted. seen_event_id is the
+    highest id observed on the previous run; it becomes the next upper
+    bound, so rows whose inserts were still in flight when an id was
+    observed have committed before they are counted.
+    """
+
+    __tablename__ = "rollup_watermarks"
+
+    name = Column(String(100), primary_key=True)
+    last_event_id = Column(BigInteger, nullable=False, default=0)
+    seen_event_id = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<RollupWatermark(name='{self.name}', last_event_id={self.last_event_id})>"
@@ -1,4 +1,10 @@
-"""Audit logging and match event tracking models"""
+"""Audit logging and match event tracking models
+
+Both tables are append-only and range partitioned by month on "timestamp"
+(see app.db.partitions), so the partition key is part of the primary key.
+Queries over a time range should bound timestamp to be pruned to the
+matching partitions.
+"""
 
 from datetime import datetime
 from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Numeric
@@ -14,8 +20,9 @@ class AuditLog(Base):
     """
 
     __tablename__ = "audit_logs"
+    __table_args__ = {"postgresql_partition_by": 'RANGE ("timestamp")'}
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     brand_id = Column(Integer, ForeignKey("brands.id"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
 
@@ -31,8 +38,8 @@ class AuditLog(Base):
         JSONB, nullable=True
     )  # {"old_score": 0.75, "new_score": 0.82, "reason": "certification_added"}
 
-    # Metadata
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    # Metadata (timestamp is the partition key)
+    timestamp = Column(DateTime, default=datetime.utcnow, primary_key=True, index=True)
     ip_address = Column(String(50), nullable=True)
 
     # Relationships
@@ -51,8 +58,9 @@ class MatchEvent(Base):
     """
 
     __tablename__ = "match_events"
+    __table_args__ = {"postgresql_partition_by": 'RANGE ("timestamp")'}
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     coach_id = Column(Integer, ForeignKey("coaches.id"), nullable=False, index=True)
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False, index=True)
     brand_id = Column(Integer, ForeignKey("brands.id"), nullable=False, index=True)
@@ -66,8 +74,8 @@ class MatchEvent(Base):
     # Actor
     triggered_by = Column(Integer, ForeignKey("users.id"), nullable=True)  # Who caused this event
 
-    # Metadata
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    # Metadata (timestamp is the partition key)
+    timestamp = Column(DateTime, default=datetime.utcnow, primary_key=True, index=True)
 
     # Relationships
     coach = relationship("Coach")
@@ -1,7 +1,8 @@
 """Coach model for fitness professional profiles"""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Numeric
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, Numeric, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
@@ -14,6 +15,35 @@ class Coach(Base):
     """
 
     __tablename__ = "coaches"
+    __table_args__ = (
+        # Newest-first listings and their keyset cursors
+        Index("ix_coaches_created_at_id", "created_at", "id"),
+        # Candidate pools: verified coaches in a city with a given role
+        Index("ix_coaches_status_city_state_role", "status", "city", "state", "role_type"),
+        Index(
+            "ix_coaches_verified_pool",
+            "city",
+            "state",
+            "role_type",
+            postgresql_where=text("status = 'verified'"),
+        ),
+        # JSONB containment (@>) filters on requirements and tags
+        *(
+            Index(
+                f"ix_coaches_{name}_gin",
+                name,
+                postgresql_using="gin",
+                postgresql_ops={name: "jsonb_path_ops"},
+            )
+            for name in (
+                "certifications",
+                "available_times",
+                "lifestyle_tags",
+                "movement_tags",
+                "instruction_tags",
+            )
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
@@ -23,6 +53,9 @@ class Coach(Base):
     bio = Column(Text, nullable=True)
     city = Column(String(100), nullable=False)
     state = Column(String(50), nullable=False)
+    role_type = Column(
+        String(100), nullable=True
+    )  # 'group_fitness_instructor', 'personal_trainer', 'yoga_instructor', 'pilates_instructor'
 
     # Experience
     years_experience = Column(Integer, nullable=False)
@@ -47,6 +80,7 @@ class Coach(Base):
     social_links = Column(JSONB, nullable=True)  # {"instagram": "...", "youtube": "..."}
 
     # Metadata
+    status = Column(String(20), nullable=False, default="pending")  # 'pending', 'verified'
     profile_completeness = Column(Numeric(3, 2), nullable=True)  # 0.00 to 1.00
     verified_at = Column(DateTime, nullable=True)
     last_updated = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -1,7 +1,19 @@
 """Job model for job listings"""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Numeric
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
@@ -14,6 +26,18 @@ class Job(Base):
     """
 
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Newest-first listings and their keyset cursors
+        Index("ix_jobs_created_at_id", "created_at", "id"),
+        # Match pools: open jobs in a city
+        Index("ix_jobs_status_city_state", "status", "city", "state"),
+        Index(
+            "ix_jobs_open_pool",
+            "city",
+            "state",
+            postgresql_where=text("status = 'open'"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     brand_id = Column(Integer, ForeignKey("brands.id"), nullable=False, index=True)
@@ -51,6 +75,8 @@ class Job(Base):
     compensation_max = Column(Integer, nullable=True)
 
     # Status
+    # 'draft', 'open', 'filled', 'closed'
+    status = Column(String(20), nullable=False, default="draft")
     is_active = Column(Boolean, default=True, nullable=False, index=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
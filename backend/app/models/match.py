@@ -0,0 +1,123 @@
+"""Pre-calculated match scores"""
+
+from datetime import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.orm import relationship
+
+from app.db.session import Base
+
+
+class Match(Base):
+    """
+    Persisted FitScore for a coach-job pair
+
+    Maintained incrementally by app.services.matching whenever a coach or
+    job changes, so candidate and match lists are read instead of scored.
+    Rows are kept for every verified coach / open job pair in the same
+    city; role match and the job's threshold are applied at read time.
+    """
+
+    __tablename__ = "matches"
+
+    id = Column(Integer, primary_key=True, index=True)
+    coach_id = Column(Integer, ForeignKey("coaches.id", ondelete="CASCADE"), nullable=False)
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False)
+    brand_id = Column(Integer, ForeignKey("brands.id"), nullable=False, index=True)
+
+    # Whether coach and job role types agree (required for job candidate lists)
+    role_match = Column(Boolean, nullable=False)
+
+    # Preset the score was computed with
+    preset = Column(String(50), nullable=False)
+
+    # Score (rounded to 3 decimals, as returned by the engine)
+    fitscore = Column(Numeric(5, 3), nullable=False)
+
+    # Sub-scores, unrounded, so a partial re-score can recombine them into
+    # exactly the fitscore a full calculation produces (rounded on read)
+    cert_score = Column(Float, nullable=False)
+    experience_score = Column(Float, nullable=False)
+    availability_score = Column(Float, nullable=False)
+    location_score = Column(Float, nullable=False)
+    culture_score = Column(Float, nullable=False)
+    engagement_score = Column(Float, nullable=False)
+
+    # Metadata
+    computed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    coach = relationship("Coach")
+    job = relationship("Job")
+
+    __table_args__ = (
+        UniqueConstraint("coach_id", "job_id", name="uq_matches_coach_job"),
+        # Ranked reads are served from these indexes alone (index-only scans)
+        Index(
+            "ix_matches_job_rank",
+            "job_id",
+            fitscore.desc(),
+            "coach_id",
+            postgresql_include=[
+                "cert_score",
+                "experience_score",
+                "availability_score",
+                "location_score",
+                "culture_score",
+                "engagement_score",
+            ],
+            postgresql_where=text("role_match"),
+        ),
+        Index(
+            "ix_matches_coach_rank",
+            "coach_id",
+            fitscore.desc(),
+            "job_id",
+            postgresql_include=[
+                "cert_score",
+                "experience_score",
+                "availability_score",
+                "location_score",
+                "culture_score",
+                "engagement_score",
+            ],
+        ),
+    )
+
+    def __repr__(self):
+        return f"<Match(coach_id={self.coach_id}, job_id={self.job_id}, fitscore={self.fitscore})>"
+
+
+class PoolVersion(Base):
+    """
+    Change counter for the coaches, jobs or stored matches of one city
+
+    Bumped (app.services.pool_versions) in the same transaction as any
+    insert, update or delete of a coach or job there, or any refresh of its
+    match rows, so a candidate or match list can be fingerprinted from a
+    few rows instead of re-reading the scoring pool.
+    """
+
+    __tablename__ = "pool_versions"
+
+    pool = Column(String(20), primary_key=True)  # 'coaches', 'jobs' or 'matches'
+    city = Column(String(100), primary_key=True)
+    state = Column(String(50), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=1)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<PoolVersion(pool='{self.pool}', city='{self.city}', state='{self.state}', version={self.version})>"
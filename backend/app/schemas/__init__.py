@@ -1,16 +1,21 @@
 """Pydantic schemas for API requests and responses"""
 
-from app.schemas.coach import CoachCreate, CoachUpdate, CoachResponse, CoachListResponse
-from app.schemas.job import JobCreate, JobUpdate, JobResponse, JobListResponse
+from app.schemas.bulk import BulkImportResponse, BulkRowError
+from app.schemas.coach import CoachCreate, CoachListResponse, CoachResponse, CoachUpdate
+from app.schemas.job import JobCreate, JobListResponse, JobResponse, JobUpdate
 from app.schemas.match import (
-    FitScoreBreakdown,
-    CoachMatchResult,
     CoachMatchesResponse,
+    CoachMatchResult,
+    FitScoreBreakdown,
     JobCandidateResult,
+    JobCandidatesBatchRequest,
+    JobCandidatesBatchResponse,
     JobCandidatesResponse,
 )
 
 __all__ = [
+    "BulkImportResponse",
+    "BulkRowError",
     "CoachCreate",
     "CoachUpdate",
     "CoachResponse",
@@ -24,4 +29,6 @@ __all__ = [
     "CoachMatchesResponse",
     "JobCandidateResult",
     "JobCandidatesResponse",
+    "JobCandidatesBatchRequest",
+    "JobCandidatesBatchResponse",
 ]
@@ -0,0 +1,22 @@
+"""Pydantic schemas for bulk coach/job imports"""
+
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class BulkRowError(BaseModel):
+    """Errors for one rejected input row"""
+
+    row: int = Field(..., description="1-based row number (CSV header excluded)")
+    errors: List[str]
+
+
+class BulkImportResponse(BaseModel):
+    """Result of a bulk import"""
+
+    received: int = Field(..., description="Rows parsed from the upload")
+    created: int = Field(..., description="Rows inserted")
+    failed: int = Field(..., description="Rows rejected")
+    ids: List[int] = Field(..., description="IDs of inserted rows, in input order")
+    errors: List[BulkRowError]
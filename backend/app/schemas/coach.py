@@ -1,8 +1,9 @@
 """Pydantic schemas for Coach endpoints"""
 
-from typing import Optional, List
 from datetime import datetime
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from typing import List, Optional
+
+from pydantic import BaseModel, Field, HttpUrl, field_validator, model_validator
 
 
 class CertificationItem(BaseModel):
@@ -12,6 +13,14 @@ class CertificationItem(BaseModel):
     expiry_date: Optional[str] = Field(None, description="ISO date when expires")
     credential_id: Optional[str] = Field(None, description="Credential ID or number")
 
+    @model_validator(mode="before")
+    @classmethod
+    def accept_name_only(cls, data):
+        """Accept a bare certification name (e.g. from CSV imports)"""
+        if isinstance(data, str):
+            return {"name": data}
+        return data
+
 
 class CoachCreate(BaseModel):
     """Schema for creating a new coach profile"""
@@ -157,7 +166,11 @@ class CoachResponse(BaseModel):
 class CoachListResponse(BaseModel):
     """Schema for paginated coach list"""
     coaches: List[CoachResponse]
-    total: int
-    page: int
+    total: Optional[int] = Field(None, description="Matching rows (omitted when count=none)")
+    total_is_estimate: bool = Field(
+        False, description="Whether total comes from planner statistics"
+    )
+    page: Optional[int] = Field(None, description="Page number (page-number pagination only)")
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if any")
@@ -0,0 +1,56 @@
+"""Pydantic schemas for the brand coverage dashboard"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class RankedEntry(BaseModel):
+    """A coach or job in a top-k list"""
+
+    id: int
+    fitscore: float
+
+
+class JobCoverage(BaseModel):
+    """Candidate coverage for one open job"""
+
+    job_id: int
+    title: str
+    role_type: str
+    threshold: float = Field(..., description="FitScore threshold used for filtering")
+    candidates_above_threshold: int = Field(
+        ..., description="Verified coaches with a matching role above threshold"
+    )
+    top_candidates: List[RankedEntry] = Field(..., description="Top coaches, best first")
+
+
+class CityCoverage(BaseModel):
+    """Coverage for all open jobs in one city/state"""
+
+    city: str
+    state: str
+    coach_count: int = Field(..., description="Verified coaches in the city")
+    job_count: int = Field(..., description="Open jobs in the city")
+    jobs: List[JobCoverage]
+
+
+class CoachCoverage(BaseModel):
+    """Job coverage for one verified coach"""
+
+    coach_id: int
+    city: str
+    state: str
+    matches_above_threshold: int = Field(..., description="Open jobs scoring above their threshold")
+    top_jobs: List[RankedEntry] = Field(..., description="Top jobs, best first")
+
+
+class CoverageResponse(BaseModel):
+    """Response schema for the brand/region coverage matrix"""
+
+    brand_id: int
+    region_id: Optional[int] = None
+    k: int = Field(..., description="Length of each top-k list")
+    pairs_scored: int = Field(..., description="Coach-job pairs scored")
+    groups: List[CityCoverage]
+    coaches: List[CoachCoverage]
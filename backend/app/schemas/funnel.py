@@ -0,0 +1,47 @@
+"""Pydantic schemas for match funnel analytics"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class FunnelCounts(BaseModel):
+    """Match event counts and conversion rates"""
+
+    viewed: int
+    applied: int
+    interviewed: int
+    hired: int
+    rejected: int
+    apply_rate: Optional[float] = Field(None, description="Applications per view")
+    interview_rate: Optional[float] = Field(None, description="Interviews per view")
+    hire_rate: Optional[float] = Field(None, description="Hires per view")
+    hire_per_application: Optional[float] = Field(None, description="Hires per application")
+
+
+class FunnelBand(FunnelCounts):
+    """Funnel for events whose FitScore fell in one band"""
+
+    band: int = Field(
+        ..., description="FitScore band (0-9, tenths of the score range; -1 = unscored)"
+    )
+    min_fitscore: Optional[float] = Field(
+        None, description="Lowest FitScore in the band (inclusive)"
+    )
+    max_fitscore: Optional[float] = Field(
+        None, description="Highest FitScore in the band (exclusive, except 1.0)"
+    )
+
+
+class FunnelResponse(BaseModel):
+    """Response schema for a brand's (or job's) match funnel"""
+
+    brand_id: int
+    job_id: Optional[int] = None
+    bands: List[FunnelBand] = Field(..., description="Funnel per FitScore band, highest first")
+    totals: FunnelCounts
+    last_event_id: int = Field(..., description="Events up to this id are counted")
+    refreshed_at: Optional[datetime] = Field(
+        None, description="When the rollups were last refreshed"
+    )
@@ -184,7 +184,11 @@ class JobResponse(BaseModel):
 class JobListResponse(BaseModel):
     """Schema for paginated job list"""
     jobs: List[JobResponse]
-    total: int
-    page: int
+    total: Optional[int] = Field(None, description="Matching rows (omitted when count=none)")
+    total_is_estimate: bool = Field(
+        False, description="Whether total comes from planner statistics"
+    )
+    page: Optional[int] = Field(None, description="Page number (page-number pagination only)")
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if any")
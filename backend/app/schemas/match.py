@@ -1,6 +1,7 @@
 """Pydantic schemas for Match/FitScore endpoints"""
 
-from typing import List
+from typing import Dict, List, Optional
+
 from pydantic import BaseModel, Field
 
 from app.schemas.coach import CoachResponse
@@ -48,3 +49,42 @@ class JobCandidatesResponse(BaseModel):
     candidates: List[JobCandidateResult]
     total_candidates: int = Field(..., description="Total number of candidates above threshold")
     threshold: float = Field(..., description="FitScore threshold used for filtering")
+
+
+class JobCandidatesBatchRequest(BaseModel):
+    """Request schema for candidate lists of several jobs"""
+
+    job_ids: List[int] = Field(
+        ..., min_length=1, max_length=50, description="Jobs to rank candidates for"
+    )
+    limit: int = Field(20, ge=1, le=20, description="Maximum number of candidates per job")
+    strict: Optional[bool] = Field(None, description="As for GET /jobs/{job_id}/candidates")
+
+
+class JobCandidatesBatchResponse(BaseModel):
+    """Response with top coach candidates for several jobs"""
+
+    results: List[JobCandidatesResponse] = Field(
+        ..., description="One entry per found job, in request order"
+    )
+    missing_job_ids: List[int] = Field(
+        default_factory=list, description="Requested jobs that do not exist"
+    )
+
+
+class PresetRanking(BaseModel):
+    """Candidate ranking under one weighting preset"""
+
+    preset: str = Field(..., description="Preset name, or 'custom' for custom weights")
+    weights: Dict[str, float] = Field(..., description="Weight per score component")
+    candidates: List[JobCandidateResult]
+    total_candidates: int = Field(..., description="Total number of candidates above threshold")
+
+
+class JobPresetRankingsResponse(BaseModel):
+    """Response schema for comparing a job's candidates across presets"""
+
+    job_id: int
+    current_preset: str = Field(..., description="Preset the job is currently scored with")
+    threshold: float = Field(..., description="FitScore threshold used for filtering")
+    rankings: List[PresetRanking]
@@ -0,0 +1,5 @@
+"""Application services
+
+Database-backed workflows that sit between the API routes and the
+FitScore engine.
+"""
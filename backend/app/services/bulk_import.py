@@ -0,0 +1,171 @@
+"""Bulk import of coach and job records
+
+Records parsed by app.utils.bulk_records are validated in batches with a
+pydantic TypeAdapter and inserted with multi-row INSERTs, one transaction
+per chunk. A bad row never aborts the import: each row that fails
+parsing, validation or insertion is reported by its row number and the
+rest go through. Locations (and, for coaches, the owning user accounts)
+are resolved once per chunk.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+from sqlalchemy import insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.brand import Location
+from app.models.user import User
+from app.services.pool_versions import pool_version_bump
+from app.utils.bulk_records import RowError, validate_records
+
+# Rows validated and inserted per transaction
+BULK_CHUNK_SIZE = 1000
+
+
+@dataclass
+class BulkResult:
+    """Outcome of a bulk import"""
+
+    received: int = 0
+    created_ids: List[int] = field(default_factory=list)
+    errors: List[RowError] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a BulkImportResponse payload"""
+        return {
+            "received": self.received,
+            "created": len(self.created_ids),
+            "failed": len({error.row for error in self.errors}),
+            "ids": self.created_ids,
+            "errors": [{"row": error.row, "errors": error.errors} for error in self.errors],
+        }
+
+
+async def load_location_brands(db: AsyncSession, location_ids) -> Dict[int, int]:
+    """
+    Look up the brand of each location in one query
+
+    Args:
+        db: Database session
+        location_ids: Location IDs referenced by the batch
+
+    Returns:
+        Dict[int, int]: brand_id per existing location ID
+    """
+    ids = set(location_ids)
+    if not ids:
+        return {}
+    rows = await db.execute(select(Location.id, Location.brand_id).where(Location.id.in_(ids)))
+    return dict(rows.all())
+
+
+async def load_user_ids(db: AsyncSession, emails) -> Dict[str, int]:
+    """
+    Look up user accounts by email in one query
+
+    Args:
+        db: Database session
+        emails: Emails referenced by the batch
+
+    Returns:
+        Dict[str, int]: User ID per email that has an account
+    """
+    emails = set(emails)
+    if not emails:
+        return {}
+    rows = await db.execute(select(User.email, User.id).where(User.email.in_(emails)))
+    return dict(rows.all())
+
+
+async def _insert_each(
+    db: AsyncSession, statement, rows: List[Tuple[int, Dict]], errors: List[RowError]
+) -> List[int]:
+    """Insert rows one SAVEPOINT at a time, recording the ones that fail"""
+    ids = []
+    for row, values in rows:
+        try:
+            async with db.begin_nested():
+                ids.append((await db.scalars(statement, [values])).one())
+        except SQLAlchemyError as exc:
+            errors.append(RowError(row, [f"Insert failed: {getattr(exc, 'orig', exc)}"]))
+    await db.commit()
+    return ids
+
+
+async def bulk_import(
+    db: AsyncSession,
+    model,
+    schema: Type[BaseModel],
+    records: List[Tuple[int, Dict]],
+    build_row: Callable[..., Dict],
+    parse_errors: Sequence[RowError] = (),
+    chunk_size: int = BULK_CHUNK_SIZE,
+    owner_email: Optional[Callable[[BaseModel], str]] = None,
+) -> BulkResult:
+    """
+    Validate and insert records in chunks, one transaction per chunk
+
+    Args:
+        db: Database session (primary)
+        model: Mapped class to insert into (Coach, Job)
+        schema: Create schema the records must satisfy
+        records: (row number, record) pairs from parse_records
+        build_row: Builds the insert values from a validated model and its
+            location's brand_id (and its user_id, with owner_email)
+        parse_errors: Rows parse_records rejected (reported with the rest)
+        chunk_size: Rows per validation batch and transaction
+        owner_email: Email of the user account a row belongs to; when
+            given, rows whose email has no account are rejected
+
+    Returns:
+        BulkResult: Created IDs (in input order) and per-row errors
+    """
+    result = BulkResult(received=len(records) + len(parse_errors), errors=list(parse_errors))
+
+    for start in range(0, len(records), chunk_size):
+        valid, errors = validate_records(schema, records[start : start + chunk_size])
+        result.errors.extend(errors)
+
+        brands = await load_location_brands(db, (item.location_id for _, item in valid))
+        if owner_email is not None:
+            users = await load_user_ids(db, (owner_email(item) for _, item in valid))
+        rows: List[Tuple[int, Dict]] = []
+        for row, item in valid:
+            brand_id = brands.get(item.location_id)
+            if brand_id is None:
+                result.errors.append(
+                    RowError(row, [f"location_id: Location {item.location_id} not found"])
+                )
+            elif owner_email is None:
+                rows.append((row, build_row(item, brand_id)))
+            elif owner_email(item) not in users:
+                result.errors.append(
+                    RowError(row, [f"email: No user account for {owner_email(item)}"])
+                )
+            else:
+                rows.append((row, build_row(item, brand_id, users[owner_email(item)])))
+        if not rows:
+            continue
+
+        statement = insert(model).returning(model.id, sort_by_parameter_order=True)
+        try:
+            ids = (await db.scalars(statement, [values for _, values in rows])).all()
+            await db.commit()
+        except SQLAlchemyError:
+            # Retry row by row to pin the failure on the offending rows
+            await db.rollback()
+            ids = await _insert_each(db, statement, rows, result.errors)
+        result.created_ids.extend(ids)
+
+        # Core inserts skip the ORM flush hook that versions the city pools
+        if ids:
+            await db.execute(pool_version_bump(
+                (model.__tablename__, values["city"], values["state"]) for _, values in rows
+            ))
+            await db.commit()
+
+    result.errors.sort(key=lambda error: error.row)
+    return result
@@ -0,0 +1,183 @@
+"""Brand/region coverage: every verified coach scored against every open job
+
+Jobs are grouped by city/state and each group's coach pool is loaded once
+for all of its jobs. Each group is scored in a single blocked sweep
+(FitScoreEngine.rank_grid) that feeds both the per-job and the per-coach
+top-k lists, so the full coach x job matrix is never materialized. Coaches
+and jobs are read as scoring-column projections, not full entities.
+
+Only the reads run on the request's session; the sweeps are awaited off the
+event loop (ParallelScorer.rank_grid_async), split across the app's worker
+pool when it is started and large enough to pay off.
+
+Per-job lists follow the candidates endpoint (role types must agree);
+per-coach lists follow the coach matches endpoint (any role). Both apply
+each job's own threshold.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.fitscore.compiled import get_compiled_job
+from app.core.fitscore.encoding import get_encoded_coach
+from app.core.fitscore.engine import MatchScore
+from app.core.fitscore.parallel import ParallelScorer
+from app.models.brand import Location
+from app.models.coach import Coach
+from app.models.job import Job
+from app.services.matching import DEFAULT_THRESHOLD, coach_scoring_query, job_scoring_query
+
+# Worker pool started and stopped by the API lifespan (serial by default)
+parallel_scorer = ParallelScorer(
+    max_workers=settings.scoring_workers,
+    min_parallel_pairs=settings.parallel_min_pairs,
+)
+
+
+def _ranked(ranked: List[Tuple[int, MatchScore]], ids: List[int]) -> List[Dict]:
+    """Render (position, score) pairs as [{"id", "fitscore"}], best first"""
+    return [{"id": ids[position], "fitscore": score.fitscore} for position, score in ranked]
+
+
+def load_coverage_groups(
+    db: Session,
+    brand_id: int,
+    region_id: Optional[int] = None,
+) -> Dict[Tuple[str, str], Tuple[List, List]]:
+    """
+    Load a brand's open jobs and their cities' verified coaches
+
+    Args:
+        db: Database session
+        brand_id: Brand whose open jobs are covered
+        region_id: Restrict to jobs at locations in this region
+
+    Returns:
+        Dict[Tuple[str, str], Tuple[List, List]]: (city, state) -> (job rows,
+        coach rows), each ordered by id
+    """
+    query = job_scoring_query(db, Job.title).filter(Job.brand_id == brand_id, Job.status == "open")
+    if region_id is not None:
+        query = query.join(Location, Location.id == Job.location_id).filter(
+            Location.region_id == region_id
+        )
+    jobs = query.order_by(Job.id).all()
+
+    jobs_by_city: Dict[Tuple[str, str], List] = defaultdict(list)
+    for job in jobs:
+        jobs_by_city[(job.city, job.state)].append(job)
+
+    # One query for every group's coach pool (ordered by id for stable ties)
+    coaches_by_city: Dict[Tuple[str, str], List] = defaultdict(list)
+    if jobs_by_city:
+        coaches = (
+            coach_scoring_query(db)
+            .filter(
+                Coach.status == "verified",
+                tuple_(Coach.city, Coach.state).in_(list(jobs_by_city)),
+            )
+            .order_by(Coach.id)
+            .all()
+        )
+        for coach in coaches:
+            coaches_by_city[(coach.city, coach.state)].append(coach)
+
+    return {
+        city: (city_jobs, coaches_by_city.get(city, []))
+        for city, city_jobs in jobs_by_city.items()
+    }
+
+
+async def compute_coverage(
+    db: AsyncSession,
+    brand_id: int,
+    region_id: Optional[int] = None,
+    k: int = 5,
+    as_of: Optional[datetime] = None,
+) -> Dict:
+    """
+    Compute per-job and per-coach top-k lists for a brand's open jobs
+
+    Args:
+        db: Async database session
+        brand_id: Brand whose open jobs are covered
+        region_id: Restrict to jobs at locations in this region
+        k: Length of each top-k list
+        as_of: Clock reading for the engagement recency check (defaults to now)
+
+    Returns:
+        Dict: {"groups": [...], "coaches": [...], "pairs_scored": int}, shaped
+        like CoverageResponse
+    """
+    by_city = await db.run_sync(load_coverage_groups, brand_id, region_id)
+
+    now = as_of or datetime.now()
+    pairs_scored = 0
+    groups = []
+    coach_results = []
+
+    for (city, state), (city_jobs, city_coaches) in by_city.items():
+        thresholds = [
+            float(job.fitscore_threshold if job.fitscore_threshold else DEFAULT_THRESHOLD)
+            for job in city_jobs
+        ]
+
+        ranking = await parallel_scorer.rank_grid_async(
+            [get_encoded_coach(coach) for coach in city_coaches],
+            [get_compiled_job(job) for job in city_jobs],
+            thresholds,
+            k,
+            as_of=now,
+            coach_roles=[coach.role_type for coach in city_coaches],
+            job_roles=[job.role_type for job in city_jobs],
+        )
+        pairs_scored += ranking.pairs_scored
+
+        coach_ids = [coach.id for coach in city_coaches]
+        job_ids = [job.id for job in city_jobs]
+
+        groups.append(
+            {
+                "city": city,
+                "state": state,
+                "coach_count": len(city_coaches),
+                "job_count": len(city_jobs),
+                "jobs": [
+                    {
+                        "job_id": job.id,
+                        "title": job.title,
+                        "role_type": job.role_type,
+                        "threshold": threshold,
+                        "candidates_above_threshold": count,
+                        "top_candidates": _ranked(ranked, coach_ids),
+                    }
+                    for job, threshold, count, ranked in zip(
+                        city_jobs, thresholds, ranking.job_counts, ranking.job_top, strict=True
+                    )
+                ],
+            }
+        )
+        coach_results.extend(
+            {
+                "coach_id": coach.id,
+                "city": city,
+                "state": state,
+                "matches_above_threshold": count,
+                "top_jobs": _ranked(ranked, job_ids),
+            }
+            for coach, count, ranked in zip(
+                city_coaches, ranking.coach_counts, ranking.coach_top, strict=True
+            )
+        )
+
+    return {
+        "groups": groups,
+        "coaches": coach_results,
+        "pairs_scored": pairs_scored,
+    }
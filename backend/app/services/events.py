@@ -0,0 +1,114 @@
+"""Buffered AuditLog and MatchEvent recording
+
+Events are queued in a write-behind buffer (app.db.write_behind) and
+inserted by a background task as multi-row INSERTs on their own primary
+session, so logging them adds no database round trip to the request that
+produced them. The buffer is started and drained by the application
+lifespan (app.main).
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import insert
+
+from app.config import settings
+from app.db.session import AsyncSessionLocal
+from app.db.write_behind import WriteBehindBuffer
+from app.models.audit import AuditLog, MatchEvent
+
+
+async def insert_rows(model, rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert a batch of rows in one multi-row INSERT and commit
+
+    Args:
+        model: Mapped class to insert into
+        rows: Column values per row
+    """
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(model), rows)
+        await db.commit()
+
+
+event_buffer = WriteBehindBuffer(
+    insert_rows,
+    max_batch=settings.event_flush_rows,
+    flush_interval=settings.event_flush_seconds,
+    max_pending=settings.event_buffer_max,
+)
+
+
+def record_match_events(
+    event: str,
+    job,
+    scores: Iterable[Tuple[int, Optional[float]]],
+    triggered_by: Optional[int] = None,
+) -> int:
+    """
+    Queue one MatchEvent per coach for a job
+
+    Args:
+        event: Event name ('viewed', 'applied', ...)
+        job: Job the coaches were matched against (needs id and brand_id)
+        scores: (coach_id, fitscore at the time of the event) pairs
+        triggered_by: User ID of the actor, if known
+
+    Returns:
+        int: Number of events queued (the rest were dropped)
+    """
+    timestamp = datetime.utcnow()
+    return event_buffer.enqueue_many(
+        MatchEvent,
+        [
+            {
+                "coach_id": coach_id,
+                "job_id": job.id,
+                "brand_id": job.brand_id,
+                "event": event,
+                "fitscore_at_event": fitscore,
+                "triggered_by": triggered_by,
+                "timestamp": timestamp,
+            }
+            for coach_id, fitscore in scores
+        ],
+    )
+
+
+def record_audit(
+    brand_id: int,
+    event_type: str,
+    entity_type: Optional[str] = None,
+    entity_id: Optional[int] = None,
+    changes: Optional[Dict[str, Any]] = None,
+    user_id: Optional[int] = None,
+    ip_address: Optional[str] = None,
+) -> bool:
+    """
+    Queue one AuditLog entry
+
+    Args:
+        brand_id: Brand the event belongs to
+        event_type: Event name ('profile_updated', 'job_created', ...)
+        entity_type: Kind of entity affected ('coach', 'job', 'match')
+        entity_id: ID of the entity affected
+        changes: JSON-serializable details of the change
+        user_id: User ID of the actor, if known
+        ip_address: Client address, if known
+
+    Returns:
+        bool: False if the entry was dropped because the buffer is full
+    """
+    return event_buffer.enqueue(
+        AuditLog,
+        {
+            "brand_id": brand_id,
+            "user_id": user_id,
+            "event_type": event_type,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "changes": changes,
+            "timestamp": datetime.utcnow(),
+            "ip_address": ip_address,
+        },
+    )
@@ -0,0 +1,175 @@
+"""Match funnel rollups maintained incrementally from match_events
+
+refresh_funnel_rollups folds only the events added since its last run into
+match_funnel_rollups (counts per job and FitScore band), moving a
+high-water mark over match_events.id. Funnel reports then read the small
+rollup table instead of grouping the whole event history.
+
+Event ids come from a sequence and are allocated before their insert
+commits, so the newest ids may still be in flight while a refresh runs.
+Each run therefore counts events only up to the highest id seen on the
+previous run, trailing live data by one refresh interval. Schedule it,
+e.g. every minute:
+
+    python -m app.services.funnel
+"""
+
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import SmallInteger, cast, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.analytics import MatchFunnelRollup, RollupWatermark
+from app.models.audit import MatchEvent
+from app.utils.funnel import BAND_COUNT, FUNNEL_EVENTS, UNSCORED_BAND, band_bounds, funnel_rates
+
+# Watermark row for this rollup
+FUNNEL_ROLLUP = "match_funnel"
+
+# Event ids folded in per statement (bounds the first backfill)
+REFRESH_ID_SPAN = 500_000
+
+
+def _band_expression():
+    """SQL equivalent of app.utils.funnel.score_band"""
+    band = func.greatest(
+        0, func.least(func.floor(MatchEvent.fitscore_at_event * BAND_COUNT), BAND_COUNT - 1)
+    )
+    return cast(func.coalesce(band, UNSCORED_BAND), SmallInteger)
+
+
+def _fold_events(db: Session, after_id: int, through_id: int) -> int:
+    """Add the counts of events in (after_id, through_id] to the rollups"""
+    band = _band_expression()
+    source = (
+        select(
+            MatchEvent.brand_id,
+            MatchEvent.job_id,
+            band,
+            *[func.count().filter(MatchEvent.event == event) for event in FUNNEL_EVENTS],
+            func.timezone("utc", func.now()),
+        )
+        .where(MatchEvent.id > after_id, MatchEvent.id <= through_id)
+        .group_by(MatchEvent.brand_id, MatchEvent.job_id, band)
+    )
+    statement = insert(MatchFunnelRollup).from_select(
+        ["brand_id", "job_id", "score_band", *FUNNEL_EVENTS, "updated_at"], source
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=["brand_id", "job_id", "score_band"],
+        set_={
+            **{
+                event: getattr(MatchFunnelRollup, event) + statement.excluded[event]
+                for event in FUNNEL_EVENTS
+            },
+            "updated_at": statement.excluded.updated_at,
+        },
+    )
+    return db.execute(statement).rowcount
+
+
+def refresh_funnel_rollups(db: Session, span: int = REFRESH_ID_SPAN) -> Dict[str, int]:
+    """
+    Fold new match events into the funnel rollups
+
+    Runs in the caller's transaction (commit to publish); the watermark
+    row is locked, so concurrent refreshes wait for each other instead of
+    counting events twice.
+
+    Args:
+        db: Database session
+        span: Event ids folded in per statement
+
+    Returns:
+        Dict[str, int]: after_id/through_id of the range counted and the
+        number of rollup rows upserted
+    """
+    db.execute(
+        insert(RollupWatermark)
+        .values(name=FUNNEL_ROLLUP, last_event_id=0, seen_event_id=0, updated_at=datetime.utcnow())
+        .on_conflict_do_nothing()
+    )
+    watermark = db.get(RollupWatermark, FUNNEL_ROLLUP, with_for_update=True)
+
+    after_id, through_id = watermark.last_event_id, watermark.seen_event_id
+    upserted = 0
+    for start in range(after_id, through_id, span):
+        upserted += _fold_events(db, start, min(start + span, through_id))
+
+    latest = db.scalar(select(func.max(MatchEvent.id))) or 0
+    watermark.last_event_id = max(after_id, through_id)
+    watermark.seen_event_id = max(watermark.last_event_id, latest)
+    watermark.updated_at = datetime.utcnow()
+    db.flush()
+
+    return {"after_id": after_id, "through_id": watermark.last_event_id, "rows_upserted": upserted}
+
+
+def get_funnel(db: Session, brand_id: int, job_id: Optional[int] = None) -> Dict:
+    """
+    Read funnel counts and rates per FitScore band from the rollups
+
+    Args:
+        db: Database session
+        brand_id: Brand to report on
+        job_id: Restrict to one of the brand's jobs
+
+    Returns:
+        Dict: {"bands": [...], "totals": {...}, "last_event_id", "refreshed_at"},
+        shaped like FunnelResponse
+    """
+    query = (
+        select(
+            MatchFunnelRollup.score_band,
+            *[func.sum(getattr(MatchFunnelRollup, event)).label(event) for event in FUNNEL_EVENTS],
+        )
+        .where(MatchFunnelRollup.brand_id == brand_id)
+        .group_by(MatchFunnelRollup.score_band)
+        .order_by(MatchFunnelRollup.score_band.desc())
+    )
+    if job_id is not None:
+        query = query.where(MatchFunnelRollup.job_id == job_id)
+
+    bands = []
+    totals = dict.fromkeys(FUNNEL_EVENTS, 0)
+    for row in db.execute(query):
+        counts = {event: int(getattr(row, event)) for event in FUNNEL_EVENTS}
+        for event, count in counts.items():
+            totals[event] += count
+        bounds = band_bounds(row.score_band)
+        bands.append(
+            {
+                "band": row.score_band,
+                "min_fitscore": bounds[0] if bounds else None,
+                "max_fitscore": bounds[1] if bounds else None,
+                **counts,
+                **funnel_rates(counts),
+            }
+        )
+
+    watermark = db.get(RollupWatermark, FUNNEL_ROLLUP)
+    return {
+        "bands": bands,
+        "totals": {**totals, **funnel_rates(totals)},
+        "last_event_id": watermark.last_event_id if watermark else 0,
+        "refreshed_at": watermark.updated_at if watermark else None,
+    }
+
+
+def main() -> None:
+    """Run one rollup refresh"""
+    from app.db.session import SessionLocal
+
+    with SessionLocal() as db:
+        result = refresh_funnel_rollups(db)
+        db.commit()
+    print(
+        f"after_id={result['after_id']} through_id={result['through_id']} "
+        f"rows_upserted={result['rows_upserted']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
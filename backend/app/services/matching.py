@@ -0,0 +1,926 @@
+"""Maintenance and reads for the pre-calculated matches table
+
+Rows cover every verified coach / open job pair in the same city and state.
+role_match records whether the role types agree: job candidate lists require
+it, coach match lists (like the on-demand endpoint before them) do not.
+Coaches who are not verified and jobs that are not open have no rows; their
+lists are scored on demand against the other side's pool in their city.
+
+Scores are recomputed incrementally:
+- a coach edit re-scores only that coach against open jobs in its city
+- a job edit re-scores only that job against verified coaches in its city
+- within those rows, only the components whose inputs changed are
+  recomputed (see COMPONENT_INPUTS in the engine); the rest are reused from
+  the stored, unrounded sub-scores and recombined with the preset weights
+
+Each refresh replaces the affected rows inside the caller's transaction, so
+it commits atomically with the profile change that triggered it, and bumps
+the city's match pool version, which keys list ETags and the response cache.
+Readers (under Postgres MVCC) keep seeing the previous committed rows until
+then and never observe a half-written recompute.
+
+Full refreshes go through the versioned score cache (app.core.fitscore.cache),
+so pairs whose coach and job are unchanged since they were last scored, e.g.
+during rebuilds or on other workers when Redis is enabled, are not re-scored.
+Each refresh reads the cache with one MGET and writes its misses back in one
+pipeline, so Redis costs two round trips per refresh rather than per pair.
+
+Scoring reads select only the columns the engine needs (plus row keys and
+versions) as plain rows, never whole Coach/Job entities with their bios,
+media URLs and social links. Callers fetch full entities for the final
+top-k alone, in one IN (...) query.
+
+Changes that bypass the edit hooks (bulk imports, admin edits of status,
+city or state) are repaired by reconcile_matches, which drops rows whose
+pair left the pool and re-scores open jobs missing rows. Schedule it, e.g.
+every few minutes:
+
+    python -m app.services.matching --reconcile
+
+The engagement component depends on how recently a coach updated their
+profile, so stored scores age: a coach whose last update passes
+ENGAGEMENT_RECENCY_DAYS loses the recency bonus without any edit.
+refresh_engagement re-scores just those coaches' engagement and bumps their
+cities' match pools (so ETags change). The app lifespan runs it every
+engagement_refresh_seconds (refresh_engagement_periodically; runs do not
+overlap across workers); to run it from a scheduler instead:
+
+    python -m app.services.matching --engagement
+"""
+
+import asyncio
+import heapq
+import logging
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, and_, delete, func, or_, select, text, union_all
+from sqlalchemy.orm import Query, Session
+
+from app.config import settings
+from app.core.fitscore.cache import CachedScore, ScoreCache, score_key
+from app.core.fitscore.compiled import CompiledJob, get_compiled_job
+from app.core.fitscore.encoding import get_encoded_coach
+from app.core.fitscore.engine import (
+    COACH_INPUT_FIELDS,
+    ENGAGEMENT_RECENCY_DAYS,
+    HARD_GATES,
+    JOB_INPUT_FIELDS,
+    FitScoreEngine,
+    MatchScore,
+    components_for_fields,
+)
+from app.core.fitscore.presets import PRESET_NAMES, PRESET_WEIGHT_MATRIX
+from app.core.fitscore.ranking import pruning_stats
+from app.models.coach import Coach
+from app.models.job import Job
+from app.models.match import Match
+from app.services.pool_versions import MATCH_POOL, pool_version_bump
+from app.utils.response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD = Decimal("0.60")
+
+# Serializes engagement refreshes across workers (pg_try_advisory_xact_lock key)
+_ENGAGEMENT_LOCK_ID = 7_301_126
+
+# Fields that decide which rows exist at all; changing one needs a full refresh
+POOL_FIELDS = frozenset({"city", "state", "status"})
+
+# Shared by every request in this worker (and across workers via Redis when enabled)
+score_cache = ScoreCache.create(
+    maxsize=settings.score_cache_size,
+    ttl=settings.score_cache_ttl,
+    redis_url=settings.redis_url if settings.score_cache_redis else None,
+)
+
+# Rendered candidate/match lists, keyed by their version fingerprint (ETag)
+response_cache = ResponseCache.create(
+    maxsize=settings.response_cache_size,
+    ttl=settings.response_cache_ttl,
+    redis_url=settings.redis_url if settings.response_cache_redis else None,
+)
+
+# Row keys and versions needed alongside the engine inputs (cache keys,
+# role_match, match row columns and thresholds)
+COACH_SCORING_FIELDS = ("id", "role_type") + COACH_INPUT_FIELDS
+JOB_SCORING_FIELDS = (
+    "id",
+    "updated_at",
+    "brand_id",
+    "role_type",
+    "weighting_preset",
+    "fitscore_threshold",
+) + JOB_INPUT_FIELDS
+
+COMPONENT_COLUMNS = (
+    "cert_score",
+    "experience_score",
+    "availability_score",
+    "location_score",
+    "culture_score",
+    "engagement_score",
+)
+
+# Columns covered by the ranking indexes (keeps reads index-only)
+_SCORE_COLUMNS = (
+    Match.fitscore,
+    Match.cert_score,
+    Match.experience_score,
+    Match.availability_score,
+    Match.location_score,
+    Match.culture_score,
+    Match.engagement_score,
+)
+
+
+def coach_scoring_query(db: Session, *extra_columns) -> Query:
+    """
+    Query coaches as lightweight rows holding only the scoring columns
+
+    Rows expose the same attributes as Coach for every field in
+    COACH_SCORING_FIELDS, so they can be encoded, cached and scored like
+    entities.
+
+    Args:
+        db: Database session
+        *extra_columns: Additional columns to select
+
+    Returns:
+        Query: Unfiltered projection query
+    """
+    return db.query(*(getattr(Coach, name) for name in COACH_SCORING_FIELDS), *extra_columns)
+
+
+def job_scoring_query(db: Session, *extra_columns) -> Query:
+    """
+    Query jobs as lightweight rows holding only the scoring columns
+
+    Args:
+        db: Database session
+        *extra_columns: Additional columns to select
+
+    Returns:
+        Query: Unfiltered projection query
+    """
+    return db.query(*(getattr(Job, name) for name in JOB_SCORING_FIELDS), *extra_columns)
+
+
+def _score_pairs(
+    engine: FitScoreEngine,
+    pairs: Sequence[Tuple[Coach, Job, CompiledJob]],
+    as_of: datetime,
+) -> List[CachedScore]:
+    """Score coach/job row pairs through the score cache (one batched lookup and write-back)"""
+
+    def compute(index: int) -> CachedScore:
+        coach, _, compiled = pairs[index]
+        components = engine.component_scores(get_encoded_coach(coach), compiled.encoded, as_of=as_of)
+        return CachedScore(engine.combine_components(compiled.weights, components), components)
+
+    keys = [score_key(coach, job, compiled.preset) for coach, job, compiled in pairs]
+    return score_cache.get_or_compute_many(keys, compute)
+
+
+def _match_row(
+    coach: Coach,
+    job: Job,
+    score: MatchScore,
+    components: Dict[str, float],
+    computed_at: datetime,
+) -> dict:
+    """Build a matches table row for a scored pair"""
+    return {
+        "coach_id": coach.id,
+        "job_id": job.id,
+        "brand_id": job.brand_id,
+        "role_match": coach.role_type == job.role_type,
+        "preset": job.weighting_preset,
+        "computed_at": computed_at,
+        "fitscore": score.fitscore,
+        **components,
+    }
+
+
+def _score_from_row(row) -> MatchScore:
+    """Build a MatchScore from a (.., fitscore, cert_score, ...) result row"""
+    return MatchScore(
+        fitscore=float(row.fitscore),
+        cert_score=round(row.cert_score, 3),
+        experience_score=round(row.experience_score, 3),
+        availability_score=round(row.availability_score, 3),
+        location_score=round(row.location_score, 3),
+        culture_score=round(row.culture_score, 3),
+        engagement_score=round(row.engagement_score, 3),
+    )
+
+
+def _rescore_rows(
+    rows: List[Match],
+    job_for: Dict[int, Job],
+    coach_for: Dict[int, Coach],
+    components: Iterable[str],
+    role_changed: bool,
+) -> int:
+    """
+    Recompute the given components of stored rows and recombine their fitscores
+
+    Args:
+        rows: Match rows to update in place
+        job_for: Job (or job scoring row) for each row, by job ID
+        coach_for: Coach (or coach scoring row) for each row, by coach ID (only needed when
+            components are recomputed or roles changed)
+        components: Component names to recompute
+        role_changed: Whether role_match must be re-evaluated
+
+    Returns:
+        int: Number of rows updated
+    """
+    engine = FitScoreEngine()
+    as_of = datetime.now()
+    computed_at = datetime.utcnow()
+    components = tuple(components)
+
+    for row in rows:
+        job = job_for[row.job_id]
+        compiled = get_compiled_job(job)
+        cached = {name: getattr(row, name) for name in COMPONENT_COLUMNS}
+
+        if components or role_changed:
+            coach = coach_for[row.coach_id]
+            if components:
+                cached.update(engine.component_scores(
+                    get_encoded_coach(coach), compiled.encoded, components, as_of
+                ))
+            row.role_match = coach.role_type == job.role_type
+
+        score = engine.combine_components(compiled.weights, cached)
+        for name in components:
+            setattr(row, name, cached[name])
+        row.fitscore = score.fitscore
+        row.preset = compiled.preset
+        row.computed_at = computed_at
+
+    return len(rows)
+
+
+def _bump_match_pools(db: Session, cities: Iterable[Tuple[str, str]]) -> None:
+    """
+    Version the stored rows of cities whose rows were rewritten
+
+    Candidate and match list ETags (and so response cache keys) include
+    MATCH_POOL, so clients and caches never keep serving the old lists.
+    """
+    cities = set(cities)
+    if cities:
+        db.execute(pool_version_bump((MATCH_POOL, city, state) for city, state in cities))
+
+
+def refresh_job_matches(db: Session, job: Job) -> int:
+    """
+    Re-score one job against verified coaches in its city and replace its stored rows
+
+    Does not commit; call before the commit that saves the job. Bumps the
+    city's match pool version, so lists cached under the old ETags are never
+    served again, whatever triggered the refresh.
+
+    Args:
+        db: Database session
+        job: Job to re-score (pending attribute changes are used)
+
+    Returns:
+        int: Number of rows written
+    """
+    db.execute(delete(Match).where(Match.job_id == job.id))
+    _bump_match_pools(db, [(job.city, job.state)])
+
+    if job.status != "open":
+        return 0
+
+    coaches = (
+        coach_scoring_query(db)
+        .filter(and_(Coach.status == "verified", Coach.city == job.city, Coach.state == job.state))
+        .all()
+    )
+    if not coaches:
+        return 0
+
+    engine = FitScoreEngine()
+    compiled = get_compiled_job(job)
+    as_of = datetime.now()
+    computed_at = datetime.utcnow()
+
+    scores = _score_pairs(engine, [(coach, job, compiled) for coach in coaches], as_of)
+    rows = [
+        _match_row(coach, job, cached.score, cached.components, computed_at)
+        for coach, cached in zip(coaches, scores, strict=True)
+    ]
+    db.execute(Match.__table__.insert(), rows)
+
+    return len(rows)
+
+
+def refresh_coach_matches(db: Session, coach: Coach) -> int:
+    """
+    Re-score one coach against open jobs in its city and replace its stored rows
+
+    Does not commit; call before the commit that saves the coach. Bumps the
+    city's match pool version, like refresh_job_matches.
+
+    Args:
+        db: Database session
+        coach: Coach to re-score (pending attribute changes are used)
+
+    Returns:
+        int: Number of rows written
+    """
+    db.execute(delete(Match).where(Match.coach_id == coach.id))
+    _bump_match_pools(db, [(coach.city, coach.state)])
+
+    if coach.status != "verified":
+        return 0
+
+    jobs = (
+        job_scoring_query(db)
+        .filter(and_(Job.status == "open", Job.city == coach.city, Job.state == coach.state))
+        .all()
+    )
+    if not jobs:
+        return 0
+
+    engine = FitScoreEngine()
+    as_of = datetime.now()
+    computed_at = datetime.utcnow()
+
+    scores = _score_pairs(engine, [(coach, job, get_compiled_job(job)) for job in jobs], as_of)
+    rows = [
+        _match_row(coach, job, cached.score, cached.components, computed_at)
+        for job, cached in zip(jobs, scores, strict=True)
+    ]
+    db.execute(Match.__table__.insert(), rows)
+
+    return len(rows)
+
+
+def update_job_matches(db: Session, job: Job, changed_fields: Iterable[str]) -> int:
+    """
+    Bring a job's stored rows up to date after a partial edit
+
+    Falls back to refresh_job_matches when the edit changes which coaches
+    are in the pool. Otherwise only the components reading a changed field
+    are recomputed; a preset change alone recombines stored components
+    without loading any coach. Does not commit.
+
+    Args:
+        db: Database session
+        job: Edited job (pending attribute changes are used)
+        changed_fields: Job fields set by the edit
+
+    Returns:
+        int: Number of rows written or updated
+    """
+    changed = set(changed_fields)
+    if changed & POOL_FIELDS:
+        return refresh_job_matches(db, job)
+
+    components = components_for_fields(job_fields=changed)
+    role_changed = "role_type" in changed
+    if not (components or role_changed or "weighting_preset" in changed):
+        return 0
+
+    rows = db.query(Match).filter(Match.job_id == job.id).all()
+    if not rows:
+        return 0
+
+    coach_for = {}
+    if components or role_changed:
+        coach_ids = [row.coach_id for row in rows]
+        coach_for = {
+            coach.id: coach
+            for coach in coach_scoring_query(db).filter(Coach.id.in_(coach_ids))
+        }
+
+    return _rescore_rows(rows, {job.id: job}, coach_for, components, role_changed)
+
+
+def update_coach_matches(db: Session, coach: Coach, changed_fields: Iterable[str]) -> int:
+    """
+    Bring a coach's stored rows up to date after a partial edit
+
+    Falls back to refresh_coach_matches when the edit changes which jobs
+    are in the pool. Otherwise only the components reading a changed field
+    are recomputed. Does not commit.
+
+    Args:
+        db: Database session
+        coach: Edited coach (pending attribute changes are used)
+        changed_fields: Coach fields set by the edit, including derived
+            fields such as profile_completeness and last_updated
+
+    Returns:
+        int: Number of rows written or updated
+    """
+    changed = set(changed_fields)
+    if changed & POOL_FIELDS:
+        return refresh_coach_matches(db, coach)
+
+    components = components_for_fields(coach_fields=changed)
+    role_changed = "role_type" in changed
+    if not (components or role_changed):
+        return 0
+
+    rows = db.query(Match).filter(Match.coach_id == coach.id).all()
+    if not rows:
+        return 0
+
+    job_ids = [row.job_id for row in rows]
+    job_for = {job.id: job for job in job_scoring_query(db).filter(Job.id.in_(job_ids))}
+
+    return _rescore_rows(rows, job_for, {coach.id: coach}, components, role_changed)
+
+
+def rebuild_all_matches(db: Session) -> int:
+    """
+    Recompute every open job's rows (backfill after migrations or scoring changes)
+
+    Commits once per job so readers are never blocked on a long transaction;
+    each commit also bumps the city's match pool (see refresh_job_matches)
+    so clients holding the old lists get fresh ones.
+
+    Args:
+        db: Database session
+
+    Returns:
+        int: Number of rows written
+    """
+    total = 0
+    for job in db.query(Job).filter(Job.status == "open").all():
+        total += refresh_job_matches(db, job)
+        db.commit()
+    return total
+
+
+def reconcile_matches(db: Session) -> Dict[str, int]:
+    """
+    Repair stored rows after pool changes that skipped the refresh hooks
+
+    Deletes rows whose coach is no longer verified, whose job is no longer
+    open or whose pair no longer shares a city, then re-scores every open
+    job that is missing a row for a verified coach in its city. Commits
+    the cleanup and then once per job, like rebuild_all_matches; every
+    city whose rows changed gets a new match pool version.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dict[str, int]: rows_removed, jobs_refreshed and rows_written
+    """
+    # Core delete: ORM-enabled RETURNING cannot map the joined tables' columns
+    removed = db.execute(
+        delete(Match.__table__)
+        .where(
+            Match.coach_id == Coach.id,
+            Match.job_id == Job.id,
+            or_(
+                Coach.status != "verified",
+                Job.status != "open",
+                Coach.city != Job.city,
+                Coach.state != Job.state,
+            ),
+        )
+        .returning(
+            Coach.city.label("coach_city"),
+            Coach.state.label("coach_state"),
+            Job.city.label("job_city"),
+            Job.state.label("job_state"),
+        )
+    ).all()
+    _bump_match_pools(db, [
+        *((row.coach_city, row.coach_state) for row in removed),
+        *((row.job_city, row.job_state) for row in removed),
+    ])
+    db.commit()
+
+    missing = (
+        select(Job.id)
+        .join(
+            Coach,
+            and_(
+                Coach.status == "verified",
+                Coach.city == Job.city,
+                Coach.state == Job.state,
+            ),
+        )
+        .outerjoin(Match, and_(Match.job_id == Job.id, Match.coach_id == Coach.id))
+        .where(Job.status == "open", Match.id.is_(None))
+        .distinct()
+    )
+    jobs = db.query(Job).filter(Job.id.in_(missing)).order_by(Job.id).all()
+
+    written = 0
+    for job in jobs:
+        written += refresh_job_matches(db, job)
+        db.commit()
+    return {"rows_removed": len(removed), "jobs_refreshed": len(jobs), "rows_written": written}
+
+
+def refresh_engagement(db: Session) -> int:
+    """
+    Re-age stored engagement scores of coaches who lost the recency bonus
+
+    Finds rows computed while their coach's last update was within
+    ENGAGEMENT_RECENCY_DAYS although it no longer is, recomputes only their
+    engagement component and fitscore, and bumps the match pool of every
+    city with a changed row. Re-aged rows are not selected again, so runs
+    are cheap. Commits; concurrent runs (e.g. one per worker) skip while
+    another holds the advisory lock.
+
+    Args:
+        db: Database session
+
+    Returns:
+        int: Number of rows updated (0 when another run holds the lock)
+    """
+    locked = db.scalar(text("SELECT pg_try_advisory_xact_lock(:id)"), {"id": _ENGAGEMENT_LOCK_ID})
+    if not locked:
+        db.rollback()
+        return 0
+
+    # computed_at is UTC and last_updated local time, so the window allows a
+    # day of slack; rows whose engagement turns out unchanged are left alone
+    engine = FitScoreEngine()
+    as_of = datetime.now()
+    window = timedelta(days=ENGAGEMENT_RECENCY_DAYS + 1)
+    rows = (
+        db.query(Match)
+        .join(Coach, Coach.id == Match.coach_id)
+        .filter(
+            Coach.last_updated < as_of - window,
+            Match.computed_at < Coach.last_updated + window + timedelta(days=1),
+        )
+        .all()
+    )
+    if not rows:
+        db.commit()
+        return 0
+
+    coach_ids = {row.coach_id for row in rows}
+    job_ids = {row.job_id for row in rows}
+    coach_for = {
+        coach.id: coach for coach in coach_scoring_query(db).filter(Coach.id.in_(coach_ids))
+    }
+    job_for = {job.id: job for job in job_scoring_query(db).filter(Job.id.in_(job_ids))}
+
+    aged = []
+    for row in rows:
+        engagement = engine.component_scores(
+            get_encoded_coach(coach_for[row.coach_id]),
+            get_compiled_job(job_for[row.job_id]).encoded,
+            ("engagement_score",),
+            as_of,
+        )["engagement_score"]
+        if engagement != row.engagement_score:
+            aged.append(row)
+
+    updated = _rescore_rows(aged, job_for, coach_for, ("engagement_score",), role_changed=False)
+    _bump_match_pools(db, [(job_for[row.job_id].city, job_for[row.job_id].state) for row in aged])
+    db.commit()
+    return updated
+
+
+async def refresh_engagement_periodically(interval: float) -> None:
+    """
+    Run refresh_engagement every interval seconds until cancelled
+
+    Each run uses its own session in a worker thread, so the event loop is
+    never blocked; failures are logged and retried at the next interval.
+
+    Args:
+        interval: Seconds between runs
+    """
+    from app.db.session import SessionLocal
+
+    def run() -> int:
+        with SessionLocal() as session:
+            return refresh_engagement(session)
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            updated = await asyncio.to_thread(run)
+        except Exception:
+            logger.warning("Engagement refresh failed", exc_info=True)
+        else:
+            if updated:
+                logger.info("Re-aged engagement on %d match rows", updated)
+
+
+def hard_requirement_filters(job: Job, gates: Iterable[str]) -> list:
+    """
+    Build SQL filters on Coach that enforce a job's hard requirements
+
+    Uses JSONB containment (@>), served by the GIN indexes on the coach
+    columns. Certifications match by name whether stored as {"name": ...}
+    objects or plain strings, as in the engine.
+
+    Args:
+        job: Job whose requirements apply
+        gates: Hard gates to enforce ("cert_score", "availability_score")
+
+    Returns:
+        list: Filter expressions (empty when nothing is required)
+    """
+    gates = set(gates)
+    filters = []
+    if "cert_score" in gates:
+        for name in dict.fromkeys(job.required_certifications or []):
+            filters.append(or_(
+                Coach.certifications.contains([{"name": name}]),
+                Coach.certifications.contains([name]),
+            ))
+    if "availability_score" in gates and job.required_availability:
+        filters.append(Coach.available_times.contains(list(job.required_availability)))
+    return filters
+
+
+def _ranked_candidates_select(job: Job, limit: int, strict: Optional[bool]) -> Select:
+    """Top-candidates query for one job (see get_ranked_candidates)"""
+    threshold = job.fitscore_threshold if job.fitscore_threshold else DEFAULT_THRESHOLD
+
+    query = select(Match.job_id, Match.coach_id, *_SCORE_COLUMNS).where(
+        Match.job_id == job.id,
+        Match.role_match.is_(True),
+        Match.fitscore >= threshold,
+    )
+    # Only strict reads join coaches; the rest stay on ix_matches_job_rank
+    filters = hard_requirement_filters(job, HARD_GATES) if strict else []
+    if filters:
+        query = query.join(Coach, Coach.id == Match.coach_id).where(*filters)
+
+    return query.order_by(Match.fitscore.desc(), Match.coach_id).limit(limit)
+
+
+def get_ranked_candidates(
+    db: Session, job: Job, limit: int, strict: Optional[bool] = None
+) -> List[Tuple[int, MatchScore]]:
+    """
+    Read a job's top candidates from the matches table
+
+    Strict prefiltering moves the hard requirements (required certifications
+    and availability) into the WHERE clause, so coaches who miss them are
+    excluded even when their other scores clear the threshold. Otherwise the
+    read touches only the matches table (an index-only top-k scan).
+
+    Jobs that are not open have no stored rows and are scored on demand
+    instead (live_ranked_candidates).
+
+    Args:
+        db: Database session
+        job: Job to read candidates for
+        limit: Maximum number of candidates
+        strict: True to enforce every hard requirement; False or None
+            (the default) to rank on stored scores alone
+
+    Returns:
+        List[Tuple[int, MatchScore]]: (coach_id, score), best first
+    """
+    if job.status != "open":
+        return live_ranked_candidates(db, job, limit, strict)
+
+    rows = db.execute(_ranked_candidates_select(job, limit, strict)).all()
+    return [(row.coach_id, _score_from_row(row)) for row in rows]
+
+
+def live_ranked_candidates(
+    db: Session, job: Job, limit: int, strict: Optional[bool] = None
+) -> List[Tuple[int, MatchScore]]:
+    """
+    Score a job against the verified coaches in its city and keep the top ones
+
+    Serves candidate lists for jobs without stored rows (drafts, paused or
+    filled jobs), with the same role match, threshold and strict prefilter
+    as the stored read. Coaches that cannot reach the threshold or the
+    current top-k are pruned early (counted in pruning_stats). Ordered like
+    get_ranked_candidates.
+
+    Args:
+        db: Database session
+        job: Job to score (any status)
+        limit: Maximum number of candidates
+        strict: As for get_ranked_candidates
+
+    Returns:
+        List[Tuple[int, MatchScore]]: (coach_id, score), best first
+    """
+    filters = hard_requirement_filters(job, HARD_GATES) if strict else []
+    coaches = (
+        coach_scoring_query(db)
+        .filter(
+            Coach.status == "verified",
+            Coach.city == job.city,
+            Coach.state == job.state,
+            Coach.role_type == job.role_type,
+            *filters,
+        )
+        .order_by(Coach.id)
+        .all()
+    )
+    if not coaches:
+        return []
+
+    threshold = float(job.fitscore_threshold if job.fitscore_threshold else DEFAULT_THRESHOLD)
+    ranked = FitScoreEngine().rank_candidates(
+        coaches, get_compiled_job(job), threshold, limit, stats=pruning_stats
+    )
+    return [(coaches[position].id, score) for position, score in ranked]
+
+
+def get_ranked_candidates_batch(
+    db: Session, jobs: Sequence[Job], limit: int, strict: Optional[bool] = None
+) -> Dict[int, List[Tuple[int, MatchScore]]]:
+    """
+    Read several jobs' top candidates in one round trip
+
+    Each job keeps its own threshold, role match and prefilter (exactly as
+    get_ranked_candidates); the open jobs' top-k reads are combined with
+    UNION ALL, each still served by ix_matches_job_rank. Jobs that are not
+    open are scored on demand, one at a time.
+
+    Args:
+        db: Database session
+        jobs: Jobs to read candidates for
+        limit: Maximum number of candidates per job
+        strict: As for get_ranked_candidates
+
+    Returns:
+        Dict[int, List[Tuple[int, MatchScore]]]: (coach_id, score) lists,
+        best first, per job ID (empty lists for jobs without candidates)
+    """
+    ranked: Dict[int, List[Tuple[int, MatchScore]]] = {job.id: [] for job in jobs}
+    for job in jobs:
+        if job.status != "open":
+            ranked[job.id] = live_ranked_candidates(db, job, limit, strict)
+    stored = [job for job in jobs if job.status == "open"]
+    if not stored:
+        return ranked
+
+    queries = [_ranked_candidates_select(job, limit, strict).subquery().select() for job in stored]
+    statement = queries[0] if len(queries) == 1 else union_all(*queries)
+    # Rows arrive grouped per job but unordered across the union; restore rank order
+    for row in sorted(db.execute(statement).all(), key=lambda row: (-row.fitscore, row.coach_id)):
+        ranked[row.job_id].append((row.coach_id, _score_from_row(row)))
+    return ranked
+
+
+def get_ranked_matches(db: Session, coach: Coach, limit: int) -> List[Tuple[int, MatchScore]]:
+    """
+    Read a coach's top open-job matches from the matches table
+
+    Each job's own threshold is applied. Coaches who are not verified have
+    no stored rows and are scored on demand instead (live_ranked_matches).
+
+    Args:
+        db: Database session
+        coach: Coach to read matches for
+        limit: Maximum number of matches
+
+    Returns:
+        List[Tuple[int, MatchScore]]: (job_id, score), best first
+    """
+    if coach.status != "verified":
+        return live_ranked_matches(db, coach, limit)
+
+    rows = (
+        db.query(Match.job_id, *_SCORE_COLUMNS)
+        .join(Job, Job.id == Match.job_id)
+        .filter(
+            Match.coach_id == coach.id,
+            Job.status == "open",
+            Match.fitscore >= func.coalesce(Job.fitscore_threshold, DEFAULT_THRESHOLD),
+        )
+        .order_by(Match.fitscore.desc(), Match.job_id)
+        .limit(limit)
+        .all()
+    )
+    return [(row.job_id, _score_from_row(row)) for row in rows]
+
+
+def live_ranked_matches(db: Session, coach: Coach, limit: int) -> List[Tuple[int, MatchScore]]:
+    """
+    Score a coach against the open jobs in its city and keep the top ones
+
+    Serves match lists for coaches without stored rows. Jobs that cannot
+    reach their threshold or the current top-k are pruned before their
+    culture and engagement components are computed (counted in
+    pruning_stats). Ordered like get_ranked_matches.
+
+    Args:
+        db: Database session
+        coach: Coach to score (any status)
+        limit: Maximum number of matches
+
+    Returns:
+        List[Tuple[int, MatchScore]]: (job_id, score), best first
+    """
+    jobs = (
+        job_scoring_query(db)
+        .filter(Job.status == "open", Job.city == coach.city, Job.state == coach.state)
+        .order_by(Job.id)
+        .all()
+    )
+    if not jobs:
+        return []
+
+    thresholds = [
+        float(job.fitscore_threshold if job.fitscore_threshold else DEFAULT_THRESHOLD)
+        for job in jobs
+    ]
+    ranked = FitScoreEngine().rank_jobs(
+        get_encoded_coach(coach),
+        [get_compiled_job(job) for job in jobs],
+        thresholds,
+        limit,
+        stats=pruning_stats,
+    )
+    return [(jobs[position].id, score) for position, score in ranked]
+
+
+def get_preset_rankings(
+    db: Session,
+    job: Job,
+    limit: int,
+    custom_weights: Optional[Sequence[float]] = None,
+) -> Dict[str, Tuple[int, List[Tuple[int, MatchScore]]]]:
+    """
+    Rank a job's candidates under every preset (and optional custom weights)
+
+    Stored sub-scores are read once and recombined with the whole preset
+    weight matrix, so no coach is re-scored. Each ranking applies the job's
+    threshold and orders like get_ranked_candidates.
+
+    Args:
+        db: Database session
+        job: Job to rank candidates for
+        limit: Maximum number of candidates per ranking
+        custom_weights: Extra weight vector (COMPONENTS order), ranked as "custom"
+
+    Returns:
+        Dict[str, Tuple[int, List[Tuple[int, MatchScore]]]]: Per preset name,
+        (candidates above threshold, top (coach_id, score) pairs best first)
+    """
+    threshold = float(job.fitscore_threshold if job.fitscore_threshold else DEFAULT_THRESHOLD)
+
+    names = list(PRESET_NAMES)
+    matrix = list(PRESET_WEIGHT_MATRIX)
+    if custom_weights is not None:
+        names.append("custom")
+        matrix.append(tuple(custom_weights))
+
+    rows = (
+        db.query(Match.coach_id, *(getattr(Match, name) for name in COMPONENT_COLUMNS))
+        .filter(Match.job_id == job.id, Match.role_match.is_(True))
+        .all()
+    )
+
+    engine = FitScoreEngine()
+    scored: List[List[Tuple[int, MatchScore]]] = [[] for _ in names]
+    for row in rows:
+        components = {name: getattr(row, name) for name in COMPONENT_COLUMNS}
+        for ranking, score in zip(scored, engine.combine_matrix(matrix, components), strict=True):
+            if score.fitscore >= threshold:
+                ranking.append((row.coach_id, score))
+
+    return {
+        name: (
+            len(ranking),
+            heapq.nsmallest(limit, ranking, key=lambda item: (-item[1].fitscore, item[0])),
+        )
+        for name, ranking in zip(names, scored, strict=True)
+    }
+
+
+def main() -> None:
+    """Rebuild every stored row (backfill), or --reconcile, or re-age with --engagement"""
+    import sys
+
+    from app.db.session import SessionLocal
+
+    with SessionLocal() as session:
+        if "--reconcile" in sys.argv[1:]:
+            result = reconcile_matches(session)
+            print(
+                f"rows_removed={result['rows_removed']} jobs_refreshed={result['jobs_refreshed']} "
+                f"rows_written={result['rows_written']}"
+            )
+        elif "--engagement" in sys.argv[1:]:
+            print(f"Re-aged engagement on {refresh_engagement(session)} match rows")
+        else:
+            print(f"Wrote {rebuild_all_matches(session)} match rows")
+
+
+if __name__ == "__main__":
+    # Backfill after running the migration: python -m app.services.matching
+    main()
@@ -0,0 +1,132 @@
+"""Per-city version counters for the coach and job scoring pools
+
+Stored match rows for a job change whenever any coach in its city changes
+(and a coach's, whenever any job in its city does). Rather than reading
+the pool to detect that, every flush that inserts, updates or deletes a
+Coach or Job bumps the pool_versions row for its city (and its previous
+city if it moved) in the same transaction. Core bulk inserts bypass the
+ORM and bump explicitly with pool_version_bump.
+
+A third counter per city, MATCH_POOL, versions the stored match rows
+themselves: every refresh (app.services.matching) bumps it, so rebuilds
+and reconciles that change no profile still change list fingerprints.
+It is always bumped after the profile pools in a transaction, which keeps
+row lock order consistent between concurrent coach and job edits.
+"""
+
+from datetime import datetime
+from typing import Iterable, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, attributes
+
+from app.models.coach import Coach
+from app.models.job import Job
+from app.models.match import Match, PoolVersion
+
+PoolKey = Tuple[str, str, str]  # (pool, city, state)
+
+COACH_POOL = Coach.__tablename__
+JOB_POOL = Job.__tablename__
+MATCH_POOL = Match.__tablename__
+
+
+def pool_version_bump(keys: Iterable[PoolKey]):
+    """
+    Statement incrementing (or creating) the version of each pool
+
+    Args:
+        keys: (pool, city, state) triples
+
+    Returns:
+        Insert: Upsert statement, keys sorted so concurrent bumps lock rows
+        in the same order
+    """
+    now = datetime.utcnow()
+    statement = insert(PoolVersion).values(
+        [
+            {"pool": pool, "city": city, "state": state, "version": 1, "updated_at": now}
+            for pool, city, state in sorted(set(keys))
+        ]
+    )
+    return statement.on_conflict_do_update(
+        index_elements=["pool", "city", "state"],
+        set_={"version": PoolVersion.version + 1, "updated_at": statement.excluded.updated_at},
+    )
+
+
+def _changed_pools(session: Session) -> Set[PoolKey]:
+    """Pools touched by the coaches and jobs pending in a flush"""
+    keys: Set[PoolKey] = set()
+    dirty = [obj for obj in session.dirty if session.is_modified(obj, include_collections=False)]
+    for obj in [*session.new, *dirty, *session.deleted]:
+        if isinstance(obj, Coach):
+            pool = COACH_POOL
+        elif isinstance(obj, Job):
+            pool = JOB_POOL
+        else:
+            continue
+        if obj.city is not None and obj.state is not None:
+            keys.add((pool, obj.city, obj.state))
+        # A move also changes the pool it left
+        city_history = attributes.get_history(obj, "city")
+        state_history = attributes.get_history(obj, "state")
+        if city_history.deleted or state_history.deleted:
+            old_city = city_history.deleted[0] if city_history.deleted else obj.city
+            old_state = state_history.deleted[0] if state_history.deleted else obj.state
+            keys.add((pool, old_city, old_state))
+    return keys
+
+
+@event.listens_for(Session, "before_flush")
+def _bump_changed_pools(session: Session, flush_context, instances) -> None:
+    """Bump the pools of coaches and jobs being written, in the same transaction"""
+    keys = _changed_pools(session)
+    if keys:
+        session.execute(pool_version_bump(keys))
+
+
+async def get_pool_version(db: AsyncSession, pool: str, city: str, state: str) -> Optional[int]:
+    """
+    Current version of a pool
+
+    Args:
+        db: Database session
+        pool: COACH_POOL, JOB_POOL or MATCH_POOL
+        city: City of the pool
+        state: State of the pool
+
+    Returns:
+        Optional[int]: Version, or None if the pool was never written
+    """
+    return await db.scalar(
+        select(PoolVersion.version).where(
+            PoolVersion.pool == pool, PoolVersion.city == city, PoolVersion.state == state
+        )
+    )
+
+
+async def get_pool_versions(
+    db: AsyncSession, pools: Sequence[str], city: str, state: str
+) -> Tuple[Optional[int], ...]:
+    """
+    Current versions of several pools of one city, in one query
+
+    Args:
+        db: Database session
+        pools: Pool names (COACH_POOL, JOB_POOL, MATCH_POOL)
+        city: City of the pools
+        state: State of the pools
+
+    Returns:
+        Tuple[Optional[int], ...]: Version per pool, None if never written
+    """
+    rows = await db.execute(
+        select(PoolVersion.pool, PoolVersion.version).where(
+            PoolVersion.pool.in_(pools), PoolVersion.city == city, PoolVersion.state == state
+        )
+    )
+    versions = dict(rows.all())
+    return tuple(versions.get(pool) for pool in pools)
@@ -0,0 +1,137 @@
+"""Parsing and batch validation of bulk upload records
+
+Uploads are JSON lines (one object per line) or CSV with a header row.
+CSV cells for list fields hold either a JSON array or ";"-separated
+values; empty cells are omitted so schema defaults apply. Row numbers are
+1-based (lines for JSON lines, data rows for CSV).
+"""
+
+import csv
+import io
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+# Largest accepted upload, in rows
+BULK_MAX_ROWS = 50_000
+
+CSV_CONTENT_TYPES = ("text/csv", "application/csv")
+
+
+@dataclass
+class RowError:
+    """Errors for one input row (1-based; header excluded for CSV)"""
+
+    row: int
+    errors: List[str]
+
+
+def _split_list(value: str) -> List[Any]:
+    """Parse a CSV list cell: a JSON array or ";"-separated values"""
+    value = value.strip()
+    if value.startswith("["):
+        return json.loads(value)
+    return [item.strip() for item in value.split(";") if item.strip()]
+
+
+def parse_records(
+    body: bytes, content_type: Optional[str], list_fields: Sequence[str] = ()
+) -> Tuple[List[Tuple[int, Dict]], List[RowError]]:
+    """
+    Parse a JSON lines or CSV upload into dicts
+
+    Args:
+        body: Raw request body (UTF-8)
+        content_type: Request Content-Type; CSV when text/csv, else JSON lines
+        list_fields: Fields to parse as lists in CSV cells
+
+    Returns:
+        Tuple: ([(row number, record)], [RowError]) for rows that parsed / didn't
+
+    Raises:
+        ValueError: If the body is not UTF-8 or exceeds BULK_MAX_ROWS
+    """
+    try:
+        text = body.decode("utf-8-sig")
+    except UnicodeDecodeError as exc:
+        raise ValueError("Body must be UTF-8") from exc
+
+    records: List[Tuple[int, Dict]] = []
+    errors: List[RowError] = []
+
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type in CSV_CONTENT_TYPES:
+        for row, cells in enumerate(csv.DictReader(io.StringIO(text)), start=1):
+            try:
+                record = {}
+                for name, value in cells.items():
+                    if name is None or value is None or value.strip() == "":
+                        continue
+                    record[name.strip()] = (
+                        _split_list(value) if name.strip() in list_fields else value
+                    )
+                records.append((row, record))
+            except ValueError as exc:
+                errors.append(RowError(row, [f"Invalid list value: {exc}"]))
+    else:
+        for row, line in enumerate(text.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                errors.append(RowError(row, [f"Invalid JSON: {exc}"]))
+                continue
+            if not isinstance(record, dict):
+                errors.append(RowError(row, ["Expected a JSON object"]))
+                continue
+            records.append((row, record))
+
+    if len(records) + len(errors) > BULK_MAX_ROWS:
+        raise ValueError(f"At most {BULK_MAX_ROWS} rows per upload")
+    return records, errors
+
+
+def _format_error(error: Dict) -> str:
+    """Render one pydantic error as "field: message" """
+    location = ".".join(str(part) for part in error["loc"])
+    return f"{location}: {error['msg']}" if location else error["msg"]
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """Build (once per schema) the adapter validating a list of records"""
+    return TypeAdapter(List[schema])
+
+
+def validate_records(
+    schema: Type[BaseModel], records: List[Tuple[int, Dict]]
+) -> Tuple[List[Tuple[int, BaseModel]], List[RowError]]:
+    """
+    Validate a batch of records against a schema in one TypeAdapter call
+
+    Args:
+        schema: Pydantic model (e.g. CoachCreate)
+        records: (row number, record) pairs
+
+    Returns:
+        Tuple: ([(row number, model)], [RowError])
+    """
+    adapter = _list_adapter(schema)
+    try:
+        models = adapter.validate_python([record for _, record in records])
+        return list(zip((row for row, _ in records), models, strict=True)), []
+    except ValidationError as exc:
+        failed: Dict[int, List[str]] = {}
+        for error in exc.errors():
+            index, *loc = error["loc"]
+            failed.setdefault(index, []).append(_format_error({**error, "loc": loc}))
+
+    # Rows validate independently, so the rest of the batch is valid
+    errors = [RowError(records[index][0], messages) for index, messages in sorted(failed.items())]
+    remaining = [record for index, record in enumerate(records) if index not in failed]
+    models = adapter.validate_python([record for _, record in remaining])
+    return list(zip((row for row, _ in remaining), models, strict=True)), errors
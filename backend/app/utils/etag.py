@@ -0,0 +1,59 @@
+"""ETag fingerprints and conditional GET handling
+
+Read endpoints fingerprint their response from the version columns it
+depends on (updated_at/last_updated, pool versions, query parameters)
+instead of hashing the rendered body, so a matching If-None-Match is
+answered with 304 before any ranking or serialization work.
+"""
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Response
+
+# Clients may cache, but must revalidate before every reuse
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from the values a response depends on
+
+    Args:
+        parts: Version values (ids, timestamps, counters, query parameters)
+
+    Returns:
+        str: Weak entity tag, e.g. W/"3f1c..."
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison)
+
+    Args:
+        if_none_match: Header value: "*" or a comma-separated list of tags
+        etag: Current entity tag
+
+    Returns:
+        bool: True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """304 response carrying the current ETag"""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach an ETag and revalidation policy to a response"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
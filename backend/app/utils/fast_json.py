@@ -0,0 +1,89 @@
+"""Fast JSON path for ranked list responses
+
+The default path validates a route's return value against its
+response_model (re-reading every ORM attribute into nested pydantic
+models) and then encodes the result with the stdlib json module. For
+ranked lists of full coach/job profiles that is a noticeable share of
+the request. This path copies just the schema's fields off the
+already-loaded ORM objects into plain dicts and encodes them with
+orjson. Returning a Response skips response_model validation, so
+payloads must carry exactly the schema's fields; the response_model
+still documents the shape.
+"""
+
+from datetime import date
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(value: Any) -> Any:
+    """Encode the types orjson leaves to the caller"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def encode_json(content: Any) -> bytes:
+    """Encode a payload with orjson (Decimals as floats)"""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded with orjson (Decimals as floats)"""
+
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
+
+
+@lru_cache(maxsize=None)
+def _field_names(schema: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(schema.model_fields)
+
+
+def row_payload(obj: Any, schema: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Copy a schema's fields off a trusted object without validating them
+
+    Args:
+        obj: ORM object (or any object with the schema's attributes)
+        schema: Response schema whose fields to copy
+
+    Returns:
+        Dict[str, Any]: Field values, ready for FastJSONResponse
+    """
+    return {name: getattr(obj, name) for name in _field_names(schema)}
+
+
+def ranked_payload(
+    entries: Iterable[Dict[str, Any]], key: str, schema: Type[BaseModel], breakdown: Type[BaseModel]
+) -> List[Dict[str, Any]]:
+    """
+    Build ranked result dicts (CoachMatchResult / JobCandidateResult shape)
+
+    Args:
+        entries: {key: ORM object, "score": MatchScore} dicts, best first
+        key: Name of the entity field ("coach" or "job")
+        schema: Response schema of the entity
+        breakdown: Score breakdown schema
+
+    Returns:
+        List[Dict[str, Any]]: Results with fitscore, score_breakdown and rank
+    """
+    return [
+        {
+            key: row_payload(entry[key], schema),
+            "fitscore": entry["score"].fitscore,
+            "score_breakdown": row_payload(entry["score"], breakdown),
+            "rank": rank,
+        }
+        for rank, entry in enumerate(entries, start=1)
+    ]
@@ -0,0 +1,75 @@
+"""FitScore bands and conversion rates for the match funnel
+
+Funnel rollups count MatchEvents per job and FitScore band. A band is the
+tenth of the score range an event's fitscore_at_event falls in (0 for
+[0.0, 0.1) up to 9 for [0.9, 1.0]); events recorded without a score go to
+UNSCORED_BAND. The SQL rollup (app.services.funnel) computes bands the
+same way as score_band.
+"""
+
+import math
+from typing import Dict, Mapping, Optional
+
+# Funnel stages, in order, as recorded in MatchEvent.event
+FUNNEL_EVENTS = ("viewed", "applied", "interviewed", "hired", "rejected")
+
+# Bands per unit of FitScore
+BAND_COUNT = 10
+
+# Band of events recorded without a FitScore
+UNSCORED_BAND = -1
+
+
+def score_band(fitscore: Optional[float]) -> int:
+    """
+    Get the FitScore band of a score
+
+    Args:
+        fitscore: Score at the time of the event (0-1), or None
+
+    Returns:
+        int: Band index 0..BAND_COUNT-1, or UNSCORED_BAND
+    """
+    if fitscore is None:
+        return UNSCORED_BAND
+    return max(0, min(math.floor(float(fitscore) * BAND_COUNT), BAND_COUNT - 1))
+
+
+def band_bounds(band: int) -> Optional[tuple]:
+    """
+    Get the score range a band covers
+
+    Args:
+        band: Band index
+
+    Returns:
+        Optional[tuple]: (low, high) FitScores, or None for UNSCORED_BAND
+    """
+    if band == UNSCORED_BAND:
+        return None
+    return (band / BAND_COUNT, (band + 1) / BAND_COUNT)
+
+
+def _rate(numerator: int, denominator: int) -> Optional[float]:
+    return round(numerator / denominator, 4) if denominator else None
+
+
+def funnel_rates(counts: Mapping[str, int]) -> Dict[str, Optional[float]]:
+    """
+    Conversion rates for a set of funnel counts
+
+    Args:
+        counts: Event counts keyed by FUNNEL_EVENTS names
+
+    Returns:
+        Dict[str, Optional[float]]: apply, interview and hire rates per view,
+        and hire rate per application (None when the base count is 0)
+    """
+    viewed = counts.get("viewed", 0)
+    applied = counts.get("applied", 0)
+    return {
+        "apply_rate": _rate(applied, viewed),
+        "interview_rate": _rate(counts.get("interviewed", 0), viewed),
+        "hire_rate": _rate(counts.get("hired", 0), viewed),
+        "hire_per_application": _rate(counts.get("hired", 0), applied),
+    }
@@ -0,0 +1,120 @@
+"""Keyset (cursor) pagination helpers for list endpoints
+
+Listings are ordered newest first on (created_at, id). A cursor is an
+opaque token holding the (created_at, id) of the last row on a page; the
+next page seeks past it with a row-value comparison instead of an OFFSET,
+so deep pages cost the same as the first one.
+
+Totals are optional: "exact" runs a COUNT over the filtered rows,
+"estimate" reads the planner's row estimate from EXPLAIN, "none" skips it.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Sequence, Tuple
+
+from sqlalchemy import Select, func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    Build the cursor pointing just past a row
+
+    Args:
+        created_at: The row's created_at
+        row_id: The row's primary key
+
+    Returns:
+        str: URL-safe opaque token
+    """
+    payload = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Read a cursor produced by encode_cursor
+
+    Args:
+        cursor: Opaque token from a previous page
+
+    Returns:
+        Tuple[datetime, int]: (created_at, id) of the last row seen
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(row_id, int):
+            raise TypeError(row_id)
+        return datetime.fromisoformat(created_at), row_id
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+
+
+def keyset_order(model) -> tuple:
+    """Newest-first ordering shared by page-number and cursor pagination"""
+    return (model.created_at.desc(), model.id.desc())
+
+
+def seek_after(query: Select, model, cursor: str) -> Select:
+    """
+    Restrict a listing query to rows after a cursor
+
+    Args:
+        query: Filtered select() over model
+        model: Mapped class with created_at and id columns
+        cursor: Opaque token from a previous page
+
+    Returns:
+        Select: Query limited to rows older than the cursor position
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    created_at, row_id = decode_cursor(cursor)
+    return query.where(tuple_(model.created_at, model.id) < tuple_(created_at, row_id))
+
+
+def next_cursor(rows: Sequence, page_size: int) -> Optional[str]:
+    """
+    Get the cursor for the page after rows
+
+    Args:
+        rows: Rows fetched with limit page_size + 1
+        page_size: Requested page size
+
+    Returns:
+        Optional[str]: Cursor, or None on the last page
+    """
+    if len(rows) <= page_size:
+        return None
+    last = rows[page_size - 1]
+    return encode_cursor(last.created_at, last.id)
+
+
+async def count_rows(db: AsyncSession, query: Select, mode: str) -> Optional[int]:
+    """
+    Count the rows of a filtered listing query
+
+    Args:
+        db: Database session
+        query: Filtered select() without ordering or limits
+        mode: "exact", "estimate" (planner statistics) or "none"
+
+    Returns:
+        Optional[int]: Row count, or None when mode is "none"
+    """
+    if mode == "none":
+        return None
+    if mode == "estimate":
+        compiled = query.compile(dialect=db.bind.dialect, compile_kwargs={"literal_binds": True})
+        plan = await db.scalar(text(f"EXPLAIN (FORMAT JSON) {compiled}"))
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    return await db.scalar(select(func.count()).select_from(query.subquery()))
@@ -0,0 +1,206 @@
+"""Versioned cache of rendered ranked-list responses
+
+Entries hold the encoded JSON body of a candidate or match list, keyed by
+the response's ETag. The ETag is a fingerprint of every version the list
+depends on (the job or coach row and the pool version of its city, see
+app.services.pool_versions), so any write that can change a list also
+changes its key. Nothing is invalidated or broadcast explicitly: every
+worker derives the new key from the database on its next request, and
+superseded entries age out of the LRU/TTL like score cache entries.
+
+Tiers mirror the score cache (app.core.fitscore.cache): a per-process LRU
+in front of an optional shared Redis tier whose failures are counted,
+never raised. The route handlers are async, so they use aget/aset, which
+run the blocking Redis calls in the threadpool.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import orjson
+from fastapi import Response
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.fitscore.cache import CacheStats, LocalScoreCache
+from app.utils.etag import set_etag
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """
+    A rendered response body plus the views to log when it is served
+
+    views: (entity id, fitscore) pairs shown, for 'viewed' match events
+    """
+
+    body: bytes
+    views: Tuple[Tuple[int, float], ...] = ()
+
+    def to_bytes(self) -> bytes:
+        """Serialize for the Redis tier: views header line, then the body"""
+        return orjson.dumps(self.views) + b"\n" + self.body
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> "CachedResponse":
+        """Deserialize a value written by to_bytes"""
+        header, body = payload.split(b"\n", 1)
+        return cls(body=body, views=tuple(tuple(view) for view in orjson.loads(header)))
+
+    def to_response(self, etag: str) -> Response:
+        """JSON response serving the cached body with its ETag"""
+        response = Response(content=self.body, media_type="application/json")
+        set_etag(response, etag)
+        return response
+
+
+class ResponseCache:
+    """
+    Two-tier response cache: local LRU in front of an optional Redis tier
+
+    A maxsize of 0 disables caching (every lookup misses).
+    """
+
+    def __init__(
+        self,
+        local: Optional[LocalScoreCache] = None,
+        remote=None,
+        ttl: int = 600,
+        prefix: str = "response:v1:",
+        stats: Optional[CacheStats] = None,
+    ):
+        self.stats = stats if stats is not None else CacheStats()
+        self.local = local if local is not None else LocalScoreCache(ttl=ttl, stats=self.stats)
+        self.local.stats = self.stats
+        self.remote = remote
+        self.ttl = ttl
+        self.prefix = prefix
+
+    @classmethod
+    def create(cls, maxsize: int, ttl: int, redis_url: Optional[str] = None) -> "ResponseCache":
+        """
+        Build a cache from configuration
+
+        Args:
+            maxsize: Local tier capacity (0 disables the cache)
+            ttl: Entry lifetime in seconds (both tiers)
+            redis_url: Enables the Redis tier when set (requires the redis package)
+
+        Returns:
+            ResponseCache: Configured cache
+        """
+        remote = None
+        if redis_url and maxsize > 0:
+            import redis
+
+            remote = redis.Redis.from_url(redis_url)
+        stats = CacheStats()
+        return cls(LocalScoreCache(maxsize=maxsize, ttl=ttl, stats=stats), remote, ttl, stats=stats)
+
+    @property
+    def enabled(self) -> bool:
+        return self.local.maxsize > 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Look up a response in the local tier, then the Redis tier
+
+        Blocks on the Redis round trip; async handlers use aget.
+
+        Args:
+            key: Response ETag
+
+        Returns:
+            Optional[CachedResponse]: Cached response, or None
+        """
+        if not self.enabled:
+            return None
+        value = self._get_local(key)
+        if value is None and self.remote is not None:
+            value = self._get_remote(key)
+        if value is None:
+            self.stats.record("misses")
+        return value
+
+    async def aget(self, key: str) -> Optional[CachedResponse]:
+        """
+        Look up a response without blocking the event loop
+
+        Local hits are served inline; the Redis lookup runs in the threadpool.
+
+        Args:
+            key: Response ETag
+
+        Returns:
+            Optional[CachedResponse]: Cached response, or None
+        """
+        if not self.enabled:
+            return None
+        value = self._get_local(key)
+        if value is None and self.remote is not None:
+            value = await run_in_threadpool(self._get_remote, key)
+        if value is None:
+            self.stats.record("misses")
+        return value
+
+    def set(self, key: str, value: CachedResponse) -> None:
+        """
+        Store a response in both tiers
+
+        Blocks on the Redis round trip; async handlers use aset.
+
+        Args:
+            key: Response ETag
+            value: Rendered response
+        """
+        if not self.enabled:
+            return
+        self.local.set(key, value)
+        if self.remote is not None:
+            self._set_remote(key, value)
+
+    async def aset(self, key: str, value: CachedResponse) -> None:
+        """
+        Store a response in both tiers without blocking the event loop
+
+        Args:
+            key: Response ETag
+            value: Rendered response
+        """
+        if not self.enabled:
+            return
+        self.local.set(key, value)
+        if self.remote is not None:
+            await run_in_threadpool(self._set_remote, key, value)
+
+    def _get_local(self, key: str) -> Optional[CachedResponse]:
+        """Local tier lookup, counted as a hit when found"""
+        value = self.local.get(key)
+        if value is not None:
+            self.stats.record("hits")
+        return value
+
+    def _get_remote(self, key: str) -> Optional[CachedResponse]:
+        """Redis tier lookup; hits are copied into the local tier, failures count as misses"""
+        try:
+            payload = self.remote.get(self.prefix + key)
+            value = CachedResponse.from_bytes(payload) if payload is not None else None
+        except Exception:
+            logger.warning("Response cache read failed", exc_info=True)
+            self.stats.record("remote_errors")
+            return None
+        if value is not None:
+            self.local.set(key, value)
+            self.stats.record("hits")
+            self.stats.record("remote_hits")
+        return value
+
+    def _set_remote(self, key: str, value: CachedResponse) -> None:
+        """Redis tier write; failures are logged and counted"""
+        try:
+            self.remote.set(self.prefix + key, value.to_bytes(), ex=self.ttl)
+        except Exception:
+            logger.warning("Response cache write failed", exc_info=True)
+            self.stats.record("remote_errors")
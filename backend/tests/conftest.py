@@ -0,0 +1,209 @@
+"""Shared test configuration and database fixtures
+
+Settings are read from the environment when app modules are imported, so
+placeholders are filled in for required values that are unset. Tests
+using the `db` or `client` fixtures need PostgreSQL: point
+TEST_DATABASE_URL at a scratch database (every table in it is dropped and
+recreated per test); without it those tests are skipped.
+"""
+
+import asyncio
+import os
+from datetime import datetime
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+    os.environ["DATABASE_REPLICA_URL"] = ""
+for name in (
+    "SECRET_KEY",
+    "DATABASE_URL",
+    "CLERK_SECRET_KEY",
+    "CLERK_PUBLISHABLE_KEY",
+    "CLERK_WEBHOOK_SECRET",
+    "R2_ACCOUNT_ID",
+    "R2_ACCESS_KEY_ID",
+    "R2_SECRET_ACCESS_KEY",
+    "R2_ENDPOINT",
+):
+    os.environ.setdefault(
+        name, "postgresql://test@localhost/test" if name == "DATABASE_URL" else "test"
+    )
+
+# Claims returned by get_current_user in API tests
+TEST_USER = {"sub": "user_test", "role": "brand_admin"}
+
+
+def _clear_caches() -> None:
+    """Drop process-wide caches so ids reused across tests never hit stale entries"""
+    from app.core.fitscore.compiled import compiled_job_cache
+    from app.core.fitscore.encoding import coach_profile_cache
+    from app.services.matching import response_cache, score_cache
+
+    score_cache.clear()
+    response_cache.local.clear()
+    coach_profile_cache.clear()
+    compiled_job_cache.clear()
+
+
+@pytest.fixture
+def db():
+    """Sync session on a freshly created schema (skipped without TEST_DATABASE_URL)"""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    import app.models  # noqa: F401  (registers every table)
+    from app.db.partitions import maintain_partitions
+    from app.db.session import Base, SessionLocal, engine
+
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        maintain_partitions(conn, months_ahead=1)
+    _clear_caches()
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _async_sessions():
+    """Async session factory on the test database"""
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    from app.db.session import async_database_url
+
+    # Callers run on short-lived event loops, so connections must not be
+    # pooled across them
+    async_engine = create_async_engine(async_database_url(TEST_DATABASE_URL), poolclass=NullPool)
+    return async_sessionmaker(
+        async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+
+
+@pytest.fixture
+def run_async(db):
+    """Run `await fn(session)` on an async session on the `db` schema"""
+    factory = _async_sessions()
+
+    async def run(fn):
+        async with factory() as session:
+            return await fn(session)
+
+    return lambda fn: asyncio.run(run(fn))
+
+
+@pytest.fixture
+def client(db):
+    """API client authenticated as TEST_USER, on the `db` schema"""
+    from fastapi.testclient import TestClient
+
+    from app.api.deps import get_async_db, get_read_db
+    from app.main import app
+    from app.utils.auth import get_current_user
+
+    factory = _async_sessions()
+
+    async def session():
+        async with factory() as db:
+            yield db
+
+    app.dependency_overrides[get_current_user] = lambda: TEST_USER
+    app.dependency_overrides[get_async_db] = session
+    app.dependency_overrides[get_read_db] = session
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+class Factory:
+    """Creates committed brand, location, user, coach and job rows"""
+
+    def __init__(self, db):
+        self.db = db
+        self._users = 0
+
+    def _add(self, obj):
+        self.db.add(obj)
+        self.db.commit()
+        return obj
+
+    def location(self, city: str = "Denver", state: str = "CO"):
+        from app.models.brand import Brand, Location, Region
+
+        brand = self._add(Brand(name="Brand", slug=f"brand-{datetime.utcnow().timestamp()}"))
+        region = self._add(Region(brand_id=brand.id, name="Region", slug="region"))
+        return self._add(
+            Location(region_id=region.id, brand_id=brand.id, name="Studio", city=city, state=state)
+        )
+
+    def user(self, email: str = None, clerk_user_id: str = None, role: str = "coach"):
+        from app.models.user import User
+
+        self._users += 1
+        return self._add(
+            User(
+                clerk_user_id=clerk_user_id or f"user_{self._users}",
+                email=email or f"user{self._users}@example.com",
+                role=role,
+            )
+        )
+
+    def coach(self, location, status: str = "verified", **fields):
+        from app.models.coach import Coach
+
+        values = {
+            "user_id": self.user().id,
+            "brand_id": location.brand_id,
+            "city": location.city,
+            "state": location.state,
+            "role_type": "Personal Trainer",
+            "years_experience": 5,
+            "certifications": [{"name": "NASM-CPT"}],
+            "available_times": ["Mon AM", "Wed PM"],
+            "lifestyle_tags": ["wellness"],
+            "movement_tags": [],
+            "instruction_tags": ["motivational"],
+            "profile_completeness": 0.8,
+            "status": status,
+            "last_updated": datetime.utcnow(),
+        }
+        values.update(fields)
+        return self._add(Coach(**values))
+
+    def job(self, location, status: str = "open", **fields):
+        from app.models.job import Job
+
+        values = {
+            "brand_id": location.brand_id,
+            "location_id": location.id,
+            "created_by": self.user(role="location_manager").id,
+            "title": "Trainer",
+            "role_type": "Personal Trainer",
+            "required_certifications": ["NASM-CPT"],
+            "preferred_certifications": [],
+            "min_experience": 2,
+            "required_availability": ["Mon AM"],
+            "city": location.city,
+            "state": location.state,
+            "culture_tags": ["wellness"],
+            "weighting_preset": "balanced",
+            "fitscore_threshold": 0.40,
+            "status": status,
+        }
+        values.update(fields)
+        return self._add(Job(**values))
+
+
+@pytest.fixture
+def factory(db):
+    """Row factory bound to the `db` session"""
+    return Factory(db)
@@ -0,0 +1,241 @@
+"""Tests for bulk coach and job imports (DB tests need PostgreSQL, see conftest)"""
+
+import json
+from decimal import Decimal
+from functools import partial
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1.routes.coaches import coach_values, create_coach
+from app.api.v1.routes.jobs import job_values
+from app.models.coach import Coach
+from app.models.job import Job
+from app.models.user import User
+from app.schemas.coach import CoachCreate
+from app.schemas.job import JobCreate
+from app.services.bulk_import import bulk_import
+from app.services.pool_versions import COACH_POOL, get_pool_version
+from tests.conftest import TEST_USER
+
+
+def _coach(location_id: int, email: str, **fields) -> dict:
+    return dict(
+        location_id=location_id,
+        first_name="Sam",
+        last_name="Lee",
+        email=email,
+        city="Denver",
+        state="CO",
+        role_type="Personal Trainer",
+        certifications=["NASM-CPT"],
+        years_experience=4,
+        profile_photo_url="https://example.com/sam.jpg",
+        **fields,
+    )
+
+
+def _job(location_id: int, **fields) -> dict:
+    return dict(
+        location_id=location_id,
+        title="Trainer",
+        description="Morning sessions",
+        role_type="Personal Trainer",
+        required_certifications=["NASM-CPT"],
+        city="Denver",
+        state="CO",
+        **fields,
+    )
+
+
+def _ndjson(records) -> bytes:
+    return "\n".join(json.dumps(record) for record in records).encode()
+
+
+class TestRowBuilders:
+    """Insert values must only name real columns"""
+
+    def test_coach_values_compile(self):
+        """Coach values should compile into an INSERT on coaches"""
+        values = coach_values(CoachCreate(**_coach(1, "sam@example.com")), 7, 42)
+
+        assert set(values) <= set(Coach.__table__.columns.keys())
+        assert (values["user_id"], values["brand_id"]) == (42, 7)
+        assert values["profile_image_url"] == "https://example.com/sam.jpg"
+        insert(Coach).values(values).compile(dialect=postgresql.dialect())
+
+    def test_job_values_compile(self):
+        """Job values should compile, with the creator and whole-unit compensation"""
+        job = JobCreate(**_job(1, compensation_type="hourly", compensation_min="35.50"))
+        values = job_values(job, 7, 42)
+
+        assert set(values) <= set(Job.__table__.columns.keys())
+        assert values["created_by"] == 42
+        assert (values["compensation_min"], values["compensation_max"]) == (36, None)
+        insert(Job).values(values).compile(dialect=postgresql.dialect())
+
+
+class TestBulkImport:
+    """Test the chunked import service"""
+
+    def test_coaches_attach_to_user_accounts(self, db, factory, run_async):
+        """Each coach should belong to the account with its email; unknown emails fail"""
+        denver = factory.location()
+        sam, alex = factory.user("sam@example.com"), factory.user("alex@example.com")
+        records = [
+            (1, _coach(denver.id, "sam@example.com")),
+            (2, _coach(denver.id, "nobody@example.com")),
+            (3, _coach(denver.id + 100, "alex@example.com")),
+            (4, _coach(denver.id, "alex@example.com")),
+        ]
+        pool_version = partial(get_pool_version, pool=COACH_POOL, city="Denver", state="CO")
+        version = run_async(pool_version)
+
+        result = run_async(
+            lambda session: bulk_import(
+                session,
+                Coach,
+                CoachCreate,
+                records,
+                coach_values,
+                owner_email=lambda item: item.email,
+                chunk_size=2,
+            )
+        )
+
+        assert [error.row for error in result.errors] == [2, 3]
+        assert "email" in result.errors[0].errors[0]
+        assert "location_id" in result.errors[1].errors[0]
+        coaches = db.scalars(select(Coach).where(Coach.id.in_(result.created_ids))).all()
+        assert sorted((coach.user_id, coach.status) for coach in coaches) == sorted(
+            [(sam.id, "pending"), (alex.id, "pending")]
+        )
+        assert run_async(pool_version) != version
+
+    def test_failed_chunk_falls_back_to_single_rows(self, db, factory, run_async):
+        """A row violating a constraint should fail alone, not its whole chunk"""
+        denver = factory.location()
+        user = factory.user("sam@example.com")
+        factory.user("alex@example.com")
+        factory.coach(denver, user_id=user.id)
+        records = [
+            (1, _coach(denver.id, "alex@example.com")),
+            (2, _coach(denver.id, "sam@example.com")),
+        ]
+
+        result = run_async(
+            lambda session: bulk_import(
+                session,
+                Coach,
+                CoachCreate,
+                records,
+                coach_values,
+                owner_email=lambda item: item.email,
+            )
+        )
+
+        assert len(result.created_ids) == 1
+        assert [error.row for error in result.errors] == [2]
+        assert "Insert failed" in result.errors[0].errors[0]
+
+    def test_jobs_are_created_by_the_caller(self, db, factory, run_async):
+        """Jobs should be drafts owned by the given user"""
+        denver = factory.location()
+        owner = factory.user(role="location_manager")
+        records = [(1, _job(denver.id, compensation_min="40", compensation_max="55.25"))]
+
+        result = run_async(
+            lambda session: bulk_import(
+                session,
+                Job,
+                JobCreate,
+                records,
+                partial(job_values, created_by=owner.id),
+            )
+        )
+
+        [job] = db.scalars(select(Job).where(Job.id.in_(result.created_ids))).all()
+        assert (job.created_by, job.status, job.brand_id) == (owner.id, "draft", denver.brand_id)
+        assert (job.compensation_min, job.compensation_max) == (40, 55)
+
+
+class TestCreateCoach:
+    """Test that single creation keeps working without a user account"""
+
+    def test_creates_the_missing_account(self, db, factory, run_async):
+        """A coach with a new email should get a coach-role account; a known email is reused"""
+        denver = factory.location()
+        sam = factory.user("sam@example.com")
+
+        def create(email):
+            return lambda session: create_coach(
+                CoachCreate(**_coach(denver.id, email)), db=session, current_user=TEST_USER
+            )
+
+        created, existing = run_async(create("new@example.com")), run_async(
+            create("sam@example.com")
+        )
+
+        account = db.scalar(select(User).where(User.email == "new@example.com"))
+        assert (created.user_id, created.status) == (account.id, "pending")
+        assert (account.role, account.brand_id, account.first_name) == (
+            "coach",
+            denver.brand_id,
+            "Sam",
+        )
+        assert existing.user_id == sam.id
+
+
+class TestBulkRoutes:
+    """Test the :bulk endpoints end to end"""
+
+    def test_bulk_coaches_csv(self, client, factory):
+        """CSV rows should create coaches and report rows without an account"""
+        denver = factory.location()
+        factory.user("sam@example.com")
+        body = (
+            "location_id,first_name,last_name,email,city,state,role_type,certifications\n"
+            f"{denver.id},Sam,Lee,sam@example.com,Denver,CO,Personal Trainer,NASM-CPT; ACE\n"
+            f"{denver.id},Alex,Kim,alex@example.com,Denver,CO,Personal Trainer,ACE\n"
+        ).encode()
+
+        response = client.post(
+            "/api/v1/coaches:bulk", content=body, headers={"content-type": "text/csv"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["created"] == 1
+        assert [error["row"] for error in response.json()["errors"]] == [2]
+
+    def test_bulk_jobs_ndjson(self, client, db, factory):
+        """Jobs should be created as drafts owned by the calling user"""
+        denver = factory.location()
+        caller = factory.user(clerk_user_id=TEST_USER["sub"], role="brand_admin")
+
+        response = client.post(
+            "/api/v1/jobs:bulk",
+            content=_ndjson([_job(denver.id), _job(denver.id, fitscore_threshold="0.9")]),
+            headers={"content-type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        payload = response.json()
+        assert (payload["created"], payload["failed"]) == (1, 1)
+        job = db.get(Job, payload["ids"][0])
+        assert (job.created_by, job.status, job.fitscore_threshold) == (
+            caller.id,
+            "draft",
+            Decimal("0.60"),
+        )
+
+    def test_bulk_jobs_require_a_user_account(self, client, factory):
+        """A caller without a user account cannot own jobs"""
+        denver = factory.location()
+
+        response = client.post(
+            "/api/v1/jobs:bulk",
+            content=_ndjson([_job(denver.id)]),
+            headers={"content-type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 403
@@ -0,0 +1,67 @@
+"""Unit tests for bulk upload parsing and batch validation"""
+
+import json
+from typing import List
+
+import pytest
+from pydantic import BaseModel, Field
+
+from app.utils.bulk_records import BULK_MAX_ROWS, parse_records, validate_records
+
+
+class Record(BaseModel):
+    name: str = Field(..., min_length=1)
+    years: int = Field(0, ge=0)
+    tags: List[str] = Field(default_factory=list)
+
+
+class TestParseRecords:
+    """Test JSON lines and CSV parsing"""
+
+    def test_json_lines(self):
+        """Each non-blank line should be one record, numbered by line"""
+        body = b'{"name": "a"}\n\n{"name": "b", "tags": ["x"]}\nnot json\n[1, 2]\n'
+        records, errors = parse_records(body, "application/x-ndjson")
+
+        assert records == [(1, {"name": "a"}), (3, {"name": "b", "tags": ["x"]})]
+        assert [error.row for error in errors] == [4, 5]
+
+    def test_csv_lists_and_blank_cells(self):
+        """List cells accept ";" or JSON arrays; blank cells are omitted"""
+        body = 'name,years,tags\na,,x; y\nb,3,"[""z""]"\n'.encode()
+        records, errors = parse_records(body, "text/csv; charset=utf-8", ["tags"])
+
+        assert errors == []
+        assert records == [
+            (1, {"name": "a", "tags": ["x", "y"]}),
+            (2, {"name": "b", "years": "3", "tags": ["z"]}),
+        ]
+
+    def test_rejects_oversized_upload(self):
+        """Uploads beyond BULK_MAX_ROWS should be refused outright"""
+        body = "\n".join(json.dumps({"name": "a"}) for _ in range(BULK_MAX_ROWS + 1)).encode()
+        with pytest.raises(ValueError):
+            parse_records(body, None)
+
+
+class TestValidateRecords:
+    """Test batch validation with per-row errors"""
+
+    def test_valid_batch(self):
+        """A clean batch should validate in one pass, keeping row numbers"""
+        valid, errors = validate_records(
+            Record, [(1, {"name": "a"}), (2, {"name": "b", "years": "3"})]
+        )
+
+        assert errors == []
+        assert [(row, item.years) for row, item in valid] == [(1, 0), (2, 3)]
+
+    def test_invalid_rows_are_reported_and_skipped(self):
+        """Bad rows should be reported by row number; the rest still validate"""
+        records = [(1, {"name": "a"}), (2, {"name": "", "years": -1}), (3, {"name": "c"}), (5, {})]
+        valid, errors = validate_records(Record, records)
+
+        assert [row for row, _ in valid] == [1, 3]
+        assert [error.row for error in errors] == [2, 5]
+        assert len(errors[0].errors) == 2
+        assert errors[0].errors[0].startswith("name:")
@@ -0,0 +1,96 @@
+"""Unit tests for compiled FitScore job queries"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.fitscore.compiled import CompiledJob, compiled_job_cache, get_compiled_job
+from app.core.fitscore.encoding import EncodedCoach
+from app.core.fitscore.engine import FitScoreEngine
+from app.core.fitscore.presets import COMPONENTS, get_preset, get_preset_weights
+
+JOB = {
+    "required_certifications": ["NASM-CPT"],
+    "preferred_certifications": ["ACE"],
+    "min_experience": 2,
+    "required_availability": ["Mon AM", "Wed PM"],
+    "city": " Chicago ",
+    "state": "il",
+    "culture_tags": ["community"],
+}
+
+
+class TestCompiledJob:
+    """Test job compilation"""
+
+    def test_compile_normalizes_and_freezes(self):
+        """Compiled jobs should hold frozen sets and normalized location"""
+        compiled = CompiledJob.compile(JOB, preset="experience_heavy")
+
+        assert compiled.required_certifications == frozenset({"NASM-CPT"})
+        assert compiled.required_availability == frozenset({"Mon AM", "Wed PM"})
+        assert (compiled.city, compiled.state) == ("chicago", "IL")
+        assert compiled.weights == get_preset_weights("experience_heavy")
+
+    def test_compiled_job_is_hashable(self):
+        """Equal job definitions should compile to equal, hashable objects"""
+        first = CompiledJob.compile(JOB)
+        second = CompiledJob.compile(dict(JOB))
+        assert first == second
+        assert len({first, second}) == 1
+
+    def test_unknown_preset_raises(self):
+        """Compiling with an unknown preset should fail up front"""
+        with pytest.raises(ValueError):
+            CompiledJob.compile(JOB, preset="nonexistent")
+
+    def test_weight_vector_follows_components(self):
+        """Weight vectors should line up with COMPONENTS"""
+        weights = get_preset("balanced")
+        assert get_preset_weights("balanced") == tuple(weights[c] for c in COMPONENTS)
+
+    def test_score_compiled_matches_scalar(self):
+        """Scoring against a compiled job should match calculate_match"""
+        engine = FitScoreEngine()
+        coach = {
+            "certifications": [{"name": "NASM-CPT"}, {"name": "ACE"}],
+            "years_experience": 6,
+            "available_times": ["Mon AM", "Wed PM", "Fri AM"],
+            "city": "Chicago",
+            "state": "IL",
+            "lifestyle_tags": ["community"],
+            "last_updated": datetime.now().isoformat(),
+        }
+
+        for preset in ("balanced", "availability_focused"):
+            compiled = engine.compile_job(JOB, preset=preset)
+            assert engine.score_compiled([EncodedCoach.from_dict(coach)], compiled) == [
+                engine.calculate_match(coach, JOB, preset=preset)
+            ]
+
+
+class TestCompiledJobCache:
+    """Test compiled job caching by (id, updated_at)"""
+
+    def setup_method(self):
+        compiled_job_cache.clear()
+
+    def _job_row(self, updated_at, **overrides):
+        fields = dict(JOB, id=42, updated_at=updated_at, weighting_preset="balanced")
+        fields.update(overrides)
+        return SimpleNamespace(**fields)
+
+    def test_same_version_reuses_compiled_job(self):
+        """An unchanged job should not be recompiled"""
+        updated_at = datetime(2025, 1, 1)
+        first = get_compiled_job(self._job_row(updated_at))
+        second = get_compiled_job(self._job_row(updated_at, min_experience=99))
+        assert second is first
+
+    def test_new_version_recompiles(self):
+        """Bumping updated_at should produce a fresh compiled job"""
+        first = get_compiled_job(self._job_row(datetime(2025, 1, 1)))
+        second = get_compiled_job(self._job_row(datetime(2025, 1, 2), min_experience=5))
+        assert second is not first
+        assert second.min_experience == 5
@@ -0,0 +1,64 @@
+"""Tests for the brand coverage report (need PostgreSQL, see conftest)"""
+
+import asyncio
+
+import pytest
+
+from app.services.coverage import parallel_scorer
+from app.services.matching import (
+    get_ranked_candidates,
+    get_ranked_matches,
+    refresh_job_matches,
+)
+
+
+def _url(brand_id: int, k: int = 3) -> str:
+    return f"/api/v1/admin/brands/{brand_id}/coverage?k={k}"
+
+
+class TestCoverage:
+    """Test the coverage endpoint against the stored match lists"""
+
+    def test_lists_match_candidates_and_matches(self, client, db, factory):
+        """Each job's and coach's top-k should equal its stored ranked list"""
+        denver = factory.location()
+        coaches = [factory.coach(denver, years_experience=years) for years in (1, 3, 6, 9)]
+        jobs = [factory.job(denver, min_experience=years) for years in (2, 5)]
+        for job in jobs:
+            refresh_job_matches(db, job)
+        db.commit()
+
+        response = client.get(_url(denver.brand_id))
+
+        assert response.status_code == 200
+        report = response.json()
+        [group] = report["groups"]
+        assert (group["coach_count"], group["job_count"]) == (len(coaches), len(jobs))
+        for job, entry in zip(jobs, group["jobs"], strict=True):
+            assert entry["job_id"] == job.id
+            assert [(top["id"], top["fitscore"]) for top in entry["top_candidates"]] == [
+                (coach_id, score.fitscore) for coach_id, score in get_ranked_candidates(db, job, 3)
+            ]
+        for coach, entry in zip(coaches, report["coaches"], strict=True):
+            assert entry["coach_id"] == coach.id
+            assert [(top["id"], top["fitscore"]) for top in entry["top_jobs"]] == [
+                (job_id, score.fitscore) for job_id, score in get_ranked_matches(db, coach, 3)
+            ]
+
+    def test_sweep_runs_off_the_event_loop(self, client, factory, monkeypatch):
+        """The grid sweep should run in an executor, not on the request's loop"""
+        denver = factory.location()
+        factory.coach(denver)
+        factory.job(denver)
+        rank_grid = parallel_scorer.engine.rank_grid
+
+        def checked(*args, **kwargs):
+            with pytest.raises(RuntimeError):
+                asyncio.get_running_loop()
+            return rank_grid(*args, **kwargs)
+
+        monkeypatch.setattr(parallel_scorer.engine, "rank_grid", checked)
+        response = client.get(_url(denver.brand_id))
+
+        assert response.status_code == 200
+        assert response.json()["pairs_scored"] == 1
@@ -0,0 +1,104 @@
+"""Unit tests for read-your-writes replica routing"""
+
+import asyncio
+
+from app.db import session as db_session
+from app.db.routing import ReadYourWrites
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeSession:
+    """Async session stand-in that remembers which factory opened it"""
+
+    def __init__(self, name):
+        self.name = name
+        self.info = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class TestReadYourWrites:
+    """Test stickiness after a client writes"""
+
+    def test_sticky_within_window(self):
+        """A writer should read from the primary until its window passes"""
+        clock = FakeClock()
+        tracker = ReadYourWrites(window=5, clock=clock)
+
+        assert not tracker.is_sticky("user_a")
+        tracker.record_write("user_a")
+
+        clock.now = 4.9
+        assert tracker.is_sticky("user_a")
+        assert not tracker.is_sticky("user_b")
+        clock.now = 5.0
+        assert not tracker.is_sticky("user_a")
+        assert len(tracker) == 0
+
+    def test_new_write_extends_window(self):
+        """Each write should restart the client's window"""
+        clock = FakeClock()
+        tracker = ReadYourWrites(window=5, clock=clock)
+        tracker.record_write("user_a")
+        clock.now = 4.0
+        tracker.record_write("user_a")
+
+        clock.now = 8.0
+        assert tracker.is_sticky("user_a")
+
+    def test_anonymous_and_disabled(self):
+        """Clients without an identity, or a zero window, are never sticky"""
+        tracker = ReadYourWrites(window=5)
+        tracker.record_write(None)
+        assert not tracker.is_sticky(None)
+
+        disabled = ReadYourWrites(window=0)
+        disabled.record_write("user_a")
+        assert not disabled.is_sticky("user_a")
+
+    def test_bounded_size(self):
+        """Oldest writers should be dropped beyond maxsize"""
+        clock = FakeClock()
+        tracker = ReadYourWrites(window=60, clock=clock, maxsize=2)
+        for client in ("a", "b", "c"):
+            tracker.record_write(client)
+
+        assert len(tracker) == 2
+        assert not tracker.is_sticky("a")
+        assert tracker.is_sticky("c")
+
+
+class TestSessionRouting:
+    """Test that the session factories route by the client key they are given"""
+
+    def test_commit_pins_client_reads_to_primary(self, monkeypatch):
+        """A client that committed should read from the primary; others from the replica"""
+        monkeypatch.setattr(db_session, "AsyncSessionLocal", lambda: FakeSession("primary"))
+        monkeypatch.setattr(db_session, "AsyncReadSessionLocal", lambda: FakeSession("replica"))
+        monkeypatch.setattr(db_session, "read_your_writes", ReadYourWrites(window=60))
+
+        async def route():
+            async with db_session.primary_session("user_a") as db:
+                db.info["committed"] = True
+            async with db_session.primary_session("user_b"):
+                pass
+            names = []
+            for client in ("user_a", "user_b", None):
+                async with db_session.read_session(client) as db:
+                    names.append(db.name)
+            return names
+
+        assert asyncio.run(route()) == ["primary", "replica", "replica"]
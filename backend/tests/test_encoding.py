@@ -0,0 +1,229 @@
+"""Unit tests for FitScore bitset encoding"""
+
+from collections import namedtuple
+from datetime import datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.fitscore.compiled import compile_job_row
+from app.core.fitscore.encoding import (
+    EncodedCoach,
+    EncodedJob,
+    ProfileCache,
+    Vocabulary,
+    parse_last_updated,
+)
+from app.core.fitscore.engine import COACH_INPUT_FIELDS, JOB_INPUT_FIELDS, FitScoreEngine
+
+
+class TestVocabulary:
+    """Test token interning"""
+
+    def test_bits_are_stable(self):
+        """The same token should always map to the same bit"""
+        vocab = Vocabulary("test")
+        first = vocab.bit("Mon AM")
+        vocab.bit("Tue AM")
+        assert vocab.bit("Mon AM") == first
+
+    def test_grows_at_runtime(self):
+        """Unseen tokens should be interned on first sight"""
+        vocab = Vocabulary("test")
+        vocab.encode(["Mon AM", "Tue AM"])
+        assert len(vocab) == 2
+        vocab.encode(["Tue AM", "Sun PM"])
+        assert len(vocab) == 3
+        assert "Sun PM" in vocab
+
+    def test_encode_decode_round_trip(self):
+        """decode(encode(tokens)) should return the distinct tokens"""
+        vocab = Vocabulary("test")
+        tokens = ["wellness", "community", "wellness"]
+        mask = vocab.encode(tokens)
+        assert mask.bit_count() == 2
+        assert vocab.decode(mask) == {"wellness", "community"}
+
+    def test_empty_encodes_to_zero(self):
+        """No tokens should encode to an empty bitset"""
+        assert Vocabulary("test").encode([]) == 0
+
+
+class TestEncodedProfiles:
+    """Test encoded coach/job profiles"""
+
+    def test_coach_cert_names_from_dicts_and_strings(self):
+        """Dict and plain-string certifications should encode the same names"""
+        from_dicts = EncodedCoach.from_dict({"certifications": [{"name": "ACE"}]})
+        from_strings = EncodedCoach.from_dict({"certifications": ["ACE"]})
+        assert from_dicts.certs == from_strings.certs
+
+    def test_coach_tags_are_combined(self):
+        """Lifestyle, movement and instruction tags should share one bitset"""
+        coach = EncodedCoach.from_dict(
+            {
+                "lifestyle_tags": ["wellness"],
+                "movement_tags": ["dynamic-flow"],
+                "instruction_tags": ["wellness"],
+            }
+        )
+        job = EncodedJob.from_dict({"culture_tags": ["wellness", "dynamic-flow"]})
+        assert coach.tags == job.culture_tags
+
+    def test_profiles_are_hashable(self):
+        """Encoded profiles should be usable as dict keys"""
+        job = EncodedJob.from_dict({"city": "Austin", "state": "TX"})
+        assert {job: 1}[EncodedJob.from_dict({"city": "austin ", "state": "tx"})] == 1
+
+    def test_score_encoded_matches_scalar(self):
+        """Scoring cached encodings should match calculate_match"""
+        engine = FitScoreEngine()
+        coach = {
+            "certifications": [{"name": "NASM-CPT"}],
+            "years_experience": 4,
+            "available_times": ["Mon AM", "Wed PM", "Sat AM"],
+            "city": "Austin",
+            "state": "TX",
+            "movement_tags": ["dynamic-flow"],
+            "last_updated": datetime.now().isoformat(),
+        }
+        job = {
+            "required_certifications": ["NASM-CPT"],
+            "preferred_certifications": ["ACE"],
+            "min_experience": 2,
+            "required_availability": ["Mon AM"],
+            "city": "Austin",
+            "state": "TX",
+            "culture_tags": ["dynamic-flow", "community"],
+        }
+
+        encoded = engine.score_compiled(
+            [EncodedCoach.from_dict(coach)], engine.compile_job(job, preset="culture_heavy")
+        )
+        assert encoded == [engine.calculate_match(coach, job, preset="culture_heavy")]
+
+    def test_from_row_matches_from_dict(self):
+        """Encoding a row directly should equal encoding its dict form"""
+        last_updated = datetime(2025, 3, 1, 9, 30)
+        row = SimpleNamespace(
+            certifications=[{"name": "ACE"}],
+            years_experience=3,
+            available_times=["Tue PM"],
+            city=" Denver",
+            state="co",
+            lifestyle_tags=["outdoors"],
+            movement_tags=[],
+            instruction_tags=["cueing"],
+            profile_completeness=Decimal("0.92"),
+            last_updated=last_updated,
+            verified_video_url="https://example.com/v.mp4",
+        )
+        data = dict(vars(row), profile_completeness=0.92, last_updated=last_updated.isoformat())
+
+        assert EncodedCoach.from_row(row) == EncodedCoach.from_dict(data)
+
+    def test_rows_need_only_input_fields(self):
+        """Projected rows holding just the engine's input columns should encode"""
+        coach_row = namedtuple("CoachRow", COACH_INPUT_FIELDS)(
+            certifications=[{"name": "ACE"}],
+            years_experience=3,
+            available_times=["Tue PM"],
+            city="Denver",
+            state="CO",
+            lifestyle_tags=["outdoors"],
+            movement_tags=[],
+            instruction_tags=[],
+            profile_completeness=Decimal("0.92"),
+            last_updated=datetime(2025, 3, 1),
+            verified_video_url=None,
+        )
+        job_row = namedtuple("JobRow", ("id", "updated_at", "weighting_preset") + JOB_INPUT_FIELDS)(
+            id=1,
+            updated_at=datetime(2025, 3, 2),
+            weighting_preset="balanced",
+            required_certifications=["ACE"],
+            preferred_certifications=[],
+            min_experience=2,
+            required_availability=["Tue PM"],
+            city="Denver",
+            state="CO",
+            culture_tags=[],
+        )
+
+        assert EncodedCoach.from_row(coach_row).certs
+        assert compile_job_row(job_row).encoded.required_certs
+
+    def test_profiles_are_slotted(self):
+        """Encoded profiles should not carry a per-instance __dict__"""
+        coach = EncodedCoach.from_dict({"city": "Austin", "state": "TX"})
+        assert not hasattr(coach, "__dict__")
+        with pytest.raises(AttributeError):
+            coach.city = "dallas"
+
+    def test_score_rows_with_pinned_clock(self):
+        """Rows should score like dicts, with engagement judged at as_of"""
+        engine = FitScoreEngine()
+        last_updated = datetime(2025, 6, 1)
+        row = SimpleNamespace(
+            id=7,
+            certifications=[],
+            years_experience=1,
+            available_times=[],
+            city="Austin",
+            state="TX",
+            lifestyle_tags=[],
+            movement_tags=[],
+            instruction_tags=[],
+            profile_completeness=None,
+            last_updated=last_updated,
+            verified_video_url=None,
+        )
+        job = engine.compile_job({"city": "Austin", "state": "TX"})
+        coach_data = {"city": "Austin", "state": "TX", "years_experience": 1,
+                      "last_updated": last_updated.isoformat()}
+
+        for days, engagement in ((10, 0.7), (45, 0.5)):
+            as_of = last_updated + timedelta(days=days)
+            [score] = engine.score_compiled([row], job, as_of=as_of)
+            assert score.engagement_score == engagement
+            assert score == engine.calculate_match(
+                coach_data, {"city": "Austin", "state": "TX"}, as_of=as_of
+            )
+
+    def test_parse_last_updated(self):
+        """last_updated should accept datetimes and ISO strings"""
+        now = datetime(2025, 1, 15, 12, 0)
+        assert parse_last_updated(now) == now
+        assert parse_last_updated("2025-01-15T12:00:00") == now
+        assert parse_last_updated("2025-01-15T12:00:00Z").replace(tzinfo=None) == now
+        assert parse_last_updated("not a date") is None
+        assert parse_last_updated(None) is None
+
+
+class TestProfileCache:
+    """Test the encoded profile LRU cache"""
+
+    def test_hit_skips_factory(self):
+        """A cached (id, version) should not rebuild the profile"""
+        cache = ProfileCache(maxsize=10)
+        calls = []
+        cache.get_or_create(1, "v1", lambda: calls.append(1) or "profile")
+        assert cache.get_or_create(1, "v1", lambda: calls.append(1) or "other") == "profile"
+        assert len(calls) == 1
+
+    def test_new_version_rebuilds(self):
+        """A new version should produce a fresh profile"""
+        cache = ProfileCache(maxsize=10)
+        cache.get_or_create(1, "v1", lambda: "old")
+        assert cache.get_or_create(1, "v2", lambda: "new") == "new"
+
+    def test_evicts_least_recently_used(self):
+        """Cache should stay within maxsize, evicting the oldest entry"""
+        cache = ProfileCache(maxsize=2)
+        cache.get_or_create(1, "v", lambda: "a")
+        cache.get_or_create(2, "v", lambda: "b")
+        cache.get_or_create(1, "v", lambda: "unused")  # refresh 1
+        cache.get_or_create(3, "v", lambda: "c")
+        assert len(cache) == 2
+        assert cache.get_or_create(2, "v", lambda: "rebuilt") == "rebuilt"
@@ -0,0 +1,58 @@
+"""Unit tests for ETag fingerprints and If-None-Match handling"""
+
+from datetime import datetime
+
+from app.utils.etag import etag_matches, make_etag, not_modified
+
+
+class TestMakeEtag:
+    """Test version fingerprints"""
+
+    def test_stable_for_same_versions(self):
+        """Equal inputs should always give the same weak tag"""
+        updated = datetime(2026, 1, 2, 3, 4, 5)
+        etag = make_etag("candidates", 7, updated, 12, 20, None)
+
+        assert etag == make_etag("candidates", 7, updated, 12, 20, None)
+        assert etag.startswith('W/"') and etag.endswith('"')
+
+    def test_changes_with_any_version(self):
+        """A new timestamp, pool version or parameter should change the tag"""
+        updated = datetime(2026, 1, 2, 3, 4, 5)
+        base = make_etag("candidates", 7, updated, 12, 20, None)
+
+        assert base != make_etag("candidates", 7, datetime(2026, 1, 2, 3, 4, 6), 12, 20, None)
+        assert base != make_etag("candidates", 7, updated, 13, 20, None)
+        assert base != make_etag("candidates", 7, updated, 12, 10, None)
+        assert base != make_etag("candidates", 7, updated, 12, 20, True)
+        assert base != make_etag("matches", 7, updated, 12, 20, None)
+
+
+class TestIfNoneMatch:
+    """Test conditional request matching"""
+
+    def test_matches_weak_strong_and_lists(self):
+        """Weak comparison should ignore W/ and accept any tag in a list"""
+        etag = make_etag("job", 1)
+        opaque = etag.removeprefix("W/")
+
+        assert etag_matches(etag, etag)
+        assert etag_matches(opaque, etag)
+        assert etag_matches(f'"other", {etag}', etag)
+        assert etag_matches("*", etag)
+
+    def test_no_match(self):
+        """Missing or different tags should not match"""
+        etag = make_etag("job", 1)
+
+        assert not etag_matches(None, etag)
+        assert not etag_matches("", etag)
+        assert not etag_matches(make_etag("job", 2), etag)
+
+    def test_not_modified_response(self):
+        """304 responses should repeat the ETag and carry no body"""
+        response = not_modified('W/"abc"')
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == 'W/"abc"'
+        assert response.body == b""
@@ -0,0 +1,98 @@
+"""Unit tests for the fast JSON response path"""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.schemas.coach import CoachResponse
+from app.schemas.match import FitScoreBreakdown, JobCandidatesResponse
+from app.utils.fast_json import FastJSONResponse, ranked_payload, row_payload
+
+
+def make_coach(**overrides):
+    """ORM-like coach with every CoachResponse attribute plus extra columns"""
+    fields = {
+        "id": 7,
+        "location_id": 1,
+        "brand_id": 2,
+        "first_name": "Sam",
+        "last_name": "Lee",
+        "email": "sam@example.com",
+        "phone": None,
+        "city": "Austin",
+        "state": "TX",
+        "role_type": "personal_trainer",
+        "certifications": [{"name": "NASM-CPT", "issuer": "NASM"}],
+        "years_experience": 4,
+        "available_times": ["Mon AM"],
+        "lifestyle_tags": ["community"],
+        "movement_tags": ["strength"],
+        "instruction_tags": ["motivational"],
+        "profile_photo_url": None,
+        "verified_video_url": "https://example.com/v.mp4",
+        "bio": None,
+        "profile_completeness": Decimal("0.85"),
+        "status": "verified",
+        "created_at": datetime(2026, 1, 2, 3, 4, 5, 678901),
+        "updated_at": datetime(2026, 1, 3),
+        "last_updated": datetime(2026, 1, 3),
+        "internal_notes": "not part of the response",
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def make_score():
+    return SimpleNamespace(
+        fitscore=0.812,
+        cert_score=1.0,
+        experience_score=0.8,
+        availability_score=0.5,
+        location_score=1.0,
+        culture_score=0.66,
+        engagement_score=0.9,
+        role_match=True,
+    )
+
+
+class TestFastJSON:
+    """Test that the fast path encodes what the validated path would"""
+
+    def test_row_payload_copies_schema_fields_only(self):
+        """Only the response schema's fields should be copied"""
+        payload = row_payload(make_coach(), CoachResponse)
+
+        assert set(payload) == set(CoachResponse.model_fields)
+        assert "internal_notes" not in payload
+
+    def test_matches_validated_response(self):
+        """Fast and validated candidate lists should encode to the same JSON"""
+        entries = [{"coach": make_coach(), "score": make_score()}]
+        fast = FastJSONResponse(
+            {
+                "job_id": 3,
+                "candidates": ranked_payload(entries, "coach", CoachResponse, FitScoreBreakdown),
+                "total_candidates": 1,
+                "threshold": Decimal("0.60"),
+            }
+        )
+        validated = JobCandidatesResponse.model_validate(
+            {
+                "job_id": 3,
+                "candidates": [
+                    {
+                        "coach": make_coach(),
+                        "fitscore": 0.812,
+                        "score_breakdown": make_score().__dict__,
+                        "rank": 1,
+                    }
+                ],
+                "total_candidates": 1,
+                "threshold": 0.60,
+            },
+            from_attributes=True,
+        )
+
+        assert json.loads(fast.body) == json.loads(validated.model_dump_json())
+        assert fast.media_type == "application/json"
@@ -1,10 +1,27 @@
 """Unit tests for FitScore calculation engine"""
 
 from datetime import datetime, timedelta
+
 import pytest
 
-from app.core.fitscore.engine import FitScoreEngine, MatchScore
-from app.core.fitscore.presets import WEIGHTING_PRESETS, validate_preset, get_preset
+from app.core.fitscore.encoding import EncodedCoach, EncodedJob
+from app.core.fitscore.engine import (
+    COMPONENT_INPUTS,
+    FitScoreEngine,
+    MatchScore,
+    components_for_fields,
+)
+from app.core.fitscore.presets import (
+    COMPONENTS,
+    PRESET_NAMES,
+    PRESET_WEIGHT_MATRIX,
+    WEIGHTING_PRESETS,
+    build_weight_matrix,
+    get_preset,
+    get_preset_weights,
+    parse_custom_weights,
+    validate_preset,
+)
 
 
 class TestWeightingPresets:
@@ -382,3 +399,227 @@ class TestFullMatchScore:
         assert isinstance(score_dict, dict)
         assert score_dict["fitscore"] == 0.85
         assert score_dict["cert_score"] == 1.0
+
+
+class TestBatchScoring:
+    """Test batch scoring parity with calculate_match"""
+
+    def setup_method(self):
+        self.engine = FitScoreEngine()
+        self.job = {
+            "required_certifications": ["NASM-CPT"],
+            "preferred_certifications": ["ACE", "RYT-200"],
+            "min_experience": 3,
+            "required_availability": ["Mon AM", "Fri AM"],
+            "city": "New York",
+            "state": "NY",
+            "culture_tags": ["wellness", "community", "high-energy"],
+        }
+        self.coaches = [
+            {
+                "certifications": [{"name": "NASM-CPT"}, {"name": "ACE"}],
+                "years_experience": 7,
+                "available_times": ["Mon AM", "Fri AM", "Sat AM"],
+                "city": " new york ",
+                "state": "ny",
+                "lifestyle_tags": ["wellness"],
+                "movement_tags": ["community"],
+                "profile_completeness": 0.95,
+                "last_updated": datetime.now().isoformat(),
+                "verified_video_url": None,
+            },
+            {
+                "certifications": ["ACE"],
+                "years_experience": 1,
+                "available_times": ["Mon AM"],
+                "city": "Boston",
+                "state": "MA",
+            },
+            {
+                "certifications": [{"name": "NASM-CPT"}, {"name": "RYT-200"}],
+                "years_experience": 20,
+                "available_times": ["Mon AM", "Tue AM", "Wed AM", "Fri AM"],
+                "city": "New York",
+                "state": "NY",
+                "instruction_tags": ["high-energy", "motivational"],
+                "verified_video_url": "https://example.com/video.mp4",
+            },
+        ]
+
+    def test_score_batch_matches_scalar(self):
+        """score_batch should return exactly what calculate_match returns"""
+        for preset in WEIGHTING_PRESETS:
+            batch = self.engine.score_batch(self.coaches, self.job, preset=preset)
+            scalar = [
+                self.engine.calculate_match(coach, self.job, preset=preset)
+                for coach in self.coaches
+            ]
+            assert batch == scalar
+
+    def test_score_jobs_for_coach_matches_scalar(self):
+        """score_jobs_for_coach should apply each job's own preset"""
+        other_job = dict(self.job, city="Boston", state="MA", culture_tags=[])
+        jobs = [self.job, other_job]
+        presets = ["culture_heavy", "experience_heavy"]
+
+        for coach in self.coaches:
+            batch = self.engine.score_jobs_for_coach(coach, jobs, presets=presets)
+            scalar = [
+                self.engine.calculate_match(coach, job, preset=preset)
+                for job, preset in zip(jobs, presets, strict=True)
+            ]
+            assert batch == scalar
+
+    def test_score_jobs_for_coach_preset_length_mismatch(self):
+        """Presets must line up with jobs"""
+        with pytest.raises(ValueError):
+            self.engine.score_jobs_for_coach(self.coaches[0], [self.job], presets=[])
+
+
+class TestPartialRescoring:
+    """Test component dependencies and recombination of cached components"""
+
+    def setup_method(self):
+        self.engine = FitScoreEngine()
+        self.coach = {
+            "certifications": [{"name": "NASM-CPT"}],
+            "years_experience": 4,
+            "available_times": ["Mon AM", "Wed PM"],
+            "city": "Austin",
+            "state": "TX",
+            "lifestyle_tags": ["community"],
+            "movement_tags": ["strength"],
+            "instruction_tags": [],
+            "profile_completeness": 0.85,
+            "last_updated": datetime.now().isoformat(),
+            "verified_video_url": None,
+        }
+        self.job = {
+            "required_certifications": ["NASM-CPT"],
+            "preferred_certifications": ["ACE", "ACSM", "NSCA"],
+            "min_experience": 2,
+            "required_availability": ["Mon AM"],
+            "city": "Austin",
+            "state": "TX",
+            "culture_tags": ["community", "hiit", "yoga"],
+        }
+
+    def test_components_for_fields(self):
+        """Changed fields should map to the components that read them"""
+        assert components_for_fields(coach_fields=["available_times"]) == {"availability_score"}
+        assert components_for_fields(job_fields=["culture_tags"]) == {"culture_score"}
+        assert components_for_fields(job_fields=["title", "weighting_preset"]) == frozenset()
+        assert components_for_fields(coach_fields=["last_updated"]) == {"engagement_score"}
+
+    def test_every_component_has_inputs(self):
+        """The dependency map should cover every MatchScore component"""
+        fields = set(MatchScore.__dataclass_fields__) - {"fitscore"}
+        assert set(COMPONENT_INPUTS) == fields
+
+    def test_recombined_components_match_full_score(self):
+        """Recomputing only affected components should equal a full calculation"""
+        edits = [
+            {"culture_tags": ["community"]},
+            {"preferred_certifications": ["ACE"]},
+            {"min_experience": 5},
+            {"required_availability": ["Mon AM", "Wed PM", "Fri AM"]},
+        ]
+
+        for preset in WEIGHTING_PRESETS:
+            weights = get_preset_weights(preset)
+            coach = EncodedCoach.from_dict(self.coach)
+            edited = dict(self.job)
+            cached = self.engine.component_scores(coach, EncodedJob.from_dict(edited))
+
+            for edit in edits:
+                edited.update(edit)
+                affected = components_for_fields(job_fields=edit)
+                cached.update(self.engine.component_scores(
+                    coach, EncodedJob.from_dict(edited), affected
+                ))
+
+                recombined = self.engine.combine_components(weights, cached)
+                assert recombined == self.engine.calculate_match(self.coach, edited, preset=preset)
+
+    def test_preset_change_recombines_without_rescoring(self):
+        """A preset change should only need the cached components"""
+        cached = self.engine.component_scores(
+            EncodedCoach.from_dict(self.coach), EncodedJob.from_dict(self.job)
+        )
+
+        for preset in WEIGHTING_PRESETS:
+            recombined = self.engine.combine_components(get_preset_weights(preset), cached)
+            assert recombined == self.engine.calculate_match(self.coach, self.job, preset=preset)
+
+
+class TestWeightMatrix:
+    """Test scoring under every preset in one pass"""
+
+    def setup_method(self):
+        self.engine = FitScoreEngine()
+        self.job = {
+            "required_certifications": ["NASM-CPT"],
+            "preferred_certifications": ["ACE", "ACSM", "NSCA"],
+            "min_experience": 2,
+            "required_availability": ["Mon AM"],
+            "city": "Austin",
+            "state": "TX",
+            "culture_tags": ["community", "hiit", "yoga"],
+        }
+        self.coaches = [
+            {
+                "certifications": [{"name": "NASM-CPT"}, {"name": "ACE"}],
+                "years_experience": years,
+                "available_times": ["Mon AM", "Tue PM"][:slots],
+                "city": "Austin",
+                "state": "TX",
+                "lifestyle_tags": ["community", "yoga"][:tags],
+                "profile_completeness": 0.95,
+                "last_updated": datetime.now().isoformat(),
+            }
+            for years, slots, tags in [(1, 1, 0), (3, 2, 1), (8, 2, 2), (5, 0, 2)]
+        ]
+
+    def test_matrix_rows_follow_preset_names(self):
+        """Matrix rows should be the presets' weight vectors in name order"""
+        assert PRESET_NAMES == tuple(WEIGHTING_PRESETS)
+        assert PRESET_WEIGHT_MATRIX == tuple(get_preset_weights(name) for name in PRESET_NAMES)
+        assert build_weight_matrix(["culture_heavy"]) == (get_preset_weights("culture_heavy"),)
+
+    def test_score_matrix_matches_per_preset_scoring(self):
+        """One pass should equal scoring separately under each preset"""
+        encoded = [EncodedCoach.from_dict(coach) for coach in self.coaches]
+        results = self.engine.score_matrix(
+            encoded, self.engine.compile_job(self.job), PRESET_WEIGHT_MATRIX
+        )
+
+        assert len(results) == len(PRESET_NAMES)
+        for name, scores in zip(PRESET_NAMES, results, strict=True):
+            assert scores == self.engine.score_batch(self.coaches, self.job, preset=name)
+
+    def test_custom_weights_row(self):
+        """A custom weight vector should score like an equivalent preset"""
+        custom = parse_custom_weights(["0.25", "0.20", "0.15", "0.15", "0.15", "0.10"])
+        [scores] = self.engine.score_matrix(
+            [EncodedCoach.from_dict(coach) for coach in self.coaches],
+            self.engine.compile_job(self.job),
+            [custom],
+        )
+        assert scores == self.engine.score_batch(self.coaches, self.job, preset="balanced")
+
+    def test_parse_custom_weights_rejects_invalid(self):
+        """Custom weights must cover every component and sum to 1.0"""
+        with pytest.raises(ValueError):
+            parse_custom_weights([0.5, 0.5])
+        with pytest.raises(ValueError):
+            parse_custom_weights([0.5] * len(COMPONENTS))
+        with pytest.raises(ValueError):
+            parse_custom_weights([-0.1, 0.3, 0.2, 0.2, 0.2, 0.2])
+
+    @pytest.mark.parametrize("bad", ["nan", "inf", "-inf"])
+    def test_parse_custom_weights_rejects_non_finite(self, bad):
+        """NaN and infinite weights should be rejected, even when the rest sum to 1.0"""
+        with pytest.raises(ValueError, match="finite"):
+            parse_custom_weights([bad, 0.3, 0.2, 0.2, 0.2, 0.1])
+        with pytest.raises(ValueError, match="finite"):
+            parse_custom_weights([float(bad), 0.25, 0.20, 0.15, 0.15, 0.15])
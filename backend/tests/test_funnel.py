@@ -0,0 +1,45 @@
+"""Unit tests for match funnel bands and rates"""
+
+from decimal import Decimal
+
+from app.utils.funnel import UNSCORED_BAND, band_bounds, funnel_rates, score_band
+
+
+class TestScoreBand:
+    """Test FitScore banding"""
+
+    def test_bands_are_tenths(self):
+        """Scores should fall in the tenth they start in"""
+        assert score_band(0.0) == 0
+        assert score_band(0.099) == 0
+        assert score_band(0.6) == 6
+        assert score_band(Decimal("0.875")) == 8
+
+    def test_perfect_score_in_top_band(self):
+        """1.0 should join the top band instead of opening an eleventh"""
+        assert score_band(1.0) == 9
+        assert band_bounds(9) == (0.9, 1.0)
+
+    def test_missing_score_is_unscored(self):
+        """Events without a FitScore should go to the unscored band"""
+        assert score_band(None) == UNSCORED_BAND
+        assert band_bounds(UNSCORED_BAND) is None
+
+
+class TestFunnelRates:
+    """Test conversion rates"""
+
+    def test_rates_relative_to_views_and_applications(self):
+        """Rates should divide by views, and hires also by applications"""
+        rates = funnel_rates({"viewed": 200, "applied": 20, "interviewed": 8, "hired": 2})
+
+        assert rates == {
+            "apply_rate": 0.1,
+            "interview_rate": 0.04,
+            "hire_rate": 0.01,
+            "hire_per_application": 0.1,
+        }
+
+    def test_empty_funnel_has_no_rates(self):
+        """Rates over zero counts should be None rather than zero"""
+        assert set(funnel_rates({}).values()) == {None}
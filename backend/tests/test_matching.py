@@ -0,0 +1,444 @@
+"""Tests for the pre-calculated matches table (need PostgreSQL, see conftest)"""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update
+
+from app.core.fitscore.ranking import pruning_stats
+from app.models.coach import Coach
+from app.models.match import Match, PoolVersion
+from app.services.matching import (
+    COMPONENT_COLUMNS,
+    _ranked_candidates_select,
+    get_ranked_candidates,
+    get_ranked_candidates_batch,
+    get_ranked_matches,
+    live_ranked_candidates,
+    live_ranked_matches,
+    rebuild_all_matches,
+    reconcile_matches,
+    refresh_coach_matches,
+    refresh_engagement,
+    refresh_job_matches,
+    update_coach_matches,
+    update_job_matches,
+)
+from app.services.pool_versions import MATCH_POOL
+
+
+def _stored(db, **filters):
+    """Stored rows as {(coach_id, job_id): (fitscore, *components)}"""
+    query = select(Match).filter_by(**filters)
+    return {
+        (row.coach_id, row.job_id): (
+            row.fitscore,
+            *(getattr(row, name) for name in COMPONENT_COLUMNS),
+        )
+        for row in db.scalars(query)
+    }
+
+
+class TestRefreshMatches:
+    """Test which pairs get stored rows and how edits update them"""
+
+    def test_job_refresh_covers_verified_coaches_in_its_city(self, db, factory):
+        """Only verified coaches in the job's city should get rows"""
+        denver, boulder = factory.location("Denver"), factory.location("Boulder")
+        verified = factory.coach(denver)
+        factory.coach(denver, status="pending")
+        factory.coach(boulder)
+        job = factory.job(denver)
+
+        assert refresh_job_matches(db, job) == 1
+        db.commit()
+        assert set(_stored(db)) == {(verified.id, job.id)}
+
+    def test_coach_refresh_skips_unverified_coaches(self, db, factory):
+        """A pending coach should have no stored rows until verified"""
+        denver = factory.location()
+        coach = factory.coach(denver, status="pending")
+        job = factory.job(denver)
+
+        assert refresh_coach_matches(db, coach) == 0
+        coach.status = "verified"
+        assert refresh_coach_matches(db, coach) == 1
+        db.commit()
+        assert set(_stored(db)) == {(coach.id, job.id)}
+
+    def test_partial_update_matches_full_refresh(self, db, factory):
+        """Re-scoring only the edited components should store what a full refresh stores"""
+        denver = factory.location()
+        coach = factory.coach(denver)
+        jobs = [factory.job(denver, min_experience=years) for years in (1, 4, 8)]
+        refresh_coach_matches(db, coach)
+        db.commit()
+
+        coach.years_experience = 3
+        coach.available_times = ["Mon AM"]
+        coach.last_updated = datetime.utcnow()
+        update_coach_matches(db, coach, ["years_experience", "available_times", "last_updated"])
+        db.commit()
+        partial = _stored(db)
+
+        refresh_coach_matches(db, coach)
+        db.commit()
+        assert partial == _stored(db)
+        assert len(partial) == len(jobs)
+
+    def test_closing_a_job_removes_its_rows(self, db, factory):
+        """A status change should drop the job's rows"""
+        denver = factory.location()
+        factory.coach(denver)
+        job = factory.job(denver)
+        refresh_job_matches(db, job)
+        db.commit()
+
+        job.status = "closed"
+        update_job_matches(db, job, ["status"])
+        db.commit()
+        assert _stored(db, job_id=job.id) == {}
+
+
+class TestRankedReads:
+    """Test candidate and match lists read from the stored rows"""
+
+    def test_candidates_are_ranked_thresholded_and_role_filtered(self, db, factory):
+        """Candidates should be best first, above threshold, same role, at most limit"""
+        denver = factory.location()
+        job = factory.job(denver, fitscore_threshold=0.40)
+        coaches = [factory.coach(denver, years_experience=years) for years in (0, 2, 5, 10, 15)]
+        other_role = factory.coach(denver, role_type="Yoga Instructor", years_experience=15)
+        refresh_job_matches(db, job)
+        db.commit()
+
+        ranked = get_ranked_candidates(db, job, limit=3)
+
+        assert len(ranked) == 3
+        assert other_role.id not in [coach_id for coach_id, _ in ranked]
+        assert {coach_id for coach_id, _ in ranked} <= {coach.id for coach in coaches}
+        scores = [score.fitscore for _, score in ranked]
+        assert scores == sorted(scores, reverse=True)
+        assert min(scores) >= 0.40
+
+    def test_strict_prefilter_only_when_requested(self, db, factory):
+        """Only strict=True should drop coaches missing a requirement"""
+        denver = factory.location()
+        job = factory.job(denver, fitscore_threshold=0.40)
+        certified = factory.coach(denver)
+        uncertified = factory.coach(denver, certifications=[], years_experience=15)
+        refresh_job_matches(db, job)
+        db.commit()
+
+        default = get_ranked_candidates(db, job, limit=20)
+
+        assert default == get_ranked_candidates(db, job, limit=20, strict=False)
+        assert {coach_id for coach_id, _ in default} == {certified.id, uncertified.id}
+        strict = get_ranked_candidates(db, job, limit=20, strict=True)
+        assert [coach_id for coach_id, _ in strict] == [certified.id]
+
+    def test_default_read_stays_on_the_matches_table(self, db, factory):
+        """Non-strict reads should not join coaches (index-only top-k scan)"""
+        job = factory.job(factory.location())
+
+        default = str(_ranked_candidates_select(job, 20, None))
+        assert default == str(_ranked_candidates_select(job, 20, False))
+        assert "coaches" not in default
+        assert "JOIN coaches" in str(_ranked_candidates_select(job, 20, True))
+
+    def test_unverified_coach_matches_are_scored_live(self, db, factory):
+        """Pending coaches should get the list they will have once verified"""
+        denver = factory.location()
+        coach = factory.coach(denver, status="pending")
+        for threshold in (0.40, 0.60, 0.95):
+            factory.job(denver, fitscore_threshold=threshold)
+        factory.job(denver, status="draft")
+        considered = pruning_stats.considered
+
+        live = get_ranked_matches(db, coach, limit=20)
+
+        assert live == live_ranked_matches(db, coach, limit=20)
+        assert live
+        assert pruning_stats.considered - considered == 2 * 3
+
+        coach.status = "verified"
+        refresh_coach_matches(db, coach)
+        db.commit()
+        stored = get_ranked_matches(db, coach, limit=20)
+        assert [job_id for job_id, _ in stored] == [job_id for job_id, _ in live]
+        assert [score.fitscore for _, score in stored] == [score.fitscore for _, score in live]
+
+    def test_draft_job_candidates_are_scored_live(self, db, factory):
+        """Draft jobs should get the candidates they will have once open"""
+        denver = factory.location()
+        for years in (0, 3, 6, 9, 12):
+            factory.coach(denver, years_experience=years)
+        factory.coach(denver, role_type="Yoga Instructor", years_experience=12)
+        factory.coach(denver, status="pending", years_experience=12)
+        job = factory.job(denver, status="draft", fitscore_threshold=0.40)
+        assert refresh_job_matches(db, job) == 0
+        considered = pruning_stats.considered
+
+        live = get_ranked_candidates(db, job, limit=3)
+
+        assert live == live_ranked_candidates(db, job, limit=3)
+        assert len(live) == 3
+        assert pruning_stats.considered - considered == 2 * 5
+        assert get_ranked_candidates_batch(db, [job], limit=3) == {job.id: live}
+
+        job.status = "open"
+        refresh_job_matches(db, job)
+        db.commit()
+        stored = get_ranked_candidates(db, job, limit=3)
+        assert [coach_id for coach_id, _ in stored] == [coach_id for coach_id, _ in live]
+        assert [score.fitscore for _, score in stored] == [score.fitscore for _, score in live]
+
+
+class TestRankedCandidatesBatch:
+    """Test several jobs' candidate lists read in one query"""
+
+    def setup_jobs(self, factory, db):
+        denver, boulder = factory.location("Denver"), factory.location("Boulder")
+        for years in (0, 3, 6, 9, 12):
+            factory.coach(denver, years_experience=years)
+            factory.coach(boulder, years_experience=years)
+        factory.coach(denver, role_type="Yoga Instructor", years_experience=12)
+        jobs = [
+            factory.job(denver, min_experience=2),
+            factory.job(denver, min_experience=5, fitscore_threshold=0.60),
+            factory.job(boulder, weighting_preset="experience_heavy"),
+            factory.job(boulder, required_certifications=["RYT-200"], fitscore_threshold=0.80),
+        ]
+        for job in jobs:
+            refresh_job_matches(db, job)
+        db.commit()
+        return jobs
+
+    def test_matches_single_job_reads(self, db, factory):
+        """Each job's list should equal get_ranked_candidates for that job"""
+        jobs = self.setup_jobs(factory, db)
+
+        for limit, strict in ((20, None), (2, None), (3, True), (20, False)):
+            batch = get_ranked_candidates_batch(db, jobs, limit, strict)
+            assert batch == {job.id: get_ranked_candidates(db, job, limit, strict) for job in jobs}
+
+    def test_limit_order_and_no_cross_job_rows(self, db, factory):
+        """Lists should be best first, cut per job, and hold only their own city's coaches"""
+        jobs = self.setup_jobs(factory, db)
+        city_of = {coach.id: coach.city for coach in db.scalars(select(Coach))}
+
+        batch = get_ranked_candidates_batch(db, jobs, limit=3)
+
+        assert list(batch) == [job.id for job in jobs]
+        assert batch[jobs[3].id] == []
+        for job in jobs:
+            ranked = batch[job.id]
+            assert len(ranked) <= 3
+            assert {city_of[coach_id] for coach_id, _ in ranked} <= {job.city}
+            keys = [(-score.fitscore, coach_id) for coach_id, score in ranked]
+            assert keys == sorted(keys)
+        assert any(len(batch[job.id]) == 3 for job in jobs)
+
+    def test_no_jobs(self, db):
+        """An empty batch should not query"""
+        assert get_ranked_candidates_batch(db, [], limit=5) == {}
+
+
+class TestBatchCandidatesRoute:
+    """Test POST /jobs/candidates:batch"""
+
+    url = "/api/v1/jobs/candidates:batch"
+
+    def test_missing_and_duplicate_job_ids(self, client, factory):
+        """Unknown ids are reported, duplicates answered once, in request order"""
+        denver = factory.location()
+        first, second = factory.job(denver), factory.job(denver, fitscore_threshold=0.70)
+
+        response = client.post(
+            self.url, json={"job_ids": [second.id, 999, first.id, second.id, 998]}
+        )
+
+        assert response.status_code == 200
+        payload = response.json()
+        assert [result["job_id"] for result in payload["results"]] == [second.id, first.id]
+        assert payload["missing_job_ids"] == [999, 998]
+
+    def test_matches_single_job_endpoint(self, client, factory):
+        """Each result should equal the single-job endpoint's body"""
+        denver = factory.location()
+        jobs = [factory.job(denver), factory.job(denver, status="draft", fitscore_threshold=0.75)]
+
+        batch = client.post(self.url, json={"job_ids": [job.id for job in jobs], "limit": 5})
+
+        assert batch.status_code == 200
+        assert batch.json()["results"] == [
+            client.get(f"/api/v1/jobs/{job.id}/candidates", params={"limit": 5}).json()
+            for job in jobs
+        ]
+
+    def test_rejects_empty_and_oversized_batches(self, client):
+        """job_ids must hold 1 to 50 ids"""
+        assert client.post(self.url, json={"job_ids": []}).status_code == 422
+        assert client.post(self.url, json={"job_ids": list(range(1, 52))}).status_code == 422
+
+
+def _version(db, city="Denver", state="CO"):
+    """Current match pool version of a city"""
+    db.expire_all()
+    return db.scalar(
+        select(PoolVersion.version).filter_by(pool=MATCH_POOL, city=city, state=state)
+    )
+
+
+class TestRefreshVersions:
+    """Test that every refresh invalidates the lists it rewrites"""
+
+    def test_refresh_bumps_match_pool_outside_orm_writes(self, db, factory):
+        """A refresh with no pending profile change should still bump the version"""
+        denver = factory.location()
+        coach = factory.coach(denver)
+        job = factory.job(denver)
+
+        for refresh, target in ((refresh_coach_matches, coach), (refresh_job_matches, job)):
+            before = _version(db) or 0
+            refresh(db, target)
+            db.commit()
+            assert _version(db) > before
+
+    def test_refresh_without_rows_still_bumps(self, db, factory):
+        """Dropping a coach's rows (e.g. on unverify) should change the cache keys"""
+        denver = factory.location()
+        coach = factory.coach(denver, status="pending")
+        before = _version(db)
+
+        assert refresh_coach_matches(db, coach) == 0
+        db.commit()
+        assert _version(db) != before
+
+
+class TestRebuildMatches:
+    """Test that full rebuilds invalidate cached lists"""
+
+    def test_rebuild_bumps_match_pools(self, db, factory):
+        """Every rebuilt job's city should get a new match pool version"""
+        denver, boulder = factory.location("Denver"), factory.location("Boulder")
+        factory.coach(denver)
+        factory.job(denver)
+        factory.job(boulder, status="draft")
+        before = _version(db)
+
+        assert rebuild_all_matches(db) == 1
+
+        assert _version(db) != before
+        assert _version(db, "Boulder") is None
+
+    def test_rebuild_changes_candidate_etag(self, client, db, factory):
+        """A client revalidating after a rebuild should get the new list, not 304"""
+        job = factory.job(factory.location())
+        url = f"/api/v1/jobs/{job.id}/candidates"
+        etag = client.get(url).headers["etag"]
+        assert client.get(url, headers={"if-none-match": etag}).status_code == 304
+
+        rebuild_all_matches(db)
+
+        response = client.get(url, headers={"if-none-match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+
+class TestReconcileMatches:
+    """Test repair of rows after writes that bypassed the refresh hooks"""
+
+    def test_removes_rows_of_coaches_that_left_the_pool(self, db, factory):
+        """Unverifying or moving a coach outside the ORM should drop its rows"""
+        denver = factory.location()
+        unverified, moved, kept = (factory.coach(denver) for _ in range(3))
+        job = factory.job(denver)
+        refresh_job_matches(db, job)
+        db.commit()
+
+        db.execute(update(Coach).where(Coach.id == unverified.id).values(status="pending"))
+        db.execute(update(Coach).where(Coach.id == moved.id).values(city="Boulder"))
+        db.commit()
+
+        result = reconcile_matches(db)
+        assert result == {"rows_removed": 2, "jobs_refreshed": 0, "rows_written": 0}
+        assert set(_stored(db)) == {(kept.id, job.id)}
+
+    def test_removal_bumps_pools_of_both_cities(self, db, factory):
+        """Lists in the coach's new city and in the job's city should change version"""
+        denver = factory.location()
+        coach = factory.coach(denver)
+        refresh_job_matches(db, factory.job(denver))
+        db.commit()
+
+        db.execute(update(Coach).where(Coach.id == coach.id).values(city="Boulder"))
+        db.commit()
+        denver_before, boulder_before = _version(db), _version(db, "Boulder")
+
+        reconcile_matches(db)
+
+        assert _version(db) != denver_before
+        assert _version(db, "Boulder") != boulder_before
+
+    def test_scores_coaches_verified_outside_the_api(self, db, factory):
+        """Open jobs missing a verified coach's row should be re-scored"""
+        denver = factory.location()
+        coach = factory.coach(denver, status="pending")
+        job = factory.job(denver)
+        factory.job(denver, status="draft")
+
+        db.execute(update(Coach).where(Coach.id == coach.id).values(status="verified"))
+        db.commit()
+
+        result = reconcile_matches(db)
+        assert result == {"rows_removed": 0, "jobs_refreshed": 1, "rows_written": 1}
+        assert set(_stored(db)) == {(coach.id, job.id)}
+        assert reconcile_matches(db) == {"rows_removed": 0, "jobs_refreshed": 0, "rows_written": 0}
+
+
+class TestRefreshEngagement:
+    """Test re-aging of stored engagement scores as the recency bonus lapses"""
+
+    def test_lapsed_bonus_is_re_aged(self, db, factory):
+        """Rows scored while the coach was recent should match a fresh refresh"""
+        denver = factory.location()
+        coach = factory.coach(denver)
+        job = factory.job(denver)
+        refresh_job_matches(db, job)
+        db.commit()
+        stored = db.scalar(select(Match.engagement_score))
+
+        now = datetime.utcnow()
+        db.execute(
+            update(Coach).where(Coach.id == coach.id).values(last_updated=now - timedelta(days=40))
+        )
+        db.execute(update(Match).values(computed_at=now - timedelta(days=35)))
+        db.commit()
+        before = _version(db)
+
+        assert refresh_engagement(db) == 1
+        aged = _stored(db)
+        assert db.scalar(select(Match.engagement_score)) < stored
+        assert _version(db) != before
+
+        refresh_job_matches(db, job)
+        db.commit()
+        assert _stored(db) == aged
+
+    def test_recent_and_re_aged_rows_are_skipped(self, db, factory):
+        """Rows still within the bonus, or already re-aged, should not be rewritten"""
+        denver = factory.location()
+        coach = factory.coach(denver)
+        refresh_job_matches(db, factory.job(denver))
+        db.commit()
+        assert refresh_engagement(db) == 0
+
+        db.execute(
+            update(Coach)
+            .where(Coach.id == coach.id)
+            .values(last_updated=datetime.utcnow() - timedelta(days=40))
+        )
+        db.execute(update(Match).values(computed_at=datetime.utcnow() - timedelta(days=35)))
+        db.commit()
+        assert refresh_engagement(db) == 1
+        assert refresh_engagement(db) == 0
@@ -0,0 +1,41 @@
+"""Tests for the /metrics endpoint"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.utils.auth import get_current_user
+
+
+@pytest.fixture
+def as_role():
+    """Authenticate TestClient requests with the given role"""
+
+    def authenticate(role: str) -> TestClient:
+        app.dependency_overrides[get_current_user] = lambda: {"sub": "user_test", "role": role}
+        return TestClient(app)
+
+    yield authenticate
+    app.dependency_overrides.clear()
+
+
+class TestMetrics:
+    """Test access to the per-worker counters"""
+
+    def test_requires_credentials(self):
+        """Anonymous requests should be rejected"""
+        response = TestClient(app).get("/metrics")
+        assert response.status_code == 403
+
+    @pytest.mark.parametrize("role", ["coach", "location_manager"])
+    def test_rejects_non_admin_roles(self, as_role, role):
+        """Only regional directors and brand admins may read counters"""
+        assert as_role(role).get("/metrics").status_code == 403
+
+    @pytest.mark.parametrize("role", ["regional_director", "brand_admin"])
+    def test_admins_get_counters(self, as_role, role):
+        """Admins should get every counter group"""
+        response = as_role(role).get("/metrics")
+        assert response.status_code == 200
+        assert set(response.json()) == {"score_cache", "response_cache", "ranking", "events"}
+        assert "considered" in response.json()["ranking"]
@@ -0,0 +1,66 @@
+"""Unit tests for keyset pagination helpers"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import declarative_base
+
+from app.utils.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_order,
+    next_cursor,
+    seek_after,
+)
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime, nullable=False)
+
+
+class TestCursor:
+    """Test cursor tokens"""
+
+    def test_round_trip(self):
+        """A cursor should decode to the position it was built from"""
+        created_at = datetime(2026, 1, 2, 3, 4, 5, 678901)
+        token = encode_cursor(created_at, 42)
+
+        assert "=" not in token
+        assert decode_cursor(token) == (created_at, 42)
+
+    @pytest.mark.parametrize(
+        "token", ["", "not-a-cursor", encode_cursor(datetime(2026, 1, 1), 1)[:-3]]
+    )
+    def test_rejects_malformed(self, token):
+        """Garbage tokens should raise ValueError (HTTP 400 in the routes)"""
+        with pytest.raises(ValueError):
+            decode_cursor(token)
+
+    def test_next_cursor_points_at_last_row_of_page(self):
+        """The cursor should follow the last returned row, only if more exist"""
+        rows = [SimpleNamespace(id=i, created_at=datetime(2026, 1, 10 - i)) for i in range(4)]
+
+        assert next_cursor(rows, 4) is None
+        assert decode_cursor(next_cursor(rows, 3)) == (rows[2].created_at, 2)
+
+
+class TestSeek:
+    """Test the keyset predicate"""
+
+    def test_seeks_with_row_comparison(self):
+        """The next page should compare (created_at, id) as a row value"""
+        token = encode_cursor(datetime(2026, 1, 1), 7)
+        query = seek_after(select(Item), Item, token).order_by(*keyset_order(Item))
+        sql = str(query.compile(dialect=postgresql.dialect()))
+
+        assert "(items.created_at, items.id) < (" in sql
+        assert "ORDER BY items.created_at DESC, items.id DESC" in sql
@@ -0,0 +1,151 @@
+"""Unit tests for process-pool parallel FitScore sweeps"""
+
+import asyncio
+import random
+from datetime import datetime
+
+import pytest
+
+from app.core.fitscore.encoding import EncodedCoach
+from app.core.fitscore.engine import FitScoreEngine
+from app.core.fitscore.parallel import ParallelScorer, _chunk_bounds
+from app.core.fitscore.presets import WEIGHTING_PRESETS
+from app.core.fitscore.ranking import PruningStats
+from tests.test_ranking import _random_coach, _random_job
+
+AS_OF = datetime(2025, 6, 1)
+ROLES = ["trainer", "instructor"]
+
+
+class TestChunking:
+    """Test chunk boundaries"""
+
+    def test_chunks_cover_range_contiguously(self):
+        """Chunks should tile the range with sizes differing by at most one"""
+        bounds = _chunk_bounds(10, 4)
+        assert bounds == [(0, 3), (3, 6), (6, 8), (8, 10)]
+        assert _chunk_bounds(2, 8) == [(0, 1), (1, 2)]
+
+
+class TestParallelScorer:
+    """Parallel sweeps should return exactly what the serial engine returns"""
+
+    @classmethod
+    def setup_class(cls):
+        # One spawned pool for the whole class, as the API lifespan keeps one
+        cls.scorer = ParallelScorer(max_workers=3, min_parallel_pairs=0)
+        cls.scorer.start()
+
+    @classmethod
+    def teardown_class(cls):
+        cls.scorer.stop()
+
+    def setup_method(self):
+        rng = random.Random(3)
+        self.engine = FitScoreEngine()
+        self.coaches = [EncodedCoach.from_dict(_random_coach(rng)) for _ in range(60)]
+        self.jobs = [
+            self.engine.compile_job(_random_job(rng), preset=rng.choice(list(WEIGHTING_PRESETS)))
+            for _ in range(7)
+        ]
+        self.thresholds = [rng.choice([0.0, 0.5, 0.7]) for _ in self.jobs]
+        self.coach_roles = [rng.choice(ROLES) for _ in self.coaches]
+        self.job_roles = [rng.choice(ROLES) for _ in self.jobs]
+
+    def test_score_compiled(self):
+        """Scores should come back in coach order"""
+        assert self.scorer.score_compiled(self.coaches, self.jobs[0], AS_OF) == (
+            self.engine.score_compiled(self.coaches, self.jobs[0], AS_OF)
+        )
+
+    def test_rank_candidates_merges_deterministically(self):
+        """Merged chunk top-k lists should equal one serial top-k"""
+        stats = PruningStats()
+        for limit in (1, 5, 100):
+            assert self.scorer.rank_candidates(
+                self.coaches, self.jobs[0], 0.5, limit, stats, AS_OF
+            ) == self.engine.rank_candidates(self.coaches, self.jobs[0], 0.5, limit, as_of=AS_OF)
+        assert stats.considered == 3 * len(self.coaches)
+
+    def test_rank_jobs(self):
+        """Chunking the job set should not change a coach's ranking"""
+        assert self.scorer.rank_jobs(
+            self.coaches[0], self.jobs, self.thresholds, 3, as_of=AS_OF
+        ) == self.engine.rank_jobs(self.coaches[0], self.jobs, self.thresholds, 3, as_of=AS_OF)
+
+    def test_rank_grid(self):
+        """Per-job and per-coach lists should match a single serial sweep"""
+        args = (
+            self.coaches,
+            self.jobs,
+            self.thresholds,
+            4,
+            AS_OF,
+            self.coach_roles,
+            self.job_roles,
+        )
+        assert self.scorer.rank_grid(*args) == self.engine.rank_grid(*args)
+
+    def test_rank_grid_async(self):
+        """Awaiting the chunks through the event loop should merge the same lists"""
+        args = (
+            self.coaches,
+            self.jobs,
+            self.thresholds,
+            4,
+            AS_OF,
+            self.coach_roles,
+            self.job_roles,
+        )
+        assert asyncio.run(self.scorer.rank_grid_async(*args)) == self.engine.rank_grid(*args)
+
+    def test_small_sweeps_run_serially(self, monkeypatch):
+        """Below min_parallel_pairs the pool should not be used"""
+        scorer = ParallelScorer(max_workers=3, min_parallel_pairs=10_000)
+        scorer.pool = self.scorer.pool
+
+        def fail(*args):
+            raise AssertionError("pool used for a small sweep")
+
+        monkeypatch.setattr(scorer, "_map", fail)
+        monkeypatch.setattr(scorer, "_map_async", fail)
+        args = (self.coaches, self.jobs, self.thresholds, 4, AS_OF)
+        assert scorer.rank_grid(*args) == self.engine.rank_grid(*args)
+        assert asyncio.run(scorer.rank_grid_async(*args)) == self.engine.rank_grid(*args)
+
+    def test_threshold_length_mismatch(self):
+        """Thresholds must line up with jobs"""
+        with pytest.raises(ValueError):
+            self.scorer.rank_jobs(self.coaches[0], self.jobs, [], 3)
+
+
+class TestPoolLifecycle:
+    """Test when a worker pool exists"""
+
+    def test_serial_by_default(self):
+        """The default scorer should never create a pool"""
+        scorer = ParallelScorer(min_parallel_pairs=0)
+        scorer.start()
+        assert scorer.max_workers == 1
+        assert scorer.pool is None
+
+    def test_no_pool_before_start(self, monkeypatch):
+        """Sweeps on a scorer that was never started should run in-process"""
+        scorer = ParallelScorer(max_workers=3, min_parallel_pairs=0)
+        monkeypatch.setattr(scorer, "_map", lambda *args: pytest.fail("pool used before start"))
+        rng = random.Random(5)
+        coaches = [EncodedCoach.from_dict(_random_coach(rng)) for _ in range(10)]
+        job = FitScoreEngine().compile_job(_random_job(rng))
+        assert scorer.score_compiled(coaches, job, AS_OF) == (
+            FitScoreEngine().score_compiled(coaches, job, AS_OF)
+        )
+
+    def test_start_is_idempotent_and_stop_releases_pool(self):
+        """start() should keep one pool until stop()"""
+        scorer = ParallelScorer(max_workers=2)
+        scorer.start()
+        pool = scorer.pool
+        scorer.start()
+        assert scorer.pool is pool
+        scorer.stop()
+        assert scorer.pool is None
@@ -0,0 +1,110 @@
+"""Tests for monthly event partitions (DB tests need PostgreSQL, see conftest)"""
+
+from datetime import date, datetime
+
+from sqlalchemy import func, insert, select, text
+
+from app.db.partitions import (
+    add_months,
+    create_default_partition_sql,
+    create_partition_sql,
+    expired_partitions,
+    maintain_partitions,
+    months_between,
+    parse_partition_month,
+    partition_name,
+)
+from app.models.audit import MatchEvent
+
+
+class TestPartitionNames:
+    """Test partition naming and month arithmetic"""
+
+    def test_add_months_crosses_years(self):
+        """Month shifts should roll over year boundaries both ways"""
+        assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    def test_name_round_trip(self):
+        """Partition names should parse back to their month"""
+        name = partition_name("match_events", date(2026, 3, 1))
+
+        assert name == "match_events_y2026m03"
+        assert parse_partition_month("match_events", name) == date(2026, 3, 1)
+        assert parse_partition_month("audit_logs", name) is None
+        assert parse_partition_month("match_events", "match_events_archive") is None
+
+    def test_months_between_is_inclusive(self):
+        """Every month from first through last should be covered"""
+        assert months_between(date(2026, 11, 15), date(2027, 1, 2)) == [
+            date(2026, 11, 1),
+            date(2026, 12, 1),
+            date(2027, 1, 1),
+        ]
+
+    def test_create_partition_sql_bounds(self):
+        """A partition should cover exactly its month"""
+        sql = create_partition_sql("audit_logs", date(2026, 12, 1))
+
+        assert '"audit_logs_y2026m12" PARTITION OF "audit_logs"' in sql
+        assert "FROM ('2026-12-01') TO ('2027-01-01')" in sql
+
+    def test_default_partition_is_not_a_month(self):
+        """The DEFAULT partition should never be picked for retention"""
+        sql = create_default_partition_sql("audit_logs")
+
+        assert '"audit_logs_default" PARTITION OF "audit_logs" DEFAULT' in sql
+        assert parse_partition_month("audit_logs", "audit_logs_default") is None
+
+
+class TestRetention:
+    """Test selection of expired partitions"""
+
+    PARTITIONS = [
+        "match_events_y2025m12",
+        "match_events_y2026m01",
+        "match_events_y2026m02",
+        "match_events_y2026m03",
+        "match_events_detached_copy",
+    ]
+
+    def test_keeps_retention_window(self):
+        """Only months entirely before the window should expire, oldest first"""
+        expired = expired_partitions("match_events", self.PARTITIONS, date(2026, 3, 20), 1)
+
+        assert expired == [
+            ("match_events_y2025m12", date(2025, 12, 1)),
+            ("match_events_y2026m01", date(2026, 1, 1)),
+        ]
+
+    def test_zero_retention_keeps_everything(self):
+        """A retention of 0 months should never retire partitions"""
+        assert expired_partitions("match_events", self.PARTITIONS, date(2030, 1, 1), 0) == []
+
+
+class TestDefaultPartition:
+    """Test that out-of-range events are kept, then moved to their month"""
+
+    def test_maintenance_moves_default_rows(self, db, factory):
+        """An event beyond every monthly partition should be stored and later re-homed"""
+        denver = factory.location()
+        coach, job = factory.coach(denver), factory.job(denver)
+        event = {
+            "coach_id": coach.id,
+            "job_id": job.id,
+            "brand_id": denver.brand_id,
+            "event": "viewed",
+        }
+        db.execute(insert(MatchEvent).values(timestamp=datetime(2031, 5, 2), **event))
+        db.commit()
+        assert db.scalar(text("SELECT count(*) FROM match_events_default")) == 1
+
+        report = maintain_partitions(db.connection(), months_ahead=1)
+        db.commit()
+
+        assert "match_events_y2031m05" in report.created
+        assert report.moved == 1
+        assert db.scalar(text("SELECT count(*) FROM match_events_default")) == 0
+        assert db.scalar(text("SELECT count(*) FROM match_events_y2031m05")) == 1
+        assert db.scalar(select(func.count()).select_from(MatchEvent)) == 1
+        assert maintain_partitions(db.connection(), months_ahead=1).moved == 0
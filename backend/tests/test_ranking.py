@@ -0,0 +1,187 @@
+"""Unit tests for top-k FitScore ranking with upper-bound pruning"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.fitscore.encoding import EncodedCoach
+from app.core.fitscore.engine import FitScoreEngine, MatchScore
+from app.core.fitscore.presets import WEIGHTING_PRESETS
+from app.core.fitscore.ranking import PruningStats, TopKSelector
+
+CERTS = ["NASM-CPT", "ACE", "RYT-200", "AFAA"]
+SLOTS = ["Mon AM", "Tue AM", "Wed PM", "Fri AM", "Sat AM"]
+TAGS = ["wellness", "community", "high-energy", "motivational"]
+
+
+def _random_coach(rng: random.Random) -> dict:
+    return {
+        "certifications": [{"name": c} for c in rng.sample(CERTS, rng.randint(0, 3))],
+        "years_experience": rng.randint(0, 12),
+        "available_times": rng.sample(SLOTS, rng.randint(0, 5)),
+        "city": "Denver",
+        "state": "CO",
+        "lifestyle_tags": rng.sample(TAGS, rng.randint(0, 3)),
+        "profile_completeness": rng.choice([0.5, 0.9, 1.0]),
+        "last_updated": (datetime.now() - timedelta(days=rng.choice([1, 90]))).isoformat(),
+        "verified_video_url": rng.choice([None, "https://example.com/v.mp4"]),
+    }
+
+
+def _random_job(rng: random.Random) -> dict:
+    return {
+        "required_certifications": rng.sample(CERTS, rng.randint(0, 1)),
+        "preferred_certifications": rng.sample(CERTS, rng.randint(0, 2)),
+        "min_experience": rng.randint(0, 5),
+        "required_availability": rng.sample(SLOTS, rng.randint(0, 2)),
+        "city": "Denver",
+        "state": rng.choice(["CO", "CO", "UT"]),
+        "culture_tags": rng.sample(TAGS, rng.randint(0, 2)),
+    }
+
+
+def _reference(scores, thresholds, limit):
+    """Score-everything / stable sort / slice, as the routes used to do"""
+    kept = [(i, s) for i, s in enumerate(scores) if s.fitscore >= thresholds[i]]
+    kept.sort(key=lambda item: item[1].fitscore, reverse=True)
+    return kept[:limit]
+
+
+class TestTopKSelector:
+    """Test the bounded heap selector"""
+
+    def _score(self, fitscore):
+        return MatchScore(fitscore, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+    def test_keeps_best_k_in_order(self):
+        """Selector should return the k best, best first"""
+        selector = TopKSelector(2)
+        for position, fitscore in enumerate([0.5, 0.9, 0.7, 0.8]):
+            selector.push(position, self._score(fitscore))
+        assert [p for p, _ in selector.results()] == [1, 3]
+
+    def test_ties_keep_earliest(self):
+        """Equal scores should be broken by input position"""
+        selector = TopKSelector(2)
+        for position in range(4):
+            selector.push(position, self._score(0.75))
+        assert [p for p, _ in selector.results()] == [0, 1]
+        assert not selector.can_admit(0.75)
+        assert selector.can_admit(0.751)
+
+    def test_zero_limit(self):
+        """A zero limit should select nothing"""
+        selector = TopKSelector(0)
+        selector.push(0, self._score(1.0))
+        assert selector.results() == []
+
+
+class TestRanking:
+    """Test rank_candidates / rank_jobs against the sort-based reference"""
+
+    def setup_method(self):
+        self.engine = FitScoreEngine()
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_rank_candidates_matches_reference(self, seed):
+        """Pruned top-k should equal sort-and-slice, including tie order"""
+        rng = random.Random(seed)
+        coaches = [_random_coach(rng) for _ in range(300)]
+        encoded = [EncodedCoach.from_dict(c) for c in coaches]
+
+        for preset in WEIGHTING_PRESETS:
+            job = _random_job(rng)
+            compiled = self.engine.compile_job(job, preset=preset)
+            for threshold, limit in [(0.4, 20), (0.6, 5), (0.8, 1)]:
+                scores = self.engine.score_batch(coaches, job, preset=preset)
+                expected = _reference(scores, [threshold] * len(scores), limit)
+                actual = self.engine.rank_candidates(encoded, compiled, threshold, limit)
+                assert actual == expected
+
+    def test_rank_jobs_matches_reference(self):
+        """Per-job thresholds and presets should rank like the reference"""
+        rng = random.Random(42)
+        jobs = [_random_job(rng) for _ in range(200)]
+        presets = [rng.choice(list(WEIGHTING_PRESETS)) for _ in jobs]
+        thresholds = [rng.choice([0.4, 0.6, 0.8]) for _ in jobs]
+        compiled = [self.engine.compile_job(j, p) for j, p in zip(jobs, presets, strict=True)]
+
+        for _ in range(10):
+            coach = _random_coach(rng)
+            scores = self.engine.score_jobs_for_coach(coach, jobs, presets=presets)
+            expected = _reference(scores, thresholds, 20)
+            actual = self.engine.rank_jobs(EncodedCoach.from_dict(coach), compiled, thresholds, 20)
+            assert actual == expected
+
+    def test_pruning_counters(self):
+        """Coaches failing a required cert should be pruned by the threshold bound"""
+        job = {
+            "required_certifications": ["NASM-CPT"],
+            "min_experience": 0,
+            "required_availability": [],
+            "city": "Denver",
+            "state": "CO",
+        }
+        qualified = {"certifications": ["NASM-CPT"], "city": "Denver", "state": "CO"}
+        unqualified = {"certifications": ["ACE"], "city": "Denver", "state": "CO"}
+        coaches = [EncodedCoach.from_dict(c) for c in [qualified, unqualified, unqualified]]
+
+        stats = PruningStats()
+        ranked = self.engine.rank_candidates(
+            coaches, self.engine.compile_job(job), threshold=0.7, limit=20, stats=stats
+        )
+
+        assert [index for index, _ in ranked] == [0]
+        assert stats.considered == 3
+        assert stats.pruned_threshold == 2
+        assert stats.scored == 1
+
+        totals = PruningStats()
+        totals.merge(stats)
+        totals.merge(stats)
+        assert totals.to_dict()["pruned"] == 4
+
+    def test_rank_jobs_threshold_length_mismatch(self):
+        """Thresholds must line up with jobs"""
+        with pytest.raises(ValueError):
+            self.engine.rank_jobs(EncodedCoach.from_dict({}), [], [0.6], 20)
+
+
+class TestGridSweep:
+    """Test blocked coach x job scoring"""
+
+    def test_grid_matches_per_job_scoring(self):
+        """Every yielded score should equal scoring that job on its own"""
+        rng = random.Random(7)
+        engine = FitScoreEngine()
+        coaches = [EncodedCoach.from_dict(_random_coach(rng)) for _ in range(23)]
+        jobs = [
+            engine.compile_job(_random_job(rng), preset=rng.choice(list(WEIGHTING_PRESETS)))
+            for _ in range(4)
+        ]
+        as_of = datetime(2025, 6, 1)
+
+        grid = {
+            (coach_index, job_index): score
+            for coach_index, job_index, score in engine.iter_grid(
+                coaches, jobs, as_of=as_of, block_size=5
+            )
+        }
+
+        assert len(grid) == len(coaches) * len(jobs)
+        for job_index, job in enumerate(jobs):
+            expected = engine.score_compiled(coaches, job, as_of=as_of)
+            assert [grid[(i, job_index)] for i in range(len(coaches))] == expected
+
+    def test_grid_yields_coaches_in_order_per_job(self):
+        """Coach indexes should increase per job (required by TopKSelector)"""
+        rng = random.Random(11)
+        engine = FitScoreEngine()
+        coaches = [EncodedCoach.from_dict(_random_coach(rng)) for _ in range(10)]
+        jobs = [engine.compile_job(_random_job(rng)) for _ in range(3)]
+
+        seen = {}
+        for coach_index, job_index, _ in engine.iter_grid(coaches, jobs, block_size=3):
+            assert coach_index > seen.get(job_index, -1)
+            seen[job_index] = coach_index
@@ -0,0 +1,101 @@
+"""Unit tests for the versioned response cache"""
+
+import asyncio
+import threading
+
+from app.core.fitscore.cache import LocalScoreCache
+from app.utils.response_cache import CachedResponse, ResponseCache
+
+
+class FakeRedis:
+    """Minimal get/set(ex=) client"""
+
+    def __init__(self, fail=False):
+        self.data = {}
+        self.fail = fail
+        self.threads = set()
+
+    def get(self, key):
+        self.threads.add(threading.get_ident())
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.threads.add(threading.get_ident())
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.data[key] = value
+
+
+class TestCachedResponse:
+    """Test cached response encoding"""
+
+    def test_bytes_round_trip(self):
+        """Body bytes and views should survive the Redis encoding"""
+        cached = CachedResponse(b'{"job_id":1,\n"candidates":[]}', ((7, 0.812), (9, 0.7)))
+
+        assert CachedResponse.from_bytes(cached.to_bytes()) == cached
+
+    def test_response_carries_body_and_etag(self):
+        """Served entries should be JSON with the request's ETag"""
+        response = CachedResponse(b'{"a":1}').to_response('W/"v1"')
+
+        assert response.body == b'{"a":1}'
+        assert response.media_type == "application/json"
+        assert response.headers["etag"] == 'W/"v1"'
+
+
+class TestResponseCache:
+    """Test the two-tier lookup"""
+
+    def test_local_hit_and_miss(self):
+        """Entries should be served by key and counted"""
+        cache = ResponseCache(LocalScoreCache(maxsize=10, ttl=60))
+        cache.set('W/"a"', CachedResponse(b"{}"))
+
+        assert cache.get('W/"a"') == CachedResponse(b"{}")
+        assert cache.get('W/"b"') is None
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_disabled_cache_never_stores(self):
+        """maxsize 0 should disable caching entirely"""
+        cache = ResponseCache(LocalScoreCache(maxsize=0, ttl=60))
+        cache.set('W/"a"', CachedResponse(b"{}"))
+
+        assert cache.get('W/"a"') is None
+        assert len(cache.local) == 0
+
+    def test_remote_tier_shared_between_workers(self):
+        """A worker should reuse another worker's entry via Redis"""
+        redis = FakeRedis()
+        writer = ResponseCache(LocalScoreCache(maxsize=10, ttl=60), redis)
+        reader = ResponseCache(LocalScoreCache(maxsize=10, ttl=60), redis)
+        writer.set('W/"a"', CachedResponse(b"[1]", ((1, 0.9),)))
+
+        assert reader.get('W/"a"') == CachedResponse(b"[1]", ((1, 0.9),))
+        assert reader.stats.remote_hits == 1
+        assert len(reader.local) == 1
+
+    def test_remote_failures_degrade_to_misses(self):
+        """Redis errors should be counted, never raised"""
+        cache = ResponseCache(LocalScoreCache(maxsize=10, ttl=60), FakeRedis(fail=True))
+        cache.set('W/"a"', CachedResponse(b"{}"))
+        cache.local.clear()
+
+        assert cache.get('W/"a"') is None
+        assert cache.stats.remote_errors == 2
+
+    def test_async_access_keeps_redis_off_the_event_loop(self):
+        """aget/aset should share entries like get/set but call Redis from the threadpool"""
+        redis = FakeRedis()
+        writer = ResponseCache(LocalScoreCache(maxsize=10, ttl=60), redis)
+        reader = ResponseCache(LocalScoreCache(maxsize=10, ttl=60), redis)
+
+        async def exchange():
+            await writer.aset('W/"a"', CachedResponse(b"[1]"))
+            return await reader.aget('W/"a"'), await reader.aget('W/"b"')
+
+        assert asyncio.run(exchange()) == (CachedResponse(b"[1]"), None)
+        assert (reader.stats.hits, reader.stats.remote_hits, reader.stats.misses) == (1, 1, 1)
+        assert redis.threads and threading.get_ident() not in redis.threads
@@ -0,0 +1,225 @@
+"""Unit tests for the versioned FitScore result cache"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.core.fitscore.cache import (
+    CachedScore,
+    CacheStats,
+    LocalScoreCache,
+    RedisScoreCache,
+    ScoreCache,
+    score_key,
+)
+from app.core.fitscore.engine import MatchScore
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.Redis (get/set with ex=, mget, pipeline)"""
+
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+        self.fail = False
+        self.round_trips = 0
+
+    def get(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.data[key] = value.encode()
+        self.expiry[key] = ex
+
+    def mget(self, keys):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.round_trips += 1
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues set calls and applies them on execute"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def set(self, key, value, ex=None):
+        self.calls.append((key, value, ex))
+
+    def execute(self):
+        if self.redis.fail:
+            raise ConnectionError("redis down")
+        self.redis.round_trips += 1
+        for key, value, ex in self.calls:
+            self.redis.data[key] = value.encode()
+            self.redis.expiry[key] = ex
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_value(fitscore: float = 0.812) -> CachedScore:
+    components = {
+        "cert_score": 0.7999999999999999,
+        "experience_score": 0.85,
+        "availability_score": 1.0,
+        "location_score": 1.0,
+        "culture_score": 1 / 3,
+        "engagement_score": 0.9,
+    }
+    score = MatchScore(fitscore=fitscore, **{k: round(v, 3) for k, v in components.items()})
+    return CachedScore(score, components)
+
+
+KEY = (1, datetime(2025, 1, 1), 2, datetime(2025, 1, 2), "balanced")
+
+
+class TestScoreKey:
+    """Test cache key construction"""
+
+    def test_key_changes_with_versions_and_preset(self):
+        """Editing a profile or switching preset should produce a new key"""
+        coach = SimpleNamespace(id=1, last_updated=datetime(2025, 1, 1))
+        job = SimpleNamespace(id=2, updated_at=datetime(2025, 1, 2), weighting_preset="balanced")
+
+        key = score_key(coach, job)
+        assert key == KEY
+        assert score_key(coach, job, "culture_heavy") != key
+
+        coach.last_updated = datetime(2025, 1, 3)
+        assert score_key(coach, job) != key
+
+
+class TestLocalScoreCache:
+    """Test the in-process tier"""
+
+    def test_evicts_least_recently_used(self):
+        """Entries beyond maxsize should be evicted oldest-first and counted"""
+        cache = LocalScoreCache(maxsize=2)
+        cache.set(("a",), make_value())
+        cache.set(("b",), make_value())
+        cache.get(("a",))
+        cache.set(("c",), make_value())
+
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) is not None
+        assert cache.stats.evictions == 1
+
+    def test_expires_after_ttl(self):
+        """Entries should disappear once their TTL has passed"""
+        clock = FakeClock()
+        cache = LocalScoreCache(ttl=10, clock=clock)
+        cache.set(KEY, make_value())
+
+        clock.now = 9.9
+        assert cache.get(KEY) is not None
+        clock.now = 10.0
+        assert cache.get(KEY) is None
+        assert cache.stats.expirations == 1
+        assert len(cache) == 0
+
+
+class TestScoreCache:
+    """Test the tiered cache"""
+
+    def test_get_or_compute_counts_hits_and_misses(self):
+        """A second lookup should be served without recomputing"""
+        cache = ScoreCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return make_value()
+
+        first = cache.get_or_compute(KEY, compute)
+        second = cache.get_or_compute(KEY, compute)
+
+        assert first == second
+        assert len(calls) == 1
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_remote_tier_shared_between_workers(self):
+        """A score cached by one worker should be a remote hit for another"""
+        redis = FakeRedis()
+        worker_a = ScoreCache(remote=RedisScoreCache(redis, ttl=60))
+        worker_b = ScoreCache(remote=RedisScoreCache(redis, ttl=60))
+
+        worker_a.set(KEY, make_value())
+        assert set(redis.expiry.values()) == {60}
+
+        value = worker_b.get(KEY)
+        assert value == make_value()
+        assert worker_b.stats.remote_hits == 1
+        assert len(worker_b.local) == 1
+
+    def test_remote_round_trip_is_exact(self):
+        """Unrounded components should survive serialization bit-for-bit"""
+        value = make_value()
+        assert CachedScore.from_json(value.to_json()) == value
+
+    def test_remote_errors_degrade_to_miss(self):
+        """A Redis outage should count errors and fall back to computing"""
+        redis = FakeRedis()
+        redis.fail = True
+        cache = ScoreCache(remote=RedisScoreCache(redis))
+
+        value = cache.get_or_compute(KEY, make_value)
+
+        assert value == make_value()
+        assert cache.stats.remote_errors == 2
+        assert cache.stats.misses == 1
+        assert cache.get(KEY) == value
+
+    def test_batch_uses_one_round_trip_per_direction(self):
+        """A batch should read with one MGET and write misses with one pipeline"""
+        redis = FakeRedis()
+        worker_a = ScoreCache(remote=RedisScoreCache(redis, ttl=60))
+        keys = [(coach_id, *KEY[1:]) for coach_id in range(5)]
+        worker_a.set(keys[0], make_value(0.5))
+        calls = []
+
+        def compute(index):
+            calls.append(index)
+            return make_value()
+
+        worker_b = ScoreCache(remote=RedisScoreCache(redis, ttl=60))
+        values = worker_b.get_or_compute_many(keys, compute)
+
+        assert values == [make_value(0.5)] + [make_value()] * 4
+        assert calls == [1, 2, 3, 4]
+        assert redis.round_trips == 2
+        assert (worker_b.stats.hits, worker_b.stats.remote_hits, worker_b.stats.misses) == (1, 1, 4)
+        assert worker_a.get_many(keys) == dict(zip(keys, values, strict=True))
+
+    def test_batch_remote_errors_degrade_to_misses(self):
+        """A Redis outage during a batch should compute every value once"""
+        redis = FakeRedis()
+        redis.fail = True
+        cache = ScoreCache(remote=RedisScoreCache(redis))
+        keys = [(coach_id, *KEY[1:]) for coach_id in range(3)]
+
+        values = cache.get_or_compute_many(keys, lambda index: make_value())
+
+        assert values == [make_value()] * 3
+        assert cache.stats.remote_errors == 2
+        assert cache.get_many(keys) == dict(zip(keys, values, strict=True))
+
+    def test_stats_to_dict(self):
+        """Counters should be exportable for metrics"""
+        stats = CacheStats(hits=3, misses=1)
+        assert stats.to_dict()["hit_rate"] == 0.75
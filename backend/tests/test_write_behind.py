@@ -0,0 +1,95 @@
+"""Unit tests for the write-behind event buffer"""
+
+import asyncio
+
+from app.db.write_behind import WriteBehindBuffer
+
+
+class Recorder:
+    """Batch writer that remembers what it was given"""
+
+    def __init__(self, fail_models=()):
+        self.batches = []
+        self.fail_models = set(fail_models)
+
+    async def __call__(self, model, rows):
+        if model in self.fail_models:
+            raise RuntimeError("insert failed")
+        self.batches.append((model, list(rows)))
+
+
+class TestWriteBehindBuffer:
+    """Test batching, bounds and draining"""
+
+    def test_flush_groups_by_model_in_bounded_batches(self):
+        """Rows should be written per model, at most max_batch rows per flush"""
+        writer = Recorder()
+        buffer = WriteBehindBuffer(writer, max_batch=3)
+        for i in range(4):
+            buffer.enqueue("events", {"i": i})
+        buffer.enqueue("audit", {"i": 9})
+
+        written = asyncio.run(buffer.flush())
+
+        assert written == 5
+        assert len(buffer) == 0
+        assert writer.batches == [
+            ("events", [{"i": 0}, {"i": 1}, {"i": 2}]),
+            ("events", [{"i": 3}]),
+            ("audit", [{"i": 9}]),
+        ]
+
+    def test_full_buffer_drops_rows(self):
+        """Rows beyond max_pending should be refused and counted"""
+        buffer = WriteBehindBuffer(Recorder(), max_pending=2)
+
+        assert buffer.enqueue_many("events", [{}, {}, {}]) == 2
+        assert buffer.stats.dropped == 1
+        assert len(buffer) == 2
+
+    def test_failed_batch_is_counted_and_others_still_written(self):
+        """A failing write should lose only its own batch"""
+        writer = Recorder(fail_models={"audit"})
+        buffer = WriteBehindBuffer(writer)
+        buffer.enqueue("audit", {})
+        buffer.enqueue("events", {})
+
+        assert asyncio.run(buffer.flush()) == 1
+        assert buffer.stats.failed == 1
+        assert buffer.stats.written == 1
+        assert writer.batches == [("events", [{}])]
+
+    def test_background_task_flushes_on_size_and_drains_on_stop(self):
+        """Reaching max_batch should wake the writer; stop should drain the rest"""
+        writer = Recorder()
+        buffer = WriteBehindBuffer(writer, max_batch=2, flush_interval=60)
+
+        async def scenario():
+            await buffer.start()
+            buffer.enqueue_many("events", [{"i": 0}, {"i": 1}])
+            for _ in range(10):
+                await asyncio.sleep(0)
+            flushed_on_size = len(writer.batches)
+            buffer.enqueue("events", {"i": 2})
+            await buffer.stop(timeout=5)
+            return flushed_on_size
+
+        assert asyncio.run(scenario()) == 1
+        assert writer.batches[-1] == ("events", [{"i": 2}])
+        assert not buffer.running
+        assert len(buffer) == 0
+
+    def test_background_task_flushes_on_interval(self):
+        """Rows below max_batch should still be written after flush_interval"""
+        writer = Recorder()
+        buffer = WriteBehindBuffer(writer, max_batch=100, flush_interval=0.01)
+
+        async def scenario():
+            await buffer.start()
+            buffer.enqueue("events", {})
+            await asyncio.sleep(0.1)
+            written = buffer.stats.written
+            await buffer.stop()
+            return written
+
+        assert asyncio.run(scenario()) == 1